@@ -0,0 +1,102 @@
+"""
+Memory benchmark for the Vehicle hierarchy.
+
+It reports the number of bytes allocated per vehicle when building a list of Car and Bike objects, for the
+current slotted layout and for the previous __dict__-based layout, so that a regression of the per-object
+overhead is visible.
+
+Usage:
+    python -m benchmarks.memory [--count 1000000] [--max-bytes 100]
+
+The attribute values are shared between all instances, so only the object layout itself is measured
+(plus the 8 bytes of the list slot referencing each vehicle).
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+
+
+class _DictCar:
+    """The layout of Car before the move to __slots__: every attribute lives in the instance __dict__."""
+
+    def __init__(self, year, tank_size, consumption, technical_inspection):
+        self.year = year
+        self.tank_size = tank_size
+        self.consumption = consumption
+        self.technical_inspection = technical_inspection
+
+
+class _DictBike:
+    """The layout of Bike before the move to __slots__: every attribute lives in the instance __dict__."""
+
+    def __init__(self, year, consumption, saddle_comfort):
+        self.year = year
+        self.tank_size = 0
+        self.consumption = consumption
+        self.saddle_comfort = saddle_comfort
+
+
+LAYOUTS = {
+    'before': {'Car': lambda: _DictCar(2005, 50, 5, True), 'Bike': lambda: _DictBike(2005, 1, True)},
+    'after': {'Car': lambda: Car(2005, 50, 5, True), 'Bike': lambda: Bike(2005, 1, True)},
+}
+
+
+def bytes_per_vehicle(factory, count: int) -> float:
+    """
+    Measures the memory allocated per vehicle while building a list of vehicles.
+    :param factory: a callable returning a new vehicle
+    :param count: the number of vehicles to build
+    :return: the number of bytes allocated per vehicle
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        vehicles = [factory() for _ in range(count)]
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del vehicles
+    return (end - start) / count
+
+
+def run(count: int) -> dict:
+    """
+    Runs the benchmark for every layout and vehicle type.
+    :param count: the number of vehicles built per measurement
+    :return: a mapping layout -> vehicle type -> bytes per vehicle
+    """
+    return {
+        layout: {name: bytes_per_vehicle(factory, count) for name, factory in factories.items()}
+        for layout, factories in LAYOUTS.items()
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1_000_000, help='number of vehicles per measurement')
+    parser.add_argument('--max-bytes', type=float, default=None,
+                        help='fail when a slotted vehicle takes more bytes than this budget')
+    args = parser.parse_args(argv)
+
+    results = run(args.count)
+    print(f"{'vehicle':<8}{'before':>12}{'after':>12}{'saved':>10}")
+    for name in results['after']:
+        before, after = results['before'][name], results['after'][name]
+        print(f"{name:<8}{before:>12.1f}{after:>12.1f}{1 - after / before:>10.0%}")
+
+    if args.max_bytes is not None:
+        over_budget = {name: size for name, size in results['after'].items() if size > args.max_bytes}
+        if over_budget:
+            print(f"Memory budget of {args.max_bytes} bytes per vehicle exceeded: {over_budget}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Scaling benchmark for the process-pool fleet evaluation.
+
+It evaluates the same random fleet with 1, 2, 4, ... workers (up to the number of CPUs) and reports the
+wall time and the speedup over a single worker.
+
+Usage:
+    python -m benchmarks.parallel_scaling [--count 10000000] [--k 10] [--max-workers N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.parallel import evaluate_fleet
+
+
+def random_fleet(count: int, seed: int = 0) -> VehicleFleet:
+    rng = np.random.default_rng(seed)
+    return VehicleFleet(rng.integers(0, 2, count), rng.integers(1950, 2030, count), rng.integers(0, 100, count),
+                        rng.integers(1, 20, count), rng.random(count) < 0.8, rng.random(count) < 0.5)
+
+
+def worker_counts(max_workers: int) -> list:
+    counts = []
+    workers = 1
+    while workers <= max_workers:
+        counts.append(workers)
+        workers *= 2
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=10_000_000, help='number of vehicles in the fleet')
+    parser.add_argument('--k', type=int, default=10, help='number of best vehicles to select')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1, help='largest pool size')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs, the fastest one is reported')
+    args = parser.parse_args(argv)
+
+    fleet = random_fleet(args.count)
+    print(f"{'workers':>8}{'seconds':>12}{'speedup':>10}")
+    baseline = None
+    for workers in worker_counts(args.max_workers):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            evaluate_fleet(fleet, k=args.k, workers=workers)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        baseline = baseline or best
+        print(f"{workers:>8}{best:>12.3f}{baseline / best:>10.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Read/write throughput of the copy-on-write fleet registry.
+
+Reader threads repeatedly take a snapshot and read its best vehicle and one vehicle pair while a writer thread
+keeps updating the pair in single transactions. Readers check that every snapshot is consistent: the two
+vehicles of the pair always have the same consumption, and versions never go backwards.
+
+Usage:
+    python -m benchmarks.registry_throughput [--count 100000] [--readers 4] [--seconds 2]
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+
+from technical_test_fortis.car import Car
+from technical_test_fortis.registry import FleetRegistry
+
+
+def run(count: int = 100_000, readers: int = 4, seconds: float = 2.0, seed: int = 0) -> dict:
+    """
+    :return: the numbers of reads, writes and inconsistent snapshots seen, and the read and write rates
+    """
+    rng = random.Random(seed)
+    registry = FleetRegistry(Car(rng.randint(1950, 2030), rng.randint(0, 100), rng.randint(1, 20), True)
+                             for _ in range(count))
+    first, second = registry.snapshot().ids[:2]
+    with registry.transaction() as transaction:
+        transaction.update(first, consumption=1)
+        transaction.update(second, consumption=1)
+
+    stop = threading.Event()
+    reads = [0] * readers
+    inconsistencies = [0] * readers
+    writes = 0
+
+    def read(index: int) -> None:
+        version = -1
+        while not stop.is_set():
+            snapshot = registry.snapshot()
+            snapshot.best()
+            if (snapshot.get(first).consumption != snapshot.get(second).consumption
+                    or snapshot.version < version):
+                inconsistencies[index] += 1
+            version = snapshot.version
+            reads[index] += 1
+
+    def write() -> None:
+        nonlocal writes
+        while not stop.is_set():
+            consumption = rng.randint(1, 20)
+            with registry.transaction() as transaction:
+                transaction.update(first, consumption=consumption)
+                transaction.update(second, consumption=consumption)
+            writes += 1
+
+    threads = [threading.Thread(target=read, args=(index,)) for index in range(readers)]
+    threads.append(threading.Thread(target=write))
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'reads': sum(reads),
+        'writes': writes,
+        'inconsistencies': sum(inconsistencies),
+        'reads_per_second': sum(reads) / elapsed,
+        'writes_per_second': writes / elapsed,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100_000, help='number of vehicles in the registry')
+    parser.add_argument('--readers', type=int, default=4, help='number of reader threads')
+    parser.add_argument('--seconds', type=float, default=2.0, help='duration of the run')
+    args = parser.parse_args(argv)
+
+    results = run(args.count, args.readers, args.seconds)
+    print(f"reads: {results['reads']} ({results['reads_per_second']:.0f}/s)")
+    print(f"writes: {results['writes']} ({results['writes_per_second']:.0f}/s)")
+    print(f"inconsistent snapshots: {results['inconsistencies']}")
+    return 1 if results['inconsistencies'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Performance benchmark suite with regression thresholds.
+
+Every benchmarked path is timed at each scale (number of vehicles); the fastest of --repeat runs is kept.
+Results can be saved as a JSON baseline and later runs compared against it: the run fails when a path is slower
+than its baseline by more than --threshold percent.
+
+Usage:
+    python -m benchmarks.suite [--scales 1000 100000 1000000] [--repeat 3] [--only PATTERN]
+                               [--save baseline.json] [--compare baseline.json --threshold 25]
+
+It only relies on the standard library and on the package's own dependencies.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from functools import reduce
+
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.vehicle import find_best_vehicle, find_best_vehicles
+
+DEFAULT_SCALES = (1_000, 100_000, 1_000_000)
+
+
+def random_specs(count: int, seed: int = 0) -> list:
+    """
+    :return: count (kind, year, tank_size, consumption, flag) tuples, the same ones for a given seed
+    """
+    rng = random.Random(seed)
+    return [(rng.random() < 0.7, rng.randint(1950, 2030), rng.randint(0, 100), rng.randint(1, 20),
+             rng.random() < 0.8) for _ in range(count)]
+
+
+def build_vehicles(specs) -> list:
+    return [Car(year, tank_size, consumption, flag) if is_car else Bike(year, consumption, flag)
+            for is_car, year, tank_size, consumption, flag in specs]
+
+
+def _construct_cars(specs):
+    cars = [(year, tank_size, consumption, flag) for _, year, tank_size, consumption, flag in specs]
+    return lambda: [Car(*spec) for spec in cars]
+
+
+def _construct_bikes(specs):
+    bikes = [(year, consumption, flag) for _, year, _, consumption, flag in specs]
+    return lambda: [Bike(*spec) for spec in bikes]
+
+
+def _bulk_cars(specs):
+    columns = [list(column) for column in zip(*specs)] or [[]] * 5
+    _, years, tank_sizes, consumptions, flags = columns
+    return lambda: Car.bulk(years, tank_sizes, consumptions, flags)
+
+
+def _compute_maximal_distance(specs):
+    vehicles = build_vehicles(specs)
+    return lambda: [vehicle.compute_maximal_distance() for vehicle in vehicles]
+
+
+def _read_attributes(specs):
+    vehicles = build_vehicles(specs)
+    return lambda: [(vehicle.year, vehicle.tank_size, vehicle.consumption) for vehicle in vehicles]
+
+
+def _find_best_vehicle(specs):
+    vehicles = build_vehicles(specs)
+    return lambda: reduce(find_best_vehicle, vehicles)
+
+
+def _find_best_vehicles(specs):
+    vehicles = build_vehicles(specs)
+    return lambda: find_best_vehicles(vehicles, k=10)
+
+
+def _fleet_from_vehicles(specs):
+    from technical_test_fortis.fleet import VehicleFleet
+    vehicles = build_vehicles(specs)
+    return lambda: VehicleFleet.from_vehicles(vehicles)
+
+
+def _fleet_compute_maximal_distances(specs):
+    from technical_test_fortis.fleet import VehicleFleet
+    fleet = VehicleFleet.from_vehicles(build_vehicles(specs))
+    return fleet.compute_maximal_distances
+
+
+def _fleet_find_best_indices(specs):
+    from technical_test_fortis.fleet import VehicleFleet
+    fleet = VehicleFleet.from_vehicles(build_vehicles(specs))
+    return lambda: fleet.find_best_indices(10)
+
+
+def _lookup_distances(specs):
+    from technical_test_fortis.fleet import VehicleFleet
+    from technical_test_fortis.lookup import DistanceTable
+    fleet = VehicleFleet.from_vehicles(build_vehicles(specs))
+    table = DistanceTable(tank_sizes=range(0, 101), consumptions=range(1, 21))
+    return lambda: table.distances(fleet)
+
+
+# Each benchmark receives the vehicle specs and returns the callable to time, the setup being excluded.
+BENCHMARKS = {
+    'car.construct': _construct_cars,
+    'bike.construct': _construct_bikes,
+    'car.bulk': _bulk_cars,
+    'vehicle.compute_maximal_distance': _compute_maximal_distance,
+    'vehicle.read_attributes': _read_attributes,
+    'vehicle.find_best_vehicle': _find_best_vehicle,
+    'vehicle.find_best_vehicles': _find_best_vehicles,
+    'fleet.from_vehicles': _fleet_from_vehicles,
+    'fleet.compute_maximal_distances': _fleet_compute_maximal_distances,
+    'fleet.find_best_indices': _fleet_find_best_indices,
+    'lookup.distances': _lookup_distances,
+}
+
+
+def time_callable(function, repeat: int) -> float:
+    """
+    :return: the fastest of repeat runs of function, in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_suite(scales=DEFAULT_SCALES, repeat: int = 3, only: str = None) -> dict:
+    """
+    Runs the benchmarks.
+    :param scales: the numbers of vehicles to benchmark with
+    :param repeat: the number of runs per benchmark, the fastest one is kept
+    :param only: when given, only the benchmarks whose name contains it are run
+    :return: a mapping 'name@scale' -> seconds
+    """
+    results = {}
+    for scale in scales:
+        specs = random_specs(scale)
+        for name, benchmark in BENCHMARKS.items():
+            if only and only not in name:
+                continue
+            results[f'{name}@{scale}'] = time_callable(benchmark(specs), repeat)
+    return results
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> dict:
+    """
+    Compares results with a baseline. Paths missing from either side are ignored.
+    :param results: the timings of the current run, 'name@scale' -> seconds
+    :param baseline: the reference timings, 'name@scale' -> seconds
+    :param threshold: the tolerated slowdown, in percent
+    :return: a mapping 'name@scale' -> slowdown in percent, for the paths slower than tolerated
+    """
+    regressions = {}
+    for key, seconds in results.items():
+        reference = baseline.get(key)
+        if not reference:
+            continue
+        slowdown = (seconds / reference - 1) * 100
+        if slowdown > threshold:
+            regressions[key] = slowdown
+    return regressions
+
+
+def save_baseline(path, results: dict) -> None:
+    document = {'python': platform.python_version(), 'machine': platform.machine(), 'results': results}
+    with open(path, 'w') as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+
+
+def load_baseline(path) -> dict:
+    with open(path) as file:
+        return json.load(file)['results']
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES),
+                        help='numbers of vehicles to benchmark with')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per benchmark, the fastest one is kept')
+    parser.add_argument('--only', help='only run the benchmarks whose name contains this string')
+    parser.add_argument('--save', metavar='PATH', help='write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare the results with a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=25.0,
+                        help='tolerated slowdown against the baseline, in percent')
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.scales, args.repeat, args.only)
+    baseline = load_baseline(args.compare) if args.compare else {}
+
+    print(f"{'benchmark':<48}{'seconds':>12}{'baseline':>12}{'change':>10}")
+    for key, seconds in results.items():
+        reference = baseline.get(key)
+        change = f"{(seconds / reference - 1):+.0%}" if reference else ''
+        reference = f"{reference:.6f}" if reference else ''
+        print(f"{key:<48}{seconds:>12.6f}{reference:>12}{change:>10}")
+
+    if args.save:
+        save_baseline(args.save, results)
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        for key, slowdown in regressions.items():
+            print(f"Regression: {key} is {slowdown:.0f}% slower than the baseline "
+                  f"(threshold {args.threshold:.0f}%)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Command-line fleet ranking.
+
+Usage:
+    python -m technical_test_fortis best [FILE]
+    python -m technical_test_fortis top [-k 10] [FILE]
+    python -m technical_test_fortis histogram [--bin-width 10] [FILE]
+
+FILE is a CSV, JSON-lines or binary (.bin) fleet file; without it, or with '-', the vehicles are read from stdin
+(JSON lines unless --format csv is given). Invalid records are reported on stderr and skipped.
+
+Text input is streamed through the object model, which only needs the standard library. NumPy is only imported
+for binary files or with --columnar, which evaluates the vehicles in VehicleFleet chunks: startup stays fast for
+the small inputs of shell pipelines and cron jobs, while large files get the vectorized path.
+"""
+import argparse
+import sys
+from collections import Counter
+
+from technical_test_fortis.ingest import iter_fleet_chunks, read_csv, read_jsonl, read_vehicles
+from technical_test_fortis.vehicle import find_best_vehicles
+
+COMMANDS = ('best', 'top', 'histogram')
+
+
+def _is_binary(path) -> bool:
+    return path != '-' and str(path).lower().endswith('.bin')
+
+
+def _read_text(path, file_format):
+    if path == '-':
+        return read_csv(sys.stdin) if file_format == 'csv' else read_jsonl(sys.stdin)
+    if file_format == 'csv':
+        return read_csv(path)
+    if file_format == 'jsonl':
+        return read_jsonl(path)
+    return read_vehicles(path)
+
+
+def _fleet_chunks(path, file_format, chunk_size: int):
+    """
+    :return: a generator of (offset, fleet) pairs, offset being the position of the fleet's first vehicle
+    """
+    if _is_binary(path):
+        from technical_test_fortis.binary import open_fleet
+        fleet = open_fleet(path)
+        if len(fleet):
+            yield 0, fleet
+        return
+    offset = 0
+    for fleet in iter_fleet_chunks(_read_text(path, file_format), chunk_size):
+        yield offset, fleet
+        offset += len(fleet)
+
+
+def rank_objects(vehicles, k: int) -> list:
+    """
+    :return: the (distance, vehicle) pairs of the k best vehicles, best first
+    """
+    return [(vehicle.compute_maximal_distance(), vehicle) for vehicle in find_best_vehicles(vehicles, k)]
+
+
+def rank_columnar(chunks, k: int) -> list:
+    """
+    Columnar counterpart of rank_objects(), only the k best vehicles of each chunk are rebuilt as objects.
+    :param chunks: (offset, VehicleFleet) pairs in fleet order
+    """
+    candidates = []
+    for offset, fleet in chunks:
+        distances = fleet.compute_maximal_distances()
+        for index in fleet.find_best_indices(k, distances).tolist():
+            candidates.append((int(distances[index]), offset + index, fleet.vehicle(index)))
+    # On equal distance the later position wins, as with find_best_vehicle.
+    candidates.sort(key=lambda candidate: candidate[:2], reverse=True)
+    return [(distance, vehicle) for distance, _, vehicle in candidates[:k]]
+
+
+def histogram_objects(vehicles, bin_width: int) -> Counter:
+    """
+    :return: a Counter mapping the first distance of each bin to the number of vehicles in the bin
+    """
+    return Counter(vehicle.compute_maximal_distance() // bin_width * bin_width for vehicle in vehicles)
+
+
+def histogram_columnar(chunks, bin_width: int) -> Counter:
+    import numpy as np
+
+    counts = Counter()
+    for _, fleet in chunks:
+        # Only the non-empty bins are counted: np.bincount would allocate up to the largest distance.
+        bins, bin_counts = np.unique(fleet.compute_maximal_distances() // bin_width, return_counts=True)
+        for index, count in zip(bins.tolist(), bin_counts.tolist()):
+            counts[index * bin_width] += count
+    return counts
+
+
+def format_histogram(counts: Counter, bin_width: int, bar_width: int = 50) -> list:
+    """
+    :return: one line per non-empty bin, with its range, count and a proportional bar, from 0 to the highest
+        bin; each run of empty bins in between is shown as one line with a count of 0, so that the output size
+        only depends on the number of non-empty bins
+    """
+    if not counts:
+        return []
+    largest = max(counts.values())
+    lines = []
+    start = 0  # first distance not covered by the lines so far
+    for low in sorted(counts):
+        if low > start:
+            lines.append(f"{start:>8}-{low - 1:<8} {0:>10} ")
+        count = counts[low]
+        bar = '#' * (count * bar_width // largest)
+        lines.append(f"{low:>8}-{low + bin_width - 1:<8} {count:>10} {bar}")
+        start = low + bin_width
+    return lines
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return value
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m technical_test_fortis', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=COMMANDS)
+    parser.add_argument('file', nargs='?', default='-', help="fleet file, '-' or nothing for stdin")
+    parser.add_argument('-k', type=_positive_int, default=10, help='number of vehicles printed by top')
+    parser.add_argument('--bin-width', type=_positive_int, default=10, help='distance range of a histogram bin')
+    parser.add_argument('--format', choices=('csv', 'jsonl'), help='text format, inferred from the file name')
+    parser.add_argument('--columnar', action='store_true', help='evaluate the vehicles with NumPy, in chunks')
+    parser.add_argument('--chunk-size', type=_positive_int, default=65536, help='vehicles per columnar chunk')
+    # Intermixed parsing accepts the file after the options, e.g. 'histogram --bin-width 50 fleet.csv'.
+    args = parser.parse_intermixed_args(argv)
+
+    if _is_binary(args.file):
+        args.columnar = True
+
+    try:
+        if args.command == 'histogram':
+            if args.columnar:
+                counts = histogram_columnar(_fleet_chunks(args.file, args.format, args.chunk_size), args.bin_width)
+            else:
+                counts = histogram_objects(_read_text(args.file, args.format), args.bin_width)
+            lines = format_histogram(counts, args.bin_width)
+        else:
+            k = 1 if args.command == 'best' else args.k
+            if args.columnar:
+                ranking = rank_columnar(_fleet_chunks(args.file, args.format, args.chunk_size), k)
+            else:
+                ranking = rank_objects(_read_text(args.file, args.format), k)
+            lines = [f"{distance}\t{vehicle}" for distance, vehicle in ranking]
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    if not lines:
+        print("error: the fleet is empty", file=sys.stderr)
+        return 1
+    print('\n'.join(lines))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
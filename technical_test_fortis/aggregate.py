@@ -0,0 +1,201 @@
+"""
+Mergeable partial aggregates for map-reduce over sharded fleet files.
+
+Each shard is summarized independently into a FleetSummary, and summaries are combined with merge(), which is
+associative and commutative: the merged summary (and its JSON serialization) does not depend on the order in
+which the shards were processed.
+
+Vehicles are identified by (shard, position), where shard is the identifier given to the shard (its path for
+files) and position is the vehicle's index inside it. To keep find_best_vehicle's rule that the later vehicle
+wins on equal distance, shards are ordered by identifier, then vehicles by position.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+from technical_test_fortis.fleet import CAR, VehicleFleet, top_k_positions
+from technical_test_fortis.ingest import iter_fleet_chunks, read_vehicles, record_from_vehicle
+from technical_test_fortis.vehicle import validate_positive_int
+
+
+class FleetSummary:
+    """
+
+    A partial aggregate of the maximal distances of a set of vehicles.
+
+    Attributes:
+        - k (int): The number of best vehicles kept in top.
+        - count (int): The number of vehicles.
+        - total (int): The sum of their maximal distances.
+        - minimum (int | None): The smallest maximal distance, None without vehicles.
+        - maximum (int | None): The largest maximal distance, None without vehicles.
+        - type_counts (dict): The number of vehicles per type, with the keys 'car' and 'bike'.
+        - rejected (int): The number of records that could not be turned into vehicles.
+        - top (list): The k best vehicles, best first, as (distance, shard, position, record) tuples.
+
+    Methods:
+        - from_fleet(fleet: VehicleFleet, shard: str, k: int, offset: int) -> FleetSummary:
+            Summarizes a columnar fleet in one vectorized pass.
+
+        - merge(other: FleetSummary) -> FleetSummary:
+            Combines two summaries.
+
+        - to_json() -> str:
+            Serializes the summary canonically, equal summaries giving identical strings.
+
+    """
+
+    def __init__(self, k: int = 1) -> None:
+        validate_positive_int('k', k)
+        self.k = k
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.type_counts = {'car': 0, 'bike': 0}
+        self.rejected = 0
+        self.top = []
+
+    @property
+    def best(self):
+        """
+        The (distance, shard, position, record) entry of the best vehicle, None without vehicles.
+        """
+        return self.top[0] if self.top else None
+
+    @classmethod
+    def from_fleet(cls, fleet: VehicleFleet, shard: str = '', k: int = 1, offset: int = 0) -> 'FleetSummary':
+        """
+        Summarizes a columnar fleet.
+        :param fleet: the vehicles to summarize
+        :param shard: the identifier of the shard the vehicles come from
+        :param k: the number of best vehicles to keep
+        :param offset: the position of the fleet's first vehicle in the shard
+        :return: the summary of the fleet
+        """
+        summary = cls(k)
+        distances = fleet.compute_maximal_distances()
+        summary.count = len(fleet)
+        if summary.count:
+            summary.total = int(distances.sum())
+            summary.minimum = int(distances.min())
+            summary.maximum = int(distances.max())
+            cars = int((fleet.kind == CAR).sum())
+            summary.type_counts = {'car': cars, 'bike': summary.count - cars}
+            summary.top = [(int(distances[position]), shard, offset + int(position),
+                            record_from_vehicle(fleet.vehicle(position)))
+                           for position in top_k_positions(distances, k)]
+        return summary
+
+    def merge(self, other: 'FleetSummary') -> 'FleetSummary':
+        """
+        Combines two summaries into a new one. When their k differ, the smaller one is kept, as the larger
+        top-k cannot be rebuilt from the other summary.
+        :param other: the summary to combine with this one
+        :return: the summary of the union of both sets of vehicles
+        """
+        merged = FleetSummary(min(self.k, other.k))
+        merged.count = self.count + other.count
+        merged.total = self.total + other.total
+        merged.minimum = _combine(min, self.minimum, other.minimum)
+        merged.maximum = _combine(max, self.maximum, other.maximum)
+        merged.type_counts = {kind: self.type_counts[kind] + other.type_counts[kind] for kind in self.type_counts}
+        merged.rejected = self.rejected + other.rejected
+        merged.top = sorted(self.top + other.top, key=_rank, reverse=True)[:merged.k]
+        return merged
+
+    def to_dict(self) -> dict:
+        return {
+            'k': self.k,
+            'count': self.count,
+            'total': self.total,
+            'minimum': self.minimum,
+            'maximum': self.maximum,
+            'type_counts': dict(self.type_counts),
+            'rejected': self.rejected,
+            'top': [{'distance': distance, 'shard': shard, 'position': position, 'vehicle': record}
+                    for distance, shard, position, record in self.top],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'FleetSummary':
+        summary = cls(data['k'])
+        summary.count = data['count']
+        summary.total = data['total']
+        summary.minimum = data['minimum']
+        summary.maximum = data['maximum']
+        summary.type_counts = dict(data['type_counts'])
+        summary.rejected = data['rejected']
+        summary.top = [(entry['distance'], entry['shard'], entry['position'], entry['vehicle'])
+                       for entry in data['top']]
+        return summary
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), sort_keys=True, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text: str) -> 'FleetSummary':
+        return cls.from_dict(json.loads(text))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FleetSummary):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+
+def _rank(entry):
+    distance, shard, position, _ = entry
+    return distance, shard, position
+
+
+def _combine(function, first, second):
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return function(first, second)
+
+
+def summarize_shard(path, k: int = 1, chunk_size: int = 65536) -> FleetSummary:
+    """
+    Summarizes one shard file: a binary fleet file ('.bin'), or a CSV or JSON-lines export read in chunks.
+    :param path: the path of the shard, also used as its identifier
+    :param k: the number of best vehicles to keep
+    :param chunk_size: the number of vehicles evaluated at a time for text files
+    :return: the summary of the shard
+    """
+    shard = os.fspath(path)
+    if shard.endswith('.bin'):
+        # Imported here so that text shards do not need the binary module.
+        from technical_test_fortis.binary import open_fleet
+        return FleetSummary.from_fleet(open_fleet(path), shard, k)
+
+    # Rejected rows are only counted, so that memory does not grow with the number of bad rows.
+    rejected = 0
+
+    def count_rejected(_error) -> None:
+        nonlocal rejected
+        rejected += 1
+
+    summary = FleetSummary(k)
+    for chunk in iter_fleet_chunks(read_vehicles(path, on_error=count_rejected), chunk_size):
+        summary = summary.merge(FleetSummary.from_fleet(chunk, shard, k, offset=summary.count))
+    summary.rejected = rejected
+    return summary
+
+
+def summarize_shards(paths, k: int = 1, executor=None) -> FleetSummary:
+    """
+    Summarizes shard files in parallel and merges their summaries.
+    :param paths: the paths of the shard files
+    :param k: the number of best vehicles to keep
+    :param executor: a concurrent.futures executor, a ProcessPoolExecutor is created when omitted
+    :return: the summary of all the shards
+    """
+    if executor is None:
+        with ProcessPoolExecutor() as executor:
+            return summarize_shards(paths, k, executor)
+
+    futures = [executor.submit(summarize_shard, path, k) for path in paths]
+    return reduce(FleetSummary.merge, (future.result() for future in futures), FleetSummary(k))
@@ -0,0 +1,100 @@
+"""
+Assignment of trips to vehicles: each trip gets a distinct vehicle whose maximal distance covers it, the smallest
+sufficient one.
+
+Vehicles are sorted by maximal distance and trips are swept from the shortest to the longest. Each trip takes the
+smallest vehicle covering it that no shorter trip took, so the assignment serves as many trips as any assignment
+can. As trips only get longer, the vehicles taken always form a contiguous run of the sorted vehicles: the
+vehicle of a trip is the first one covering it, or the one after the previous trip's vehicle, whichever comes
+later. The whole assignment is O((n + m) log n) for n vehicles and m trips, dominated by the sorts.
+
+Between vehicles of equal distance the later one is preferred, as find_best_vehicle does; between trips of equal
+length the earlier one is served first.
+"""
+from bisect import bisect_left
+from collections import namedtuple
+
+from technical_test_fortis.vehicle import Vehicle
+
+# vehicles: the vehicle assigned to each trip, in trip order, None for the unassignable trips
+# unassigned: the indices of the trips no vehicle could cover
+TripAssignment = namedtuple('TripAssignment', ['vehicles', 'unassigned'])
+
+
+def _check_trips(trips) -> list:
+    trips = trips.tolist() if hasattr(trips, 'tolist') else list(trips)
+    for trip in trips:
+        if isinstance(trip, bool) or not isinstance(trip, (int, float)):
+            raise TypeError("Trip distances must be numbers.")
+        if not trip >= 0:
+            raise ValueError("Trip distances must be non-negative.")
+    return trips
+
+
+def _sweep(sorted_distances: list, trips: list) -> list:
+    """
+    :param sorted_distances: the vehicles' distances, ascending
+    :param trips: the trip distances
+    :return: the index in sorted_distances of the vehicle of each trip, None when the trip is unassignable
+    """
+    assigned = [None] * len(trips)
+    taken = -1  # index of the vehicle of the previous (shorter or equal) trip
+    for trip in sorted(range(len(trips)), key=trips.__getitem__):
+        taken = max(bisect_left(sorted_distances, trips[trip]), taken + 1)
+        if taken >= len(sorted_distances):
+            break  # the longer trips cannot be served either
+        assigned[trip] = taken
+    return assigned
+
+
+def assign_trips(vehicles, trips, vehicle_type: type = None) -> TripAssignment:
+    """
+    Assigns each trip a distinct vehicle able to cover it, preferring the smallest sufficient vehicle.
+    :param vehicles: an iterable of vehicles
+    :param trips: the trip distances, ints or floats
+    :param vehicle_type: when given (e.g. Car or Bike), only vehicles of this type are assigned
+    :return: a TripAssignment
+    """
+    if vehicle_type is not None and not (isinstance(vehicle_type, type) and issubclass(vehicle_type, Vehicle)):
+        raise TypeError("vehicle_type must be a Vehicle subclass.")
+    trips = _check_trips(trips)
+    candidates = [vehicle for vehicle in vehicles if vehicle_type is None or isinstance(vehicle, vehicle_type)]
+    # Ascending distance, the later vehicle first on equal distance.
+    ranked = sorted(((vehicle.compute_maximal_distance(), -position, vehicle)
+                     for position, vehicle in enumerate(candidates)), key=lambda entry: entry[:2])
+    assigned = _sweep([distance for distance, _, _ in ranked], trips)
+    return TripAssignment([None if index is None else ranked[index][2] for index in assigned],
+                          [trip for trip, index in enumerate(assigned) if index is None])
+
+
+def assign_fleet_trips(fleet, trips, kind: int = None, distances=None):
+    """
+    Columnar counterpart of assign_trips(), the sweep being a cumulative maximum.
+    :param fleet: a VehicleFleet
+    :param trips: the trip distances
+    :param kind: when given (CAR or BIKE of technical_test_fortis.fleet), only vehicles with this type tag are
+        assigned
+    :param distances: precomputed result of fleet.compute_maximal_distances(), computed when omitted
+    :return: an int64 array with the position in the fleet of the vehicle of each trip, -1 for the unassignable
+        trips
+    """
+    import numpy as np
+
+    trips = np.asarray(_check_trips(trips))
+    distances = fleet.compute_maximal_distances() if distances is None else np.asarray(distances)
+    positions = np.arange(len(fleet)) if kind is None else np.flatnonzero(fleet.kind == kind)
+    # Ascending distance, the later vehicle first on equal distance.
+    order = np.lexsort((-positions, distances[positions]))
+    positions = positions[order]
+    sorted_distances = distances[positions]
+
+    trip_order = np.argsort(trips, kind='stable')
+    first = np.searchsorted(sorted_distances, trips[trip_order], side='left')
+    # taken[t] = max(first[t], taken[t - 1] + 1) = t + max over s <= t of (first[s] - s)
+    steps = np.arange(len(trips))
+    taken = np.maximum.accumulate(first - steps) + steps if len(trips) else first
+
+    result = np.full(len(trips), -1, dtype=np.int64)
+    served = taken < len(positions)
+    result[trip_order[served]] = positions[taken[served]]
+    return result
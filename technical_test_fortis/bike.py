@@ -1,4 +1,14 @@
-from technical_test_fortis.vehicle import Vehicle
+from technical_test_fortis.rules import DistanceRules, FlagMultiplier
+from technical_test_fortis.vehicle import (CONSUMPTION_ERROR, YEAR_ERROR, Vehicle, memoized_distance,
+                                          validate_bool_column, validate_columns, validate_int_column,
+                                          validated_attribute)
+
+SADDLE_COMFORT_ERROR = "The 'saddle_comfort' attribute must be of type 'bool'"
+
+
+def _validate_saddle_comfort(saddle_comfort):
+    if not isinstance(saddle_comfort, bool):
+        raise TypeError(SADDLE_COMFORT_ERROR)
 
 
 class Bike(Vehicle):
@@ -16,40 +26,57 @@ class Bike(Vehicle):
     - __init__(year: int, consumption: int, saddle_comfort: bool) -> None:
        Initializes the Bike object with the given year, consumption, and saddle_comfort status.
 
+    - bulk(years, consumptions, saddle_comforts, trusted: bool = False) -> list[Bike]:
+        Builds many bikes at once, validating each column with vectorized checks.
+
     - compute_maximal_distance() -> int:
         Computation of how far a person can travel on this Bike under ideal circumstances.
-        The impact of saddle_comfort is to double the distance if it is comfortable.
+        The impact of saddle_comfort is to double the distance if it is comfortable. It is compiled from
+        DISTANCE_RULES.
     """
+    __slots__ = ('_saddle_comfort',)
+
+    saddle_comfort = validated_attribute('saddle_comfort', _validate_saddle_comfort,
+                                         "Whether the bike has a very comfortable saddle or not.")
 
     def __init__(self, year: int, consumption: int, saddle_comfort: bool) -> None:
+        # year and consumption are validated by Vehicle.__init__.
         super().__init__(year, 0, consumption)
+        self.saddle_comfort = saddle_comfort
 
+    @classmethod
+    def bulk(cls, years, consumptions, saddle_comforts, trusted: bool = False) -> list:
+        """
+        Builds one bike per position of the given columns, see Car.bulk for the validation and the trusted mode.
+        :return: the list of bikes
+        """
+        if trusted:
+            years, consumptions, saddle_comforts = (column.tolist() if hasattr(column, 'tolist') else column
+                                                    for column in (years, consumptions, saddle_comforts))
+        else:
+            years, consumptions, saddle_comforts = validate_columns(
+                (validate_int_column, years, 1, YEAR_ERROR),
+                (validate_int_column, consumptions, 1, CONSUMPTION_ERROR),
+                (validate_bool_column, saddle_comforts, TypeError, SADDLE_COMFORT_ERROR),
+            )
 
-        if not isinstance(year, int):
-            raise TypeError("The 'year' attribute must be of type 'int'")
-
-        if not isinstance(consumption, int):
-            raise TypeError("The 'consumption' attribute must be of type 'int'")
-
-        if not isinstance(saddle_comfort, bool):
-            raise TypeError("The 'saddle_comfort' attribute must be of type 'bool'")
-
-
-        self.saddle_comfort = saddle_comfort
+        bikes = []
+        new = cls.__new__
+        for year, consumption, saddle_comfort in zip(years, consumptions, saddle_comforts):
+            bike = new(cls)
+            bike._year = year
+            bike._tank_size = 0
+            bike._consumption = consumption
+            bike._saddle_comfort = saddle_comfort
+            bike._cached_distance = None
+            bikes.append(bike)
+        return bikes
 
     def __str__(self) -> str:
         return f'Bike(year={self.year}, consumption={self.consumption}, saddle_comfort={self.saddle_comfort})'
 
-    def compute_maximal_distance(self) -> int:
-        """
-        This method overrides the abstract method in the parent class.
-        It returns twice the distance if the saddle is comfortable, in contrast to the Car class where the mileage
-        is affected by the technical inspection and the year of manufacture.
-        """
-        base_distance = 100 // self.consumption  # TODO change to something more realistic, maybe introduce a tanksize as well.
-
-        if self.saddle_comfort:
-            # If saddle is comfortable, the base distance is doubled.
-            return int(2.0 * base_distance)
-        else:
-            return int(base_distance)
+    # In contrast to the Car class where the mileage is affected by the technical inspection and the year of
+    # manufacture, the base distance is only doubled if the saddle is comfortable.
+    # TODO change to something more realistic, maybe introduce a tanksize as well.
+    DISTANCE_RULES = DistanceRules(numerator=100, flags=(FlagMultiplier('saddle_comfort', 2.0),))
+    compute_maximal_distance = memoized_distance(DISTANCE_RULES.compile_scalar())
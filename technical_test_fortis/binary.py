@@ -0,0 +1,157 @@
+"""
+Fixed-width binary fleet format, read back through np.memmap without copying or parsing.
+
+A file is a 16 bytes header followed by one 14 bytes little-endian record per vehicle:
+
+    header: magic b'VFLT' | version (uint16) | record size (uint16) | record count (uint64)
+    record: kind (uint8) | flags (uint8) | year (int32) | tank_size (int32) | consumption (int32)
+
+kind holds the CAR/BIKE tags of technical_test_fortis.fleet, bit 0 of flags is technical_inspection and bit 1
+is saddle_comfort. Opening a file only maps it: the operating system loads the pages lazily when the columns
+are read, so a query touching a few vehicles only reads a few pages.
+"""
+import struct
+from functools import cached_property
+from itertools import islice
+
+import numpy as np
+
+from technical_test_fortis.fleet import VehicleFleet
+
+MAGIC = b'VFLT'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQ')
+RECORD_DTYPE = np.dtype([
+    ('kind', 'u1'),
+    ('flags', 'u1'),
+    ('year', '<i4'),
+    ('tank_size', '<i4'),
+    ('consumption', '<i4'),
+])
+
+TECHNICAL_INSPECTION_FLAG = 1
+SADDLE_COMFORT_FLAG = 2
+_FLAGS = {'technical_inspection': TECHNICAL_INSPECTION_FLAG, 'saddle_comfort': SADDLE_COMFORT_FLAG}
+
+
+
+def fleet_to_records(fleet: VehicleFleet, dtype: np.dtype = RECORD_DTYPE) -> np.ndarray:
+    """
+    Converts a fleet to an array of binary records.
+    :param fleet: the fleet to convert
+    :param dtype: the record layout, RECORD_DTYPE or the same fields with wider integers
+    :return: a structured array with the given layout
+    :raises ValueError: if year, tank_size or consumption does not fit in the integers of the layout
+    """
+    for name in ('year', 'tank_size', 'consumption'):
+        column = getattr(fleet, name)
+        limits = np.iinfo(dtype[name])
+        if len(column) and (column.min() < limits.min or column.max() > limits.max):
+            raise ValueError(f"The '{name}' column does not fit in the {limits.bits} bits binary format.")
+
+    records = np.empty(len(fleet), dtype=dtype)
+    records['kind'] = fleet.kind
+    records['flags'] = (fleet.technical_inspection * TECHNICAL_INSPECTION_FLAG
+                        | fleet.saddle_comfort * SADDLE_COMFORT_FLAG)
+    records['year'] = fleet.year
+    records['tank_size'] = fleet.tank_size
+    records['consumption'] = fleet.consumption
+    return records
+
+
+def write_fleet(path, vehicles, chunk_size: int = 65536) -> int:
+    """
+    Writes vehicles to a binary fleet file, converting them chunk by chunk so that a stream of vehicles
+    (e.g. from technical_test_fortis.ingest) is never fully loaded in memory.
+    :param path: the path of the file to create
+    :param vehicles: a VehicleFleet or an iterable of Car and Bike objects
+    :param chunk_size: the number of vehicles converted at a time
+    :return: the number of records written
+    """
+    if isinstance(vehicles, VehicleFleet):
+        chunks = [vehicles]
+    else:
+        iterator = iter(vehicles)
+        chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+
+    count = 0
+    with open(path, 'wb') as file:
+        # The count is patched once all the records are written.
+        file.write(HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, 0))
+        for chunk in chunks:
+            fleet = chunk if isinstance(chunk, VehicleFleet) else VehicleFleet.from_vehicles(chunk)
+            fleet_to_records(fleet).tofile(file)
+            count += len(fleet)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, count))
+    return count
+
+
+class MappedFleet(VehicleFleet):
+    """
+
+    A VehicleFleet whose columns are views on a memory-mapped binary fleet file.
+
+    year, tank_size, consumption and kind are strided views on the mapped records (int32 and uint8 instead of
+    int64 and uint8), nothing is copied when the file is opened. The boolean columns are decoded from the flags
+    byte on first access.
+
+    Attributes:
+        - records (np.memmap): The mapped records, with the RECORD_DTYPE layout.
+
+    """
+
+    def __init__(self, records: np.ndarray) -> None:
+        self.records = records
+        self.kind = records['kind']
+        self.year = records['year']
+        self.tank_size = records['tank_size']
+        self.consumption = records['consumption']
+
+    def field(self, name: str, index: int):
+        # A single flag is decoded from its record, rather than decoding the whole boolean column.
+        flag = _FLAGS.get(name)
+        if flag is None or name in self.__dict__:
+            return super().field(name, index)
+        return bool(self.records['flags'][index] & flag)
+
+    @cached_property
+    def technical_inspection(self) -> np.ndarray:
+        return (self.records['flags'] & TECHNICAL_INSPECTION_FLAG) != 0
+
+    @cached_property
+    def saddle_comfort(self) -> np.ndarray:
+        return (self.records['flags'] & SADDLE_COMFORT_FLAG) != 0
+
+
+def read_header(path) -> int:
+    """
+    Checks the header of a binary fleet file.
+    :param path: the path of the file
+    :return: the number of records in the file
+    :raises ValueError: if the file is not a supported binary fleet file
+    """
+    with open(path, 'rb') as file:
+        header = file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"'{path}' is too short to be a binary fleet file.")
+    magic, version, record_size, count = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"'{path}' is not a binary fleet file.")
+    if version != VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"Unsupported binary fleet format version {version} in '{path}'.")
+    return count
+
+
+def open_fleet(path) -> MappedFleet:
+    """
+    Maps a binary fleet file in memory, read-only.
+    :param path: the path of the file written by write_fleet()
+    :return: a MappedFleet backed by the file
+    """
+    count = read_header(path)
+    if count == 0:
+        # mmap cannot map an empty region.
+        return MappedFleet(np.empty(0, dtype=RECORD_DTYPE))
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+    return MappedFleet(records)
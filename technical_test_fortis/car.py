@@ -1,4 +1,14 @@
-from technical_test_fortis.vehicle import Vehicle
+from technical_test_fortis.rules import Bracket, DistanceRules
+from technical_test_fortis.vehicle import (CONSUMPTION_ERROR, TANK_SIZE_ERROR, YEAR_ERROR, Vehicle,
+                                          memoized_distance, validate_bool_column, validate_columns,
+                                          validate_int_column, validated_attribute)
+
+TECHNICAL_INSPECTION_ERROR = "The technical_inspection must be a boolean value."
+
+
+def _validate_technical_inspection(technical_inspection):
+    if not isinstance(technical_inspection, bool):
+        raise ValueError(TECHNICAL_INSPECTION_ERROR)
 
 
 class Car(Vehicle):
@@ -16,34 +26,71 @@ class Car(Vehicle):
     - __init__(year: int, tank_size: int, consumption: int, technical_inspection: bool) -> None:
         Initializes the Car object with the given year, tank size, consumption, and technical inspection status.
 
+    - bulk(years, tank_sizes, consumptions, technical_inspections, trusted: bool = False) -> list[Car]:
+        Builds many cars at once, validating each column with vectorized checks.
+
     - compute_maximal_distance() -> int:
         Computes and returns the theoretical maximum distance the car can travel on a full tank of fuel,
-        taking into account its year of manufacture and technical inspection status.
+        taking into account its year of manufacture and technical inspection status. It is compiled from
+        DISTANCE_RULES.
 
     """
+    __slots__ = ('_technical_inspection',)
+
+    technical_inspection = validated_attribute('technical_inspection', _validate_technical_inspection,
+                                               "Whether the car has passed its technical inspection.")
 
     def __init__(self, year: int, tank_size: int, consumption: int, technical_inspection: bool) -> None:
 
         super().__init__(year, tank_size, consumption)
-        if not isinstance(technical_inspection, bool):
-            raise ValueError("The technical_inspection must be a boolean value.")
         self.technical_inspection = technical_inspection
 
-    def __str__(self) -> str:
-        return f'Car(year={self.year}, tank_size={self.tank_size}, consumption={self.consumption}, technical_inspection={self.technical_inspection})'
+    @classmethod
+    def bulk(cls, years, tank_sizes, consumptions, technical_inspections, trusted: bool = False) -> list:
+        """
+        Builds one car per position of the given columns (sequences or one-dimensional NumPy arrays).
+        Each column is validated as a whole; an invalid value raises the TypeError or ValueError the constructor
+        would raise first, with the offending indices in the message. Integer NumPy values are stored as
+        Python ints.
 
-    def compute_maximal_distance(self) -> int:
-        if not self.technical_inspection:
-            # if the technical inspection is not done, the car cannot move
-            return 0
-        theoretical_max_distance = self.tank_size // self.consumption
+        trusted=True skips the validation entirely, for data that already passed a schema check: the values
+        must then be Python ints and bools satisfying the constructor's rules, nothing enforces it.
+        :return: the list of cars
+        """
+        if trusted:
+            years, tank_sizes, consumptions, technical_inspections = (
+                column.tolist() if hasattr(column, 'tolist') else column
+                for column in (years, tank_sizes, consumptions, technical_inspections))
+        else:
+            years, tank_sizes, consumptions, technical_inspections = validate_columns(
+                (validate_int_column, years, 1, YEAR_ERROR),
+                (validate_int_column, tank_sizes, 0, TANK_SIZE_ERROR),
+                (validate_int_column, consumptions, 1, CONSUMPTION_ERROR),
+                (validate_bool_column, technical_inspections, ValueError, TECHNICAL_INSPECTION_ERROR),
+            )
 
-        if self.year < 2000:
-            # if the car is from before 2000, the theoretical maximal distance is reduced by 10%
-            theoretical_max_distance *= 0.9
-        elif self.year > 2010:
-            # if the car is from after 2010, the theoretical maximal distance is increased by 10%
-            theoretical_max_distance *= 1.1
+        cars = []
+        new = cls.__new__
+        for year, tank_size, consumption, technical_inspection in zip(years, tank_sizes, consumptions,
+                                                                      technical_inspections):
+            # The values are already validated: the private slots are filled directly.
+            car = new(cls)
+            car._year = year
+            car._tank_size = tank_size
+            car._consumption = consumption
+            car._technical_inspection = technical_inspection
+            car._cached_distance = None
+            cars.append(car)
+        return cars
 
-        return int(theoretical_max_distance)
+    def __str__(self) -> str:
+        return f'Car(year={self.year}, tank_size={self.tank_size}, consumption={self.consumption}, technical_inspection={self.technical_inspection})'
 
+    # The car cannot move without its technical inspection; its theoretical maximal distance is reduced by 10%
+    # when it is from before 2000 and increased by 10% when it is from after 2010.
+    DISTANCE_RULES = DistanceRules(
+        numerator='tank_size',
+        brackets=(Bracket('year', 0.9, upper=2000), Bracket('year', 1.1, lower=2010)),
+        zero_unless=('technical_inspection',),
+    )
+    compute_maximal_distance = memoized_distance(DISTANCE_RULES.compile_scalar())
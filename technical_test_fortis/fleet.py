@@ -0,0 +1,174 @@
+import numpy as np
+
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.vehicle import (CONSUMPTION_ERROR, TANK_SIZE_ERROR, YEAR_ERROR, Vehicle,
+                                          validate_positive_int)
+
+# Type tags stored in the 'kind' column of a VehicleFleet.
+CAR = 0
+BIKE = 1
+
+# The batch kernel of each type tag, compiled from the vehicle classes' distance rules.
+_KERNELS = ((CAR, Car.DISTANCE_RULES.compile_batch()), (BIKE, Bike.DISTANCE_RULES.compile_batch()))
+
+# The range of the integer columns; valid vehicles may hold Python ints beyond it.
+INT64_MIN, INT64_MAX = int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max)
+
+
+def _int64_column(name: str, values) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except OverflowError:
+        raise ValueError(f"The {name} column holds values outside the int64 range.") from None
+
+
+class VehicleFleet:
+    """
+
+    This class stores a collection of vehicles column by column (struct-of-arrays) so that the maximal
+    distance of every vehicle can be computed in a single vectorized pass.
+
+    Attributes:
+        - kind (np.ndarray[uint8]): The type tag of each vehicle, CAR or BIKE.
+        - year (np.ndarray[int64]): The year of manufacture of each vehicle.
+        - tank_size (np.ndarray[int64]): The tank size of each vehicle, 0 for bikes.
+        - consumption (np.ndarray[int64]): The consumption of each vehicle.
+        - technical_inspection (np.ndarray[bool]): The technical inspection status, False for bikes.
+        - saddle_comfort (np.ndarray[bool]): The saddle comfort status, False for cars.
+
+    Methods:
+        - from_vehicles(vehicles: Iterable[Vehicle]) -> VehicleFleet:
+            Builds a fleet from Car and Bike objects.
+
+        - to_vehicles() -> list[Vehicle]:
+            Rebuilds the Car and Bike objects stored in the fleet.
+
+        - compute_maximal_distances() -> np.ndarray:
+            Computes the maximal distance of every vehicle, identical to calling compute_maximal_distance()
+            on each of them.
+
+        - find_best_indices(k: int = 1) -> np.ndarray:
+            Returns the positions of the k vehicles with the highest autonomy, best first.
+
+    """
+
+    def __init__(self, kind, year, tank_size, consumption, technical_inspection, saddle_comfort) -> None:
+        kind = np.asarray(kind)
+        if not np.isin(kind, (CAR, BIKE)).all():
+            raise ValueError("The kind of every vehicle must be CAR or BIKE.")
+        self.kind = kind.astype(np.uint8, copy=False)
+        self.year = _int64_column('year', year)
+        self.tank_size = _int64_column('tank_size', tank_size)
+        self.consumption = _int64_column('consumption', consumption)
+        self.technical_inspection = np.asarray(technical_inspection, dtype=bool)
+        self.saddle_comfort = np.asarray(saddle_comfort, dtype=bool)
+
+        columns = (self.kind, self.year, self.tank_size, self.consumption, self.technical_inspection,
+                   self.saddle_comfort)
+        if any(column.ndim != 1 for column in columns):
+            raise ValueError("All fleet columns must be one-dimensional.")
+        if len({len(column) for column in columns}) != 1:
+            raise ValueError("All fleet columns must have the same length.")
+        # The same rules as the Vehicle constructor, so that every row is a valid Car or Bike.
+        for column, minimum, error_message in ((self.year, 1, YEAR_ERROR), (self.tank_size, 0, TANK_SIZE_ERROR),
+                                                (self.consumption, 1, CONSUMPTION_ERROR)):
+            if (column < minimum).any():
+                raise ValueError(error_message)
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    @classmethod
+    def from_vehicles(cls, vehicles) -> 'VehicleFleet':
+        """
+        Builds a fleet from an iterable of Car and Bike objects.
+        :param vehicles: the vehicles to store, in order
+        :return: the fleet holding the vehicles' attributes
+        """
+        kind, year, tank_size, consumption, technical_inspection, saddle_comfort = [], [], [], [], [], []
+        for vehicle in vehicles:
+            if isinstance(vehicle, Car):
+                kind.append(CAR)
+                technical_inspection.append(vehicle.technical_inspection)
+                saddle_comfort.append(False)
+            elif isinstance(vehicle, Bike):
+                kind.append(BIKE)
+                technical_inspection.append(False)
+                saddle_comfort.append(vehicle.saddle_comfort)
+            else:
+                raise TypeError(f"Unsupported vehicle type '{type(vehicle).__name__}'.")
+            year.append(vehicle.year)
+            tank_size.append(vehicle.tank_size)
+            consumption.append(vehicle.consumption)
+
+        return cls(kind, year, tank_size, consumption, technical_inspection, saddle_comfort)
+
+    def field(self, name: str, index: int):
+        """
+        Reads one attribute of one vehicle without touching the rest of the column.
+        :param name: the name of the column, e.g. 'year' or 'saddle_comfort'
+        :param index: the position of the vehicle in the fleet
+        :return: the value as a Python int or bool
+        """
+        return getattr(self, name)[index].item()
+
+    def vehicle(self, index: int) -> Vehicle:
+        """
+        Rebuilds the vehicle stored at the given position.
+        :param index: the position of the vehicle in the fleet
+        :return: a Car or Bike equal to the stored record
+        """
+        year = int(self.year[index])
+        consumption = int(self.consumption[index])
+        if self.kind[index] == CAR:
+            return Car(year, int(self.tank_size[index]), consumption, bool(self.technical_inspection[index]))
+        return Bike(year, consumption, bool(self.saddle_comfort[index]))
+
+    def to_vehicles(self) -> list:
+        return [self.vehicle(index) for index in range(len(self))]
+
+    def compute_maximal_distances(self) -> np.ndarray:
+        """
+        Vectorized counterpart of Car.compute_maximal_distance and Bike.compute_maximal_distance: the batch
+        kernels compiled from their DISTANCE_RULES. The floating point modifiers are applied in float64 and
+        truncated, exactly like int() does on the scalar path.
+        """
+        distances = np.zeros(len(self), dtype=np.int64)
+        for kind, kernel in _KERNELS:
+            distances = np.where(self.kind == kind, kernel(self), distances)
+        return distances
+
+    def find_best_indices(self, k: int = 1, distances=None) -> np.ndarray:
+        """
+        Columnar counterpart of find_best_vehicles: the positions of the k vehicles with the highest autonomy,
+        best first. On equal distance the later position wins, as with find_best_vehicle.
+        :param k: the number of positions to return
+        :param distances: precomputed result of compute_maximal_distances(), computed when omitted
+        :return: an int64 array of at most k positions
+        """
+        validate_positive_int('k', k)
+        if distances is None:
+            distances = self.compute_maximal_distances()
+        return top_k_positions(distances, k)
+
+
+def top_k_positions(distances: np.ndarray, k: int) -> np.ndarray:
+    """
+    Returns the positions of the k largest distances, best first, ranking later positions first on ties.
+    :param distances: a one-dimensional array of distances
+    :param k: the number of positions to return
+    :return: an int64 array of at most k positions
+    """
+    n = len(distances)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < n:
+        # Only the values at least as large as the k-th largest one can be part of the result.
+        threshold = np.partition(distances, n - k)[n - k]
+        candidates = np.flatnonzero(distances >= threshold)
+    else:
+        candidates = np.arange(n)
+    # lexsort uses the last key as the primary one: distance first, then position.
+    order = np.lexsort((candidates, distances[candidates]))[::-1][:k]
+    return candidates[order].astype(np.int64)
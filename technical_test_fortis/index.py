@@ -0,0 +1,115 @@
+from bisect import bisect_left, insort
+from itertools import count
+from math import inf
+
+from technical_test_fortis.vehicle import Vehicle
+
+
+class DistanceIndex:
+    """
+
+    This class indexes vehicles by maximal distance to answer range and threshold queries without scanning
+    the whole fleet.
+
+    Entries are kept in a list sorted by (distance, insertion order): a query is a binary search followed by a
+    slice, O(log n + answer). Insertions, deletions and updates are a binary search plus a shift of the list
+    (a memmove, not a rebuild). Vehicles are tracked by identity; after mutating one, call update() so that
+    its distance is recomputed.
+
+    Methods:
+        - insert(vehicle: Vehicle) -> None:
+            Adds a vehicle to the index.
+
+        - remove(vehicle: Vehicle) -> None:
+            Removes a vehicle from the index.
+
+        - update(vehicle: Vehicle) -> None:
+            Moves a vehicle whose attributes changed to its new distance, keeping its insertion order.
+
+        - at_least(distance: int) -> list[Vehicle]:
+            Returns the vehicles that can drive at least the given distance.
+
+        - between(low: int, high: int) -> list[Vehicle]:
+            Returns the vehicles whose maximal distance is in [low, high].
+
+    Query results are sorted by increasing distance, and by insertion order between equal distances.
+
+    """
+
+    def __init__(self, vehicles=()) -> None:
+        self._sequence = count()
+        self._keys = {}
+        for vehicle in vehicles:
+            self._check(vehicle)
+            if vehicle in self._keys:
+                raise ValueError("A vehicle can only be indexed once.")
+            self._keys[vehicle] = (vehicle.compute_maximal_distance(), next(self._sequence))
+        # Entries are (distance, sequence, vehicle); the sequence is unique so vehicles are never compared.
+        self._entries = sorted(key + (vehicle,) for vehicle, key in self._keys.items())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, vehicle) -> bool:
+        return vehicle in self._keys
+
+    def __iter__(self):
+        return (vehicle for _, _, vehicle in self._entries)
+
+    @staticmethod
+    def _check(vehicle) -> None:
+        if not isinstance(vehicle, Vehicle):
+            raise TypeError("Only vehicles can be indexed.")
+
+    def insert(self, vehicle: Vehicle) -> None:
+        self._check(vehicle)
+        if vehicle in self._keys:
+            raise ValueError("The vehicle is already indexed, use update() after changing it.")
+        key = (vehicle.compute_maximal_distance(), next(self._sequence))
+        self._keys[vehicle] = key
+        insort(self._entries, key + (vehicle,))
+
+    def remove(self, vehicle: Vehicle) -> None:
+        key = self._keys.pop(vehicle)
+        del self._entries[bisect_left(self._entries, key)]
+
+    def update(self, vehicle: Vehicle) -> None:
+        distance, sequence = self._keys[vehicle]
+        new_distance = vehicle.compute_maximal_distance()
+        if new_distance == distance:
+            return
+        del self._entries[bisect_left(self._entries, (distance, sequence))]
+        self._keys[vehicle] = (new_distance, sequence)
+        insort(self._entries, (new_distance, sequence, vehicle))
+
+    def distance(self, vehicle: Vehicle) -> int:
+        """
+        :return: the indexed distance of the vehicle
+        """
+        return self._keys[vehicle][0]
+
+    def _position(self, distance) -> int:
+        # (distance,) sorts before every (distance, sequence, vehicle) entry.
+        return bisect_left(self._entries, (distance,))
+
+    def _end(self, distance) -> int:
+        # (distance, inf) sorts after every (distance, sequence, vehicle) entry.
+        return bisect_left(self._entries, (distance, inf))
+
+    def count_at_least(self, distance: int) -> int:
+        return len(self._entries) - self._position(distance)
+
+    def at_least(self, distance: int) -> list:
+        return [vehicle for _, _, vehicle in self._entries[self._position(distance):]]
+
+    def between(self, low: int, high: int) -> list:
+        if low > high:
+            return []
+        return [vehicle for _, _, vehicle in self._entries[self._position(low):self._end(high)]]
+
+    def best(self):
+        """
+        :return: the vehicle with the highest autonomy, the latest inserted one on equal distance, as
+            find_best_vehicle does when folding the vehicles in insertion order; None when the index is empty
+        """
+        return self._entries[-1][2] if self._entries else None
@@ -0,0 +1,211 @@
+"""
+Streaming loaders turning CSV and JSON-lines fleet exports into Car and Bike objects.
+
+Every record describes one vehicle with the fields 'type' ('car' or 'bike'), 'year', 'tank_size', 'consumption',
+'technical_inspection' and 'saddle_comfort'. Bikes ignore 'tank_size' and 'technical_inspection', cars ignore
+'saddle_comfort'. The loaders are generators reading one record at a time, so a file of any size can be fed to
+find_best_vehicles() or split in VehicleFleet chunks without being loaded in memory.
+
+Records are validated by the Car and Bike constructors. A record that cannot be turned into a vehicle is
+reported to the on_error callback with its line number and skipped, instead of aborting the whole file.
+"""
+import csv
+import json
+import logging
+from collections import namedtuple
+from itertools import islice
+
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.vehicle import validate_positive_int
+
+logger = logging.getLogger(__name__)
+
+RowError = namedtuple('RowError', ['line_number', 'message', 'record'])
+
+FIELDS = ('type', 'year', 'tank_size', 'consumption', 'technical_inspection', 'saddle_comfort')
+
+_TRUE_STRINGS = frozenset(('true', '1', 'yes'))
+_FALSE_STRINGS = frozenset(('false', '0', 'no'))
+
+
+def _log_row_error(error: RowError) -> None:
+    logger.warning("Skipping invalid record on line %d: %s", error.line_number, error.message)
+
+
+def vehicle_from_record(record: dict):
+    """
+    Builds a Car or a Bike from a record whose values already have their Python types.
+    :param record: a mapping with the fields described in the module docstring
+    :return: the vehicle described by the record
+    :raises KeyError: if a required field is missing
+    :raises TypeError, ValueError: if the record is rejected by the vehicle's validation
+    """
+    kind = record['type']
+    # 'Car' and ' car ' are accepted from every format, as the CSV reader always did.
+    if isinstance(kind, str):
+        kind = kind.strip().lower()
+    if kind == 'car':
+        return Car(record['year'], record['tank_size'], record['consumption'], record['technical_inspection'])
+    if kind == 'bike':
+        return Bike(record['year'], record['consumption'], record['saddle_comfort'])
+    raise ValueError(f"Unknown vehicle type {kind!r}, expected 'car' or 'bike'.")
+
+
+def record_from_vehicle(vehicle) -> dict:
+    """
+    Inverse of vehicle_from_record: describes a Car or a Bike as a JSON-serializable record.
+    :param vehicle: the vehicle to describe
+    :return: a record holding only the fields that apply to the vehicle's type
+    """
+    if isinstance(vehicle, Car):
+        return {'type': 'car', 'year': vehicle.year, 'tank_size': vehicle.tank_size,
+                'consumption': vehicle.consumption, 'technical_inspection': vehicle.technical_inspection}
+    if isinstance(vehicle, Bike):
+        return {'type': 'bike', 'year': vehicle.year, 'consumption': vehicle.consumption,
+                'saddle_comfort': vehicle.saddle_comfort}
+    raise TypeError(f"Unsupported vehicle type '{type(vehicle).__name__}'.")
+
+
+def _parse_int(text: str):
+    # int() also accepts strings such as ' 12 ', anything else is left to the vehicle's validation.
+    try:
+        return int(text)
+    except ValueError:
+        return text
+
+
+def _parse_bool(text: str):
+    lowered = text.strip().lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+    return text
+
+
+def _typed_csv_record(row: dict) -> dict:
+    record = {'type': (row.get('type') or '').strip().lower()}
+    for field in ('year', 'tank_size', 'consumption'):
+        if row.get(field) not in (None, ''):
+            record[field] = _parse_int(row[field])
+    for field in ('technical_inspection', 'saddle_comfort'):
+        if row.get(field) not in (None, ''):
+            record[field] = _parse_bool(row[field])
+    return record
+
+
+def _records_to_vehicles(numbered_records, on_error):
+    for line_number, record in numbered_records:
+        try:
+            vehicle = vehicle_from_record(record)
+        except KeyError as error:
+            on_error(RowError(line_number, f"missing field {error.args[0]!r}", record))
+        except (TypeError, ValueError) as error:
+            on_error(RowError(line_number, str(error), record))
+        else:
+            yield vehicle
+
+
+def _open_text(source):
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        return open(source, newline='', encoding='utf-8'), True
+    return source, False
+
+
+def read_csv(source, on_error=None):
+    """
+    Lazily reads the vehicles of a CSV file with a header line.
+    :param source: a path or an open text file
+    :param on_error: a callable receiving a RowError for every skipped record, defaults to logging a warning
+    :return: a generator of Car and Bike objects
+    """
+    on_error = on_error or _log_row_error
+    file, owned = _open_text(source)
+    try:
+        reader = csv.DictReader(file)
+
+        def numbered_records():
+            while True:
+                try:
+                    row = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error as error:
+                    # The reader starts over on the next line, only the malformed row is lost. DictReader only
+                    # updates its line_num after a valid row, the underlying reader's one is current.
+                    on_error(RowError(reader.reader.line_num, f"invalid CSV: {error}", None))
+                    continue
+                # line_num is the physical line on which the record ends, the header being line 1.
+                yield reader.line_num, _typed_csv_record(row)
+
+        yield from _records_to_vehicles(numbered_records(), on_error)
+    finally:
+        if owned:
+            file.close()
+
+
+def read_jsonl(source, on_error=None):
+    """
+    Lazily reads the vehicles of a JSON-lines file, one JSON object per line. Blank lines are ignored.
+    :param source: a path or an open text file
+    :param on_error: a callable receiving a RowError for every skipped record, defaults to logging a warning
+    :return: a generator of Car and Bike objects
+    """
+    on_error = on_error or _log_row_error
+    file, owned = _open_text(source)
+    try:
+        def numbered_records():
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except (ValueError, RecursionError) as error:
+                    # ValueError includes json.JSONDecodeError, RecursionError a too deeply nested line.
+                    on_error(RowError(line_number, f"invalid JSON: {error}", line.rstrip('\n')))
+                    continue
+                if not isinstance(record, dict):
+                    on_error(RowError(line_number, "a record must be a JSON object", record))
+                    continue
+                yield line_number, record
+
+        yield from _records_to_vehicles(numbered_records(), on_error)
+    finally:
+        if owned:
+            file.close()
+
+
+def read_vehicles(path, on_error=None):
+    """
+    Lazily reads the vehicles of a file, choosing the format from its extension
+    ('.csv', or '.jsonl'/'.ndjson'/'.json' for JSON lines).
+    :param path: the path of the file
+    :param on_error: a callable receiving a RowError for every skipped record, defaults to logging a warning
+    :return: a generator of Car and Bike objects
+    """
+    suffix = str(path).rsplit('.', 1)[-1].lower()
+    if suffix == 'csv':
+        return read_csv(path, on_error)
+    if suffix in ('jsonl', 'ndjson', 'json'):
+        return read_jsonl(path, on_error)
+    raise ValueError(f"Cannot infer the format of '{path}', expected a .csv or .jsonl file.")
+
+
+def iter_fleet_chunks(vehicles, chunk_size: int = 65536):
+    """
+    Groups a stream of vehicles in VehicleFleet chunks, holding at most chunk_size vehicles at a time.
+    :param vehicles: an iterable of Car and Bike objects, e.g. the result of read_csv()
+    :param chunk_size: the maximal number of vehicles per chunk
+    :return: a generator of VehicleFleet objects
+    """
+    validate_positive_int('chunk_size', chunk_size)
+    # NumPy is only needed for the columnar path.
+    from technical_test_fortis.fleet import VehicleFleet
+
+    iterator = iter(vehicles)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield VehicleFleet.from_vehicles(chunk)
@@ -0,0 +1,182 @@
+"""
+Opt-in instrumentation of the vehicle model's hot paths.
+
+enable() wraps the constructors of Vehicle, Car and Bike, their compute_maximal_distance methods and the
+find_best_vehicle / find_best_vehicles functions of technical_test_fortis.vehicle to count calls and measure
+wall time, per method and per vehicle type. disable() puts the original functions back, so the instrumentation
+costs nothing while it is disabled.
+
+With enable(sample_every=N), every call is counted but only one call in N is timed; the total time is then
+estimated from the timed calls. The counters are not synchronized between threads, concurrent calls may
+occasionally be lost.
+
+Only calls going through the module attributes are seen for the functions: code that did
+'from technical_test_fortis.vehicle import find_best_vehicle' before enable() keeps the original function.
+"""
+import os
+import tempfile
+import time
+
+from technical_test_fortis import vehicle as vehicle_module
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.vehicle import Vehicle, validate_positive_int
+
+METRIC_PREFIX = 'technical_test_fortis'
+
+# (owner, attribute name, method label); methods are labelled per vehicle type, functions as 'any'.
+_TARGETS = (
+    (Vehicle, '__init__', 'Vehicle.__init__'),
+    (Car, '__init__', '__init__'),
+    (Bike, '__init__', '__init__'),
+    (Car, 'compute_maximal_distance', 'compute_maximal_distance'),
+    (Bike, 'compute_maximal_distance', 'compute_maximal_distance'),
+)
+_FUNCTION_TARGETS = (
+    (vehicle_module, 'find_best_vehicle'),
+    (vehicle_module, 'find_best_vehicles'),
+)
+
+# (method, vehicle type) -> [calls, timed calls, timed seconds]
+_stats = {}
+_originals = []
+_sample_every = 1
+
+
+def _counters(key) -> list:
+    counters = _stats.get(key)
+    if counters is None:
+        counters = _stats[key] = [0, 0, 0.0]
+    return counters
+
+
+def _wrap_method(function, label):
+    def wrapper(self, *args, **kwargs):
+        counters = _counters((label, type(self).__name__))
+        counters[0] += 1
+        if counters[0] % _sample_every:
+            return function(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            counters[1] += 1
+            counters[2] += time.perf_counter() - start
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _wrap_function(function):
+    def wrapper(*args, **kwargs):
+        counters = _counters((function.__name__, 'any'))
+        counters[0] += 1
+        if counters[0] % _sample_every:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            counters[1] += 1
+            counters[2] += time.perf_counter() - start
+
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable(sample_every: int = 1) -> None:
+    """
+    Installs the instrumentation. Calling it again only changes the sampling rate.
+    :param sample_every: time one call in sample_every, 1 timing every call
+    """
+    global _sample_every
+    validate_positive_int('sample_every', sample_every)
+    _sample_every = sample_every
+    if _originals:
+        return
+    for owner, name, label in _TARGETS:
+        original = owner.__dict__[name]
+        _originals.append((owner, name, original))
+        setattr(owner, name, _wrap_method(original, label))
+    for owner, name in _FUNCTION_TARGETS:
+        original = getattr(owner, name)
+        _originals.append((owner, name, original))
+        setattr(owner, name, _wrap_function(original))
+
+
+def disable() -> None:
+    """
+    Removes the instrumentation, the collected statistics are kept until reset().
+    """
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+
+
+def reset() -> None:
+    _stats.clear()
+
+
+def snapshot() -> dict:
+    """
+    :return: a mapping method -> vehicle type -> statistics, with the keys 'calls', 'timed_calls', 'seconds'
+        (time measured on the timed calls) and 'estimated_seconds' (extrapolated to all the calls)
+    """
+    result = {}
+    for (method, vehicle_type), (calls, timed_calls, seconds) in sorted(_stats.items()):
+        estimated = seconds * calls / timed_calls if timed_calls else 0.0
+        result.setdefault(method, {})[vehicle_type] = {
+            'calls': calls,
+            'timed_calls': timed_calls,
+            'seconds': seconds,
+            'estimated_seconds': estimated,
+        }
+    return result
+
+
+def to_prometheus(data: dict = None) -> str:
+    """
+    Formats a snapshot in the Prometheus text exposition format.
+    :param data: a result of snapshot(), taken now when omitted
+    :return: the metrics as text
+    """
+    data = snapshot() if data is None else data
+    metrics = (
+        ('calls_total', 'calls', 'Number of calls per method and vehicle type.'),
+        ('timed_calls_total', 'timed_calls', 'Number of timed (sampled) calls per method and vehicle type.'),
+        ('seconds_total', 'estimated_seconds', 'Estimated wall time spent per method and vehicle type.'),
+    )
+    lines = []
+    for suffix, field, description in metrics:
+        name = f'{METRIC_PREFIX}_{suffix}'
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} counter')
+        for method, per_type in data.items():
+            for vehicle_type, statistics in per_type.items():
+                lines.append(f'{name}{{method="{method}",vehicle_type="{vehicle_type}"}} {statistics[field]!r}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path) -> None:
+    """
+    Writes the current metrics to a file for a scraping agent (e.g. a node exporter text file collector).
+    The file is replaced atomically, so the agent never reads a partial file.
+    :param path: the path of the file to write
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix='.metrics-')
+    try:
+        with os.fdopen(descriptor, 'w') as file:
+            file.write(to_prometheus())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
@@ -0,0 +1,153 @@
+"""
+Lazy Car and Bike proxies over a VehicleFleet, or over a binary fleet file through a MappedFleet.
+
+A proxy only holds its source and position. Each attribute is decoded from the source the first time it is read
+and then kept in the proxy's slot, so a report touching a few vehicles of a mapped file of millions only decodes
+(and only pages in) those few records. Proxies are real Car and Bike instances: isinstance checks, __str__,
+compute_maximal_distance and the distance cache work as usual. Assigning an attribute is validated as usual and
+only changes the proxy, never its source.
+"""
+import operator
+from collections.abc import Sequence
+
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import CAR, VehicleFleet
+
+# private slot -> decoder reading the value of one vehicle from its source
+_DECODERS = {
+    '_year': lambda source, index: source.field('year', index),
+    '_tank_size': lambda source, index: source.field('tank_size', index),
+    '_consumption': lambda source, index: source.field('consumption', index),
+    '_technical_inspection': lambda source, index: source.field('technical_inspection', index),
+    '_saddle_comfort': lambda source, index: source.field('saddle_comfort', index),
+    '_cached_distance': lambda source, index: None,
+}
+
+
+class _LazyFields:
+    """
+    Mixin decoding the private slots of a vehicle on first access. It is listed before Car or Bike so that
+    a missing slot reaches its __getattr__; it declares no slots itself.
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        # Only called when a normal lookup failed, i.e. for slots that were not decoded yet.
+        decode = _DECODERS.get(name)
+        if decode is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = decode(self._source, self._index)
+        object.__setattr__(self, name, value)
+        return value
+
+    @property
+    def source(self):
+        """The fleet the proxy decodes its attributes from."""
+        return self._source
+
+    @property
+    def index(self) -> int:
+        """The position of the proxied vehicle in its source."""
+        return self._index
+
+
+class LazyCar(_LazyFields, Car):
+    """
+
+    A Car whose attributes are decoded from a fleet on first access.
+
+    Attributes:
+        - source (VehicleFleet): The fleet holding the car.
+        - index (int): The position of the car in the fleet.
+
+    """
+    __slots__ = ('_source', '_index')
+
+    def __init__(self, source: VehicleFleet, index: int) -> None:
+        self._source = source
+        self._index = index
+
+
+class LazyBike(_LazyFields, Bike):
+    """
+
+    A Bike whose attributes are decoded from a fleet on first access.
+
+    Attributes:
+        - source (VehicleFleet): The fleet holding the bike.
+        - index (int): The position of the bike in the fleet.
+
+    """
+    __slots__ = ('_source', '_index')
+
+    def __init__(self, source: VehicleFleet, index: int) -> None:
+        self._source = source
+        self._index = index
+
+
+def lazy_vehicle(source: VehicleFleet, index: int):
+    """
+    :param source: a VehicleFleet or a MappedFleet
+    :param index: the position of the vehicle, negative positions count from the end
+    :return: a LazyCar or a LazyBike proxying the vehicle; only its type tag is read
+    """
+    index = operator.index(index)
+    if not -len(source) <= index < len(source):
+        raise IndexError("Fleet index out of range.")
+    index %= len(source)
+    return (LazyCar if source.kind[index] == CAR else LazyBike)(source, index)
+
+
+class LazyFleetView(Sequence):
+    """
+
+    A read-only sequence of the vehicles of a fleet, created as lazy proxies when they are first accessed.
+
+    The proxy of a position is kept once created, so view[i] is view[i] and vehicles can be tracked by identity
+    (e.g. by a FleetLeader). The memory used grows with the number of vehicles accessed, not with the size of
+    the fleet.
+
+    Attributes:
+        - source (VehicleFleet): The fleet being viewed.
+
+    """
+
+    def __init__(self, source: VehicleFleet) -> None:
+        self.source = source
+        self._proxies = {}
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        # Accepts NumPy integers too, such as the positions returned by VehicleFleet.find_best_indices().
+        index = operator.index(index)
+        # The range is checked before normalizing, so that proxies are only ever kept under non-negative positions.
+        if not -len(self) <= index < len(self):
+            raise IndexError("Fleet index out of range.")
+        if index < 0:
+            index += len(self)
+        proxy = self._proxies.get(index)
+        if proxy is None:
+            proxy = self._proxies[index] = lazy_vehicle(self.source, index)
+        return proxy
+
+    def materialized_count(self) -> int:
+        """
+        :return: the number of proxies created so far
+        """
+        return len(self._proxies)
+
+
+def open_lazy(path) -> LazyFleetView:
+    """
+    Maps a binary fleet file and returns a lazy view of its vehicles.
+    :param path: the path of a file written by technical_test_fortis.binary.write_fleet()
+    :return: the view, no record is decoded yet
+    """
+    from technical_test_fortis.binary import open_fleet
+
+    return LazyFleetView(open_fleet(path))
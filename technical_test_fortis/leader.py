@@ -0,0 +1,177 @@
+import heapq
+from collections import namedtuple
+from itertools import count
+
+from technical_test_fortis.vehicle import Vehicle, validate_positive_int
+
+# A change of the fleet: action is 'add', 'retire' or 'update'; changes maps attribute names to new values for
+# an update (e.g. {'technical_inspection': False}), None when the vehicle was already modified in place.
+ChangeEvent = namedtuple('ChangeEvent', ['action', 'vehicle', 'changes'], defaults=(None,))
+
+ACTIONS = ('add', 'retire', 'update')
+
+
+class FleetLeader:
+    """
+
+    This class keeps track of the best vehicle of a fleet, and optionally of its top k, while the fleet changes.
+
+    Vehicles are ranked as find_best_vehicles ranks the fleet in arrival order: by maximal distance, the later
+    arrival winning on equal distance. An updated vehicle keeps its arrival position; a retired vehicle added
+    again arrives last.
+
+    The ranking is a max-heap with lazy deletion: an update or a retirement only records the vehicle's new key
+    and pushes a new entry, O(log n); outdated entries are discarded when they reach the top. The heap is
+    rebuilt once outdated entries outnumber the live ones, so its size stays O(n).
+
+    Methods:
+        - add(vehicle: Vehicle) -> None:
+            Adds a vehicle, arriving after all the others.
+
+        - retire(vehicle: Vehicle) -> None:
+            Removes a vehicle.
+
+        - update(vehicle: Vehicle, **changes) -> None:
+            Assigns the given attributes (validated as usual) and re-ranks the vehicle.
+
+        - apply(event: ChangeEvent) -> None / consume(events: Iterable[ChangeEvent]) -> Vehicle:
+            Applies change events.
+
+        - best() -> Vehicle:
+            Returns the current best vehicle, None when the fleet is empty.
+
+        - top(k: int) -> list[Vehicle]:
+            Returns the k best vehicles, best first, in O(k log n).
+
+    """
+
+    def __init__(self, vehicles=()) -> None:
+        self._arrivals = count()
+        self._versions = count()
+        # vehicle -> (distance, arrival position, version) of its live heap entry
+        self._keys = {}
+        # Entries are (-distance, -arrival position, version, vehicle): the heap root is the best vehicle. The
+        # version tells the live entry of a vehicle from its outdated ones, even when a vehicle goes back to a
+        # previous distance; versions are unique so vehicles are never compared.
+        self._heap = []
+        for vehicle in vehicles:
+            self._check_new(vehicle)
+            key = self._keys[vehicle] = (vehicle.compute_maximal_distance(), next(self._arrivals),
+                                         next(self._versions))
+            self._heap.append(self._entry(vehicle, key))
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, vehicle) -> bool:
+        return vehicle in self._keys
+
+    def _check_new(self, vehicle) -> None:
+        if not isinstance(vehicle, Vehicle):
+            raise TypeError("Only vehicles can be tracked.")
+        if vehicle in self._keys:
+            raise ValueError("The vehicle is already in the fleet, use update() after changing it.")
+
+    @staticmethod
+    def _entry(vehicle, key) -> tuple:
+        distance, position, version = key
+        return -distance, -position, version, vehicle
+
+    def _is_live(self, entry) -> bool:
+        key = self._keys.get(entry[3])
+        return key is not None and key[2] == entry[2]
+
+    def _push(self, vehicle, distance: int, position: int) -> None:
+        key = self._keys[vehicle] = (distance, position, next(self._versions))
+        heapq.heappush(self._heap, self._entry(vehicle, key))
+        self._compact()
+
+    def _compact(self) -> None:
+        if len(self._heap) > 2 * len(self._keys) + 16:
+            self._heap = [self._entry(vehicle, key) for vehicle, key in self._keys.items()]
+            heapq.heapify(self._heap)
+
+    def _discard_stale_top(self) -> None:
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+
+    def add(self, vehicle: Vehicle) -> None:
+        self._check_new(vehicle)
+        self._push(vehicle, vehicle.compute_maximal_distance(), next(self._arrivals))
+
+    def retire(self, vehicle: Vehicle) -> None:
+        """
+        Removes a vehicle; its heap entry becomes outdated and is dropped lazily.
+        :raises KeyError: when the vehicle is not in the fleet
+        """
+        del self._keys[vehicle]
+        self._discard_stale_top()
+        self._compact()
+
+    def update(self, vehicle: Vehicle, **changes) -> None:
+        """
+        Re-ranks a vehicle after a change, e.g. update(car, technical_inspection=False) or
+        update(bike, consumption=4). Without changes, the vehicle is assumed to have been modified in place.
+        :raises KeyError: when the vehicle is not in the fleet
+        :raises TypeError, ValueError: when a change is rejected by the vehicle's validation; the changes
+            assigned before it are kept, and the vehicle is re-ranked with them
+        """
+        distance, position, _ = self._keys[vehicle]
+        try:
+            for name, value in changes.items():
+                setattr(vehicle, name, value)
+        finally:
+            # Re-ranked even when a change fails, as the previous ones are already applied.
+            new_distance = vehicle.compute_maximal_distance()
+            if new_distance != distance:
+                self._push(vehicle, new_distance, position)
+
+    def apply(self, event: ChangeEvent) -> None:
+        action, vehicle, changes = event
+        if action == 'add':
+            self.add(vehicle)
+        elif action == 'retire':
+            self.retire(vehicle)
+        elif action == 'update':
+            self.update(vehicle, **(changes or {}))
+        else:
+            raise ValueError(f"Unknown change action {action!r}, expected one of {ACTIONS}.")
+
+    def consume(self, events):
+        """
+        Applies a stream of change events in order.
+        :param events: an iterable of ChangeEvent (or (action, vehicle[, changes]) tuples)
+        :return: the best vehicle after the last event
+        """
+        for event in events:
+            self.apply(ChangeEvent(*event))
+        return self.best()
+
+    def best(self):
+        """
+        :return: the vehicle with the highest autonomy, the latest arrival on equal distance, as folding the fleet
+            with find_best_vehicle would return it; None when the fleet is empty
+        """
+        self._discard_stale_top()
+        return self._heap[0][3] if self._heap else None
+
+    def top(self, k: int) -> list:
+        """
+        :param k: the number of vehicles to return
+        :return: the k vehicles with the highest autonomy, best first, as find_best_vehicles ranks the fleet
+        """
+        validate_positive_int('k', k)
+        heap = self._heap
+        popped = []
+        result = []
+        while heap and len(result) < k:
+            entry = heapq.heappop(heap)
+            if self._is_live(entry):
+                popped.append(entry)
+                result.append(entry[3])
+        # Only the live entries go back, the outdated ones met on the way are dropped for good.
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return result
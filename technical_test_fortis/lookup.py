@@ -0,0 +1,143 @@
+from bisect import bisect_right
+
+import numpy as np
+
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import BIKE, CAR, VehicleFleet
+
+
+
+def year_edges(rules=Car.DISTANCE_RULES) -> tuple:
+    """
+    Splits the years into buckets sharing the same bracket, e.g. (2000, 2011) for Car's brackets: before 2000,
+    2000 to 2010 and after 2010.
+    :param rules: the DistanceRules of the cars
+    :return: the sorted first years of the buckets after the first one
+    :raises ValueError: if a bracket depends on another attribute than the year
+    """
+    edges = set()
+    for bracket in rules.brackets:
+        if bracket.attribute != 'year':
+            raise ValueError(f"Only year brackets can be tabulated, not {bracket.attribute!r} ones.")
+        # A bracket applies from lower + 1 and stops applying from upper.
+        if bracket.lower is not None:
+            edges.add(bracket.lower + 1)
+        if bracket.upper is not None:
+            edges.add(bracket.upper)
+    # Years are positive: an edge at 1 or below does not split them.
+    return tuple(sorted(edge for edge in edges if edge > 1))
+
+
+def year_buckets(years, edges: tuple):
+    """
+    :param years: an array of years
+    :param edges: the bucket edges returned by year_edges()
+    :return: the year bucket index of each year
+    """
+    return np.searchsorted(edges, years, side='right')
+
+
+class DistanceTable:
+    """
+
+    This class precomputes the maximal distances of cars and bikes over bounded input domains, so that a distance
+    is a direct table lookup instead of a division and a floating point scaling.
+
+    A car's distance only depends on (tank_size, consumption, year bucket, technical_inspection) and a bike's on
+    (consumption, saddle_comfort). The year buckets are derived from the brackets of Car.DISTANCE_RULES. The tables are filled by the regular vectorized computation, so their values
+    are bit-identical to compute_maximal_distance(), including the rounding of the 0.9 and 1.1 factors.
+    Vehicles outside the configured domains fall back to the arithmetic path.
+
+    Attributes:
+        - tank_sizes (range): The tank sizes covered by the car table.
+        - consumptions (range): The consumptions covered by the car and bike tables.
+        - year_edges (tuple[int]): The first years of the year buckets after the first one, see year_edges().
+        - car_table (np.ndarray[int64]): The car distances, indexed by [tank_size, consumption, year bucket]
+          relative to the domain starts, for cars that passed their technical inspection.
+        - bike_table (np.ndarray[int64]): The bike distances, indexed by [consumption, saddle_comfort].
+
+    Methods:
+        - distance(vehicle: Vehicle) -> int:
+            Scalar lookup, equal to vehicle.compute_maximal_distance().
+
+        - distances(fleet: VehicleFleet) -> np.ndarray:
+            Columnar lookup, equal to fleet.compute_maximal_distances().
+
+    """
+
+    def __init__(self, tank_sizes: range = range(0, 101), consumptions: range = range(1, 51)) -> None:
+        for name, domain in (('tank_sizes', tank_sizes), ('consumptions', consumptions)):
+            if not isinstance(domain, range) or domain.step != 1 or len(domain) == 0:
+                raise ValueError(f"{name} must be a non-empty range with a step of 1.")
+        if tank_sizes.start < 0:
+            raise ValueError("The tank sizes must be non-negative.")
+        if consumptions.start < 1:
+            raise ValueError("The consumptions must be positive.")
+        self.tank_sizes = tank_sizes
+        self.consumptions = consumptions
+        self.year_edges = year_edges(Car.DISTANCE_RULES)
+
+        # A year of each bucket: the one before the first edge, then the edges themselves.
+        bucket_years = [self.year_edges[0] - 1, *self.year_edges] if self.year_edges else [1]
+        tank_size, consumption, year = np.meshgrid(np.arange(tank_sizes.start, tank_sizes.stop),
+                                                   np.arange(consumptions.start, consumptions.stop),
+                                                   bucket_years, indexing='ij')
+        size = tank_size.size
+        cars = VehicleFleet(np.full(size, CAR), year.ravel(), tank_size.ravel(), consumption.ravel(),
+                            np.ones(size, dtype=bool), np.zeros(size, dtype=bool))
+        self.car_table = cars.compute_maximal_distances().reshape(tank_size.shape)
+
+        consumption, saddle_comfort = np.meshgrid(np.arange(consumptions.start, consumptions.stop), [False, True],
+                                                  indexing='ij')
+        size = consumption.size
+        bikes = VehicleFleet(np.full(size, BIKE), np.full(size, 2005), np.zeros(size), consumption.ravel(),
+                             np.zeros(size, dtype=bool), saddle_comfort.ravel())
+        self.bike_table = bikes.compute_maximal_distances().reshape(consumption.shape)
+
+    def distance(self, vehicle) -> int:
+        """
+        :param vehicle: a Car or a Bike
+        :return: the maximal distance of the vehicle, read from the tables when it is inside their domains
+        """
+        consumption = vehicle.consumption
+        if isinstance(vehicle, Car):
+            if not vehicle.technical_inspection:
+                return 0
+            tank_size = vehicle.tank_size
+            if tank_size in self.tank_sizes and consumption in self.consumptions:
+                return int(self.car_table[tank_size - self.tank_sizes.start, consumption - self.consumptions.start,
+                                          bisect_right(self.year_edges, vehicle.year)])
+        elif isinstance(vehicle, Bike):
+            if consumption in self.consumptions:
+                return int(self.bike_table[consumption - self.consumptions.start, int(vehicle.saddle_comfort)])
+        return vehicle.compute_maximal_distance()
+
+    def distances(self, fleet: VehicleFleet) -> np.ndarray:
+        """
+        :param fleet: the vehicles to evaluate
+        :return: the maximal distance of every vehicle, as fleet.compute_maximal_distances() would return it
+        """
+        consumption_index = fleet.consumption - self.consumptions.start
+        tank_index = fleet.tank_size - self.tank_sizes.start
+        is_car = fleet.kind == CAR
+        in_consumptions = (consumption_index >= 0) & (consumption_index < len(self.consumptions))
+        in_tank_sizes = (tank_index >= 0) & (tank_index < len(self.tank_sizes))
+        in_domain = in_consumptions & (in_tank_sizes | ~is_car)
+
+        # Indices are clipped so that every row can be gathered in one pass; the rows outside the domains are
+        # overwritten below.
+        consumption_index = np.clip(consumption_index, 0, len(self.consumptions) - 1)
+        tank_index = np.clip(tank_index, 0, len(self.tank_sizes) - 1)
+        car_index = (tank_index * len(self.consumptions) + consumption_index) * self.car_table.shape[2]
+        car_distance = self.car_table.ravel().take(car_index + year_buckets(fleet.year, self.year_edges))
+        car_distance[~fleet.technical_inspection] = 0
+        bike_distance = self.bike_table.ravel().take(consumption_index * 2 + fleet.saddle_comfort)
+        result = np.where(is_car, car_distance, bike_distance)
+
+        outside = np.flatnonzero(~in_domain)
+        if len(outside):
+            result[outside] = VehicleFleet(fleet.kind[outside], fleet.year[outside], fleet.tank_size[outside],
+                                           fleet.consumption[outside], fleet.technical_inspection[outside],
+                                           fleet.saddle_comfort[outside]).compute_maximal_distances()
+        return result
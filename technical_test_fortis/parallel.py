@@ -0,0 +1,162 @@
+"""
+Parallel evaluation of a columnar fleet with a process pool.
+
+The fleet is copied once into a multiprocessing.shared_memory block using the binary record layout of
+technical_test_fortis.binary, widened to int64 integers so that any VehicleFleet can be shared. Workers attach to the block by name and evaluate a contiguous chunk of records;
+only chunk boundaries and per-chunk (distance, index) candidates travel between processes, never vehicles.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from technical_test_fortis.binary import MappedFleet, fleet_to_records
+from technical_test_fortis.fleet import VehicleFleet, top_k_positions
+from technical_test_fortis.vehicle import validate_positive_int
+
+# The fields of binary.RECORD_DTYPE with the int64 columns of a VehicleFleet, rather than the file's int32.
+SHARED_RECORD_DTYPE = np.dtype([
+    ('kind', 'u1'),
+    ('flags', 'u1'),
+    ('year', '<i8'),
+    ('tank_size', '<i8'),
+    ('consumption', '<i8'),
+])
+
+
+class SharedFleet:
+    """
+
+    A fleet stored in a shared memory block: the records followed by an int64 distance per vehicle.
+    Use it as a context manager, the block is released and unlinked on exit.
+
+    Attributes:
+        - name (str): The name of the shared memory block, used by workers to attach to it.
+        - count (int): The number of vehicles in the fleet.
+        - fleet (MappedFleet): A view on the shared records.
+        - distances (np.ndarray[int64]): A view on the shared distances, filled by evaluate_fleet().
+
+    """
+
+    def __init__(self, fleet: VehicleFleet) -> None:
+        records = fleet_to_records(fleet, SHARED_RECORD_DTYPE)
+        self.count = len(records)
+        # A zero-sized block is not allowed.
+        self._memory = shared_memory.SharedMemory(create=True, size=max(_block_size(self.count), 1))
+        self.name = self._memory.name
+        self.fleet, self.distances = _views(self._memory, self.count)
+        self.fleet.records[:] = records
+
+    def close(self) -> None:
+        # The views must be released before the underlying buffer can be closed.
+        self.fleet = self.distances = None
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self) -> 'SharedFleet':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _block_size(count: int) -> int:
+    return count * (SHARED_RECORD_DTYPE.itemsize + np.dtype(np.int64).itemsize)
+
+
+def _views(memory: shared_memory.SharedMemory, count: int):
+    records = np.ndarray((count,), dtype=SHARED_RECORD_DTYPE, buffer=memory.buf)
+    distances = np.ndarray((count,), dtype=np.int64, buffer=memory.buf,
+                           offset=count * SHARED_RECORD_DTYPE.itemsize)
+    return MappedFleet(records), distances
+
+
+def _evaluate_range(fleet: MappedFleet, distances: np.ndarray, start: int, stop: int, k: int):
+    """
+    Computes the distances of the records [start, stop) into the shared distances and returns the range's
+    top-k candidates as (distances, global indices).
+    """
+    chunk_distances = distances[start:stop]
+    chunk_distances[:] = MappedFleet(fleet.records[start:stop]).compute_maximal_distances()
+    positions = top_k_positions(chunk_distances, k)
+    return chunk_distances[positions], positions + start
+
+
+def _evaluate_chunk(name: str, count: int, start: int, stop: int, k: int):
+    # Worker task. The views on the block are temporaries, released before the block is closed.
+    # Pool workers share the resource tracker of the parent, which unlinks the block, so attaching here does
+    # not leak it.
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        return _evaluate_range(*_views(memory, count), start, stop, k)
+    finally:
+        memory.close()
+
+
+def merge_top_k(distances: np.ndarray, indices: np.ndarray, k: int) -> np.ndarray:
+    """
+    Merges top-k candidates coming from several chunks.
+    :param distances: the distances of the candidates
+    :param indices: the global positions of the candidates in the fleet
+    :param k: the number of positions to keep
+    :return: the k best global positions, best first, the later position winning on equal distance
+    """
+    order = np.lexsort((indices, distances))[::-1][:k]
+    return indices[order]
+
+
+def _chunk_bounds(count: int, workers: int, chunk_size):
+    if chunk_size is None:
+        # A few chunks per worker smooths out uneven workers without much scheduling overhead.
+        chunk_size = max(1, -(-count // (workers * 4)))
+    return [(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+
+
+def _check_workers(workers):
+    if workers is None:
+        return os.cpu_count() or 1
+    validate_positive_int('workers', workers)
+    return workers
+
+
+def evaluate_fleet(fleet: VehicleFleet, k: int = 1, workers: int = None, chunk_size: int = None):
+    """
+    Computes the maximal distances of a fleet and its k best vehicles with a pool of worker processes.
+    :param fleet: the fleet to evaluate
+    :param k: the number of best positions to return
+    :param workers: the number of worker processes, defaults to the number of CPUs
+    :param chunk_size: the number of vehicles per task, defaults to a quarter of a worker's share
+    :return: a tuple (distances, best positions), equal to (fleet.compute_maximal_distances(),
+        fleet.find_best_indices(k))
+    """
+    validate_positive_int('k', k)
+    workers = _check_workers(workers)
+    if chunk_size is not None:
+        validate_positive_int('chunk_size', chunk_size)
+
+    with SharedFleet(fleet) as shared:
+        bounds = _chunk_bounds(shared.count, workers, chunk_size)
+        if workers == 1:
+            results = [_evaluate_range(shared.fleet, shared.distances, start, stop, k) for start, stop in bounds]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_evaluate_chunk, shared.name, shared.count, start, stop, k)
+                           for start, stop in bounds]
+                results = [future.result() for future in futures]
+
+        distances = shared.distances.copy()
+
+    if not results:
+        return distances, np.empty(0, dtype=np.int64)
+    candidate_distances = np.concatenate([chunk_distances for chunk_distances, _ in results])
+    candidate_indices = np.concatenate([indices for _, indices in results])
+    return distances, merge_top_k(candidate_distances, candidate_indices, k)
+
+
+def parallel_find_best_indices(fleet: VehicleFleet, k: int = 1, workers: int = None,
+                               chunk_size: int = None) -> np.ndarray:
+    """
+    Parallel counterpart of VehicleFleet.find_best_indices, with the same tie-breaking rule.
+    """
+    return evaluate_fleet(fleet, k, workers, chunk_size)[1]
@@ -0,0 +1,229 @@
+"""
+Thread-safe fleet registry publishing immutable copy-on-write snapshots.
+
+Writers serialize on a lock, apply their changes to copies of the affected vehicles and publish a new
+FleetSnapshot by replacing a single reference. Readers never lock: registry.snapshot() is one attribute read,
+and the snapshot it returns never changes afterwards, so a reader always sees a consistent fleet, never a
+half-updated vehicle, however long it keeps the snapshot.
+
+The registry owns its vehicles: added vehicles are copied, and the vehicles of a snapshot must be treated as
+read-only. Changes go through update(), which copies the vehicle before modifying it.
+"""
+import copy
+import heapq
+import threading
+from contextlib import contextmanager
+from itertools import count
+
+from technical_test_fortis.vehicle import validate_positive_int
+
+_UNSET = object()
+
+
+class FleetSnapshot:
+    """
+
+    This class is an immutable, versioned view of a fleet.
+
+    Attributes:
+        - version (int): The number of transactions published before this snapshot.
+        - ids (tuple[int]): The registry ids of the vehicles, in arrival order.
+        - vehicles (tuple[Vehicle]): The vehicles, in the same order.
+        - distances (tuple[int]): Their maximal distances, in the same order.
+
+    Methods:
+        - get(vehicle_id: int) -> Vehicle / distance(vehicle_id: int) -> int:
+            Looks a vehicle up by id.
+
+        - best() -> Vehicle:
+            Returns the best vehicle, computed on the first call and cached.
+
+        - top(k: int) -> list[Vehicle]:
+            Returns the k best vehicles, best first.
+
+    Vehicles are ranked as find_best_vehicles ranks them in arrival order: the later vehicle wins on equal
+    distance; an updated vehicle keeps its arrival position.
+
+    """
+    __slots__ = ('version', 'ids', 'vehicles', 'distances', '_positions', '_best')
+
+    def __init__(self, version: int, ids: tuple, vehicles: tuple, distances: tuple, positions: dict = None) -> None:
+        self.version = version
+        self.ids = ids
+        self.vehicles = vehicles
+        self.distances = distances
+        # id -> position; never modified once published, so snapshots with the same ids share it.
+        self._positions = {vehicle_id: position for position, vehicle_id in enumerate(ids)} \
+            if positions is None else positions
+        self._best = _UNSET
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.vehicles)
+
+    def __contains__(self, vehicle_id) -> bool:
+        return vehicle_id in self._positions
+
+    def get(self, vehicle_id: int):
+        return self.vehicles[self._positions[vehicle_id]]
+
+    def distance(self, vehicle_id: int) -> int:
+        return self.distances[self._positions[vehicle_id]]
+
+    def best(self):
+        """
+        :return: the vehicle with the highest autonomy, None when the fleet is empty
+        """
+        best = self._best
+        if best is _UNSET:
+            # Readers racing on the first call compute and store the same vehicle, no lock is needed.
+            best = None
+            if self.distances:
+                _, position = max(zip(self.distances, range(len(self.distances))))
+                best = self.vehicles[position]
+            self._best = best
+        return best
+
+    def top(self, k: int) -> list:
+        validate_positive_int('k', k)
+        return [self.vehicles[position]
+                for _, position in heapq.nlargest(k, zip(self.distances, range(len(self.distances))))]
+
+
+class FleetTransaction:
+    """
+
+    The changes of a writer, applied to a draft of the current snapshot and published all at once by
+    FleetRegistry.transaction().
+
+    Methods:
+        - add(vehicle: Vehicle) -> int:
+            Adds a copy of the vehicle and returns its id.
+
+        - remove(vehicle_id: int) -> None:
+            Removes a vehicle.
+
+        - update(vehicle_id: int, **changes) -> Vehicle:
+            Assigns attributes to a copy of the vehicle (validated as usual) and returns the copy.
+
+        - get(vehicle_id: int) -> Vehicle:
+            Returns the draft version of a vehicle.
+
+    """
+
+    def __init__(self, snapshot: FleetSnapshot, ids) -> None:
+        self._next_id = ids
+        # The ids and positions are shared with the snapshot until a vehicle is added or removed.
+        self._ids = snapshot.ids
+        self._positions = snapshot._positions
+        self._vehicles = list(snapshot.vehicles)
+        self._distances = list(snapshot.distances)
+        # ids of the vehicles already copied by this transaction, which can be modified in place
+        self._drafts = set()
+        self.changed = False
+
+    def _position(self, vehicle_id: int) -> int:
+        if vehicle_id not in self._positions:
+            raise KeyError(vehicle_id)
+        return self._positions[vehicle_id]
+
+    def get(self, vehicle_id: int):
+        return self._vehicles[self._position(vehicle_id)]
+
+    def _own_ids(self) -> None:
+        if isinstance(self._ids, tuple):
+            self._ids = list(self._ids)
+            self._positions = dict(self._positions)
+
+    def add(self, vehicle) -> int:
+        vehicle = copy.copy(vehicle)
+        vehicle_id = next(self._next_id)
+        self._own_ids()
+        self._positions[vehicle_id] = len(self._ids)
+        self._ids.append(vehicle_id)
+        self._vehicles.append(vehicle)
+        self._distances.append(vehicle.compute_maximal_distance())
+        self._drafts.add(vehicle_id)
+        self.changed = True
+        return vehicle_id
+
+    def remove(self, vehicle_id: int) -> None:
+        position = self._position(vehicle_id)
+        self._own_ids()
+        del self._ids[position], self._vehicles[position], self._distances[position]
+        self._positions = {vehicle_id: index for index, vehicle_id in enumerate(self._ids)}
+        self._drafts.discard(vehicle_id)
+        self.changed = True
+
+    def update(self, vehicle_id: int, **changes):
+        position = self._position(vehicle_id)
+        vehicle = self._vehicles[position]
+        if vehicle_id not in self._drafts:
+            # Copy on write: the published vehicle is never modified.
+            vehicle = copy.copy(vehicle)
+        for name, value in changes.items():
+            setattr(vehicle, name, value)
+        self._vehicles[position] = vehicle
+        self._distances[position] = vehicle.compute_maximal_distance()
+        self._drafts.add(vehicle_id)
+        self.changed = True
+        return vehicle
+
+    def snapshot(self, version: int) -> FleetSnapshot:
+        if isinstance(self._ids, tuple):
+            return FleetSnapshot(version, self._ids, tuple(self._vehicles), tuple(self._distances), self._positions)
+        return FleetSnapshot(version, tuple(self._ids), tuple(self._vehicles), tuple(self._distances))
+
+
+class FleetRegistry:
+    """
+
+    This class holds the current snapshot of a fleet shared between threads.
+
+    Methods:
+        - snapshot() -> FleetSnapshot:
+            Returns the current snapshot, without locking.
+
+        - transaction() -> ContextManager[FleetTransaction]:
+            Groups changes into one published snapshot; nothing is published if the block raises.
+
+        - add(vehicle: Vehicle) -> int / remove(vehicle_id: int) -> None / update(vehicle_id: int, **changes):
+            Single-change transactions.
+
+    """
+
+    def __init__(self, vehicles=()) -> None:
+        self._lock = threading.Lock()
+        self._ids = count()
+        self._snapshot = FleetSnapshot(0, (), (), ())
+        if vehicles:
+            with self.transaction() as transaction:
+                for vehicle in vehicles:
+                    transaction.add(vehicle)
+
+    def snapshot(self) -> FleetSnapshot:
+        return self._snapshot
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            current = self._snapshot
+            transaction = FleetTransaction(current, self._ids)
+            yield transaction
+            if transaction.changed:
+                # Publishing is a single reference assignment, atomic for the readers.
+                self._snapshot = transaction.snapshot(current.version + 1)
+
+    def add(self, vehicle) -> int:
+        with self.transaction() as transaction:
+            return transaction.add(vehicle)
+
+    def remove(self, vehicle_id: int) -> None:
+        with self.transaction() as transaction:
+            transaction.remove(vehicle_id)
+
+    def update(self, vehicle_id: int, **changes):
+        with self.transaction() as transaction:
+            return transaction.update(vehicle_id, **changes)
@@ -0,0 +1,199 @@
+"""
+Vectorized what-if evaluation of a VehicleFleet under several scenarios at once.
+
+A Scenario changes the fleet's columns (overrides set a value, deltas shift it, e.g. every car failing its
+inspection or every consumption improving by 1) and/or the distance rules (e.g. moved year brackets, built with
+DistanceRules.replace). The fleet is evaluated as a (scenarios x vehicles) grid: every column becomes a
+two-dimensional array, a zero-copy broadcast view for the columns no scenario touches, and the batch kernels
+compiled from the rules compute the whole grid in one call per distinct set of rules. No vehicle object is
+copied or built, except the ones asked for.
+
+evaluate_scenarios() reduces the grid to a ScenarioResult per scenario, chunk by chunk, so its memory is
+O(scenarios x chunk_size) whatever the size of the fleet; scenario_distances() returns the full grid.
+"""
+from collections import namedtuple
+from types import SimpleNamespace
+
+import numpy as np
+
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import BIKE, CAR, INT64_MAX, INT64_MIN
+from technical_test_fortis.rules import DistanceRules
+from technical_test_fortis.vehicle import validate_positive_int
+
+# name: a label for the results
+# overrides: a mapping of column names to the value every vehicle gets
+# deltas: a mapping of integer column names to the amount added to every vehicle's value, applied after the
+#     overrides and clamped to the column's minimum valid value (e.g. a consumption of at least 1); a value
+#     shifted beyond the int64 range raises a ValueError
+# vehicle_type: Car or Bike to apply the overrides and deltas to that type only, None for every vehicle
+# car_rules, bike_rules: DistanceRules replacing Car.DISTANCE_RULES or Bike.DISTANCE_RULES
+Scenario = namedtuple('Scenario', ['name', 'overrides', 'deltas', 'vehicle_type', 'car_rules', 'bike_rules'],
+                      defaults=(None, None, None, None, None))
+
+# best: the position of the best vehicle in the fleet, the later one on equal distance, -1 for an empty fleet
+# best_distance: its maximal distance, None for an empty fleet
+# total, mean: the sum and the mean of the maximal distances (mean is None for an empty fleet)
+# stranded: the number of vehicles with a maximal distance of 0
+ScenarioResult = namedtuple('ScenarioResult', ['name', 'best', 'best_distance', 'total', 'mean', 'stranded'])
+
+# The columns a scenario can change, with the minimum valid value of the integer ones (None for booleans).
+COLUMNS = {'year': 1, 'tank_size': 0, 'consumption': 1, 'technical_inspection': None, 'saddle_comfort': None}
+
+_TYPES = ((CAR, Car, 'car_rules'), (BIKE, Bike, 'bike_rules'))
+
+
+def _check_scenario(scenario) -> None:
+    if not isinstance(scenario, Scenario):
+        raise TypeError("Scenarios must be of type Scenario.")
+    for column, value in (scenario.overrides or {}).items():
+        if column not in COLUMNS:
+            raise ValueError(f"Unknown column {column!r}, expected one of {tuple(COLUMNS)}.")
+        minimum = COLUMNS[column]
+        if minimum is None:
+            if not isinstance(value, bool):
+                raise TypeError(f"The {column} override must be a boolean value.")
+        elif isinstance(value, bool) or not isinstance(value, int):
+            raise TypeError(f"The {column} override must be of type int.")
+        elif not minimum <= value <= INT64_MAX:
+            raise ValueError(f"The {column} override must be between {minimum} and {INT64_MAX}.")
+    for column, delta in (scenario.deltas or {}).items():
+        if COLUMNS.get(column) is None:
+            raise ValueError(f"Only the integer columns can be shifted, not {column!r}.")
+        if isinstance(delta, bool) or not isinstance(delta, int):
+            raise TypeError(f"The {column} delta must be of type int.")
+        if not INT64_MIN <= delta <= INT64_MAX:
+            raise ValueError(f"The {column} delta must fit in a 64-bit integer.")
+    if scenario.vehicle_type not in (None, Car, Bike):
+        raise TypeError("vehicle_type must be Car, Bike or None.")
+    for rules in (scenario.car_rules, scenario.bike_rules):
+        if rules is not None and not isinstance(rules, DistanceRules):
+            raise TypeError("Scenario rules must be of type DistanceRules.")
+
+
+def _scenario_columns(fleet, scenarios: list, start: int, stop: int) -> SimpleNamespace:
+    """
+    :return: the fleet's columns from start to stop as (scenarios, vehicles) arrays, with the scenarios' changes
+    """
+    kind = fleet.kind[start:stop]
+    shape = (len(scenarios), len(kind))
+    columns = SimpleNamespace(kind=np.broadcast_to(kind, shape))
+    for column, minimum in COLUMNS.items():
+        values = getattr(fleet, column)[start:stop]
+        touched = [row for row, scenario in enumerate(scenarios)
+                   if column in (scenario.overrides or {}) or column in (scenario.deltas or {})]
+        if not touched:
+            setattr(columns, column, np.broadcast_to(values, shape))
+            continue
+        # A MappedFleet stores int32 columns: the grid is int64 so that overrides and deltas cannot wrap around.
+        grid = np.tile(values if minimum is None else values.astype(np.int64), (len(scenarios), 1))
+        for row in touched:
+            scenario = scenarios[row]
+            selected = slice(None) if scenario.vehicle_type is None else \
+                kind == (CAR if scenario.vehicle_type is Car else BIKE)
+            if column in (scenario.overrides or {}):
+                grid[row, selected] = scenario.overrides[column]
+            if column in (scenario.deltas or {}):
+                grid[row, selected] = _shift(grid[row, selected], scenario.deltas[column], minimum, column)
+        setattr(columns, column, grid)
+    return columns
+
+
+def _shift(values: np.ndarray, delta: int, minimum: int, column: str) -> np.ndarray:
+    """
+    :return: max(values + delta, minimum), computed without wrapping around the int64 range
+    :raises ValueError: if a shifted value exceeds the int64 range
+    """
+    if delta >= 0:
+        if len(values) and int(values.max()) > INT64_MAX - delta:
+            raise ValueError(f"The {column} delta takes values beyond the int64 range.")
+        return np.maximum(values + delta, minimum)
+    # max(values + delta, minimum) == max(values, minimum - delta) + delta, which cannot go below minimum.
+    floor = minimum - delta
+    if floor > INT64_MAX:
+        return np.full(len(values), minimum, dtype=np.int64)
+    return np.maximum(values, floor) + delta
+
+
+def _rules(scenario, attribute: str, vehicle_class) -> DistanceRules:
+    rules = getattr(scenario, attribute)
+    return vehicle_class.DISTANCE_RULES if rules is None else rules
+
+
+def _grid(fleet, scenarios: list, kernels: dict, start: int, stop: int) -> np.ndarray:
+    """
+    :param kernels: the batch kernels compiled so far, by repr of their rules
+    :return: the int64 (scenarios, vehicles) array of the maximal distances from start to stop
+    """
+    # Scenarios sharing their rules are evaluated together, by one kernel call per vehicle type.
+    groups = {}
+    for row, scenario in enumerate(scenarios):
+        key = tuple(repr(_rules(scenario, attribute, vehicle_class)) for _, vehicle_class, attribute in _TYPES)
+        groups.setdefault(key, []).append(row)
+
+    distances = np.zeros((len(scenarios), stop - start), dtype=np.int64)
+    for key, rows in groups.items():
+        group = [scenarios[row] for row in rows]
+        columns = _scenario_columns(fleet, group, start, stop)
+        result = np.zeros((len(rows), stop - start), dtype=np.int64)
+        for (kind, vehicle_class, attribute), rules_key in zip(_TYPES, key):
+            if rules_key not in kernels:
+                kernels[rules_key] = _rules(group[0], attribute, vehicle_class).compile_batch()
+            result = np.where(columns.kind == kind, kernels[rules_key](columns), result)
+        distances[rows] = result
+    return distances
+
+
+def scenario_distances(fleet, scenarios) -> np.ndarray:
+    """
+    :param fleet: a VehicleFleet
+    :param scenarios: an iterable of Scenario
+    :return: the int64 (scenarios, vehicles) array of the maximal distance of every vehicle in every scenario
+    """
+    scenarios = list(scenarios)
+    for scenario in scenarios:
+        _check_scenario(scenario)
+    return _grid(fleet, scenarios, {}, 0, len(fleet))
+
+
+def evaluate_scenarios(fleet, scenarios, chunk_size: int = 65536) -> list:
+    """
+    Evaluates the fleet under every scenario, chunk_size vehicles at a time.
+    :param fleet: a VehicleFleet
+    :param scenarios: an iterable of Scenario
+    :param chunk_size: the number of vehicles evaluated at a time
+    :return: a ScenarioResult per scenario, in the same order; fleet.vehicle(result.best) rebuilds the best
+        vehicle as stored in the fleet, before the scenario's changes
+    """
+    validate_positive_int('chunk_size', chunk_size)
+    scenarios = list(scenarios)
+    for scenario in scenarios:
+        _check_scenario(scenario)
+
+    count = len(scenarios)
+    best = np.full(count, -1, dtype=np.int64)
+    best_distance = np.full(count, -1, dtype=np.int64)
+    total = np.zeros(count, dtype=np.int64)
+    stranded = np.zeros(count, dtype=np.int64)
+    kernels = {}
+    for start in range(0, len(fleet), chunk_size):
+        stop = min(start + chunk_size, len(fleet))
+        distances = _grid(fleet, scenarios, kernels, start, stop)
+        # The last maximum of each row, as the later vehicle wins on equal distance.
+        chunk_best = (stop - 1) - np.argmax(distances[:, ::-1], axis=1)
+        chunk_best_distance = distances[np.arange(count), chunk_best - start]
+        # A later chunk also wins on equal distance.
+        improved = chunk_best_distance >= best_distance
+        best = np.where(improved, chunk_best, best)
+        best_distance = np.where(improved, chunk_best_distance, best_distance)
+        total += distances.sum(axis=1)
+        stranded += np.count_nonzero(distances == 0, axis=1)
+
+    results = []
+    for row, scenario in enumerate(scenarios):
+        empty = not len(fleet)
+        results.append(ScenarioResult(scenario.name, int(best[row]), None if empty else int(best_distance[row]),
+                                      int(total[row]), None if empty else int(total[row]) / len(fleet),
+                                      int(stranded[row])))
+    return results
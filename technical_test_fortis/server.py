@@ -0,0 +1,339 @@
+"""
+Asyncio JSON-lines query server answering "which vehicle goes furthest".
+
+Each request is one JSON object per line, answered by one JSON object per line carrying the same 'id':
+
+    {"id": 1, "vehicles": [{"type": "car", "year": 2005, ...}, ...], "k": 2}
+    {"id": 2, "fleet": "north"}
+    {"id": 3, "stats": true}
+
+'vehicles' holds records in the format of technical_test_fortis.ingest, 'fleet' names a fleet registered on the
+server. The answer holds the k best vehicles ('top', best first, as position, distance and record) and 'best',
+the first of them, with find_best_vehicle's rule that the later vehicle wins on equal distance.
+
+Concurrent requests, from one or several connections, are coalesced into micro-batches: a batch is closed when it
+reaches max_batch_size requests or batch_window seconds after its first request, and all its vehicle specs are
+evaluated with a single vectorized distance pass.
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+from technical_test_fortis.fleet import INT64_MAX, INT64_MIN, VehicleFleet, top_k_positions
+from technical_test_fortis.ingest import read_vehicles, record_from_vehicle, vehicle_from_record
+from technical_test_fortis.vehicle import validate_positive_int
+
+# The longest request line accepted, in bytes: asyncio's default of 64 KiB is about 700 vehicle specs.
+STREAM_LIMIT = 2 ** 24
+
+
+class LatencyRecorder:
+    """
+
+    Keeps the latencies of the most recent requests to report percentiles.
+
+    Attributes:
+        - count (int): The number of latencies recorded since the start.
+        - window (deque): The most recent latencies in seconds, at most window_size of them.
+
+    """
+
+    def __init__(self, window_size: int = 10000) -> None:
+        self.count = 0
+        self.window = deque(maxlen=window_size)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.window.append(seconds)
+
+    def percentile(self, percent: float):
+        """
+        :param percent: the percentile to compute, between 0 and 100
+        :return: the percentile of the recent latencies in seconds, None before the first request
+        """
+        if not self.window:
+            return None
+        return float(np.percentile(np.fromiter(self.window, dtype=float), percent))
+
+
+class _PendingRequest:
+    __slots__ = ('vehicles', 'fleet', 'k', 'future', 'arrival')
+
+    def __init__(self, vehicles, fleet, k, future, arrival):
+        self.vehicles = vehicles
+        self.fleet = fleet
+        self.k = k
+        self.future = future
+        self.arrival = arrival
+
+
+class MicroBatcher:
+    """
+
+    Coalesces concurrent best-vehicle queries into batches evaluated with one vectorized pass.
+
+    Attributes:
+        - fleets (dict): The registered VehicleFleet objects, by name.
+        - batch_window (float): The number of seconds a batch stays open after its first request.
+        - max_batch_size (int): The maximal number of requests per batch.
+        - batches (int): The number of batches evaluated so far.
+        - latencies (LatencyRecorder): The latencies of the answered requests, from submission to answer.
+
+    Methods:
+        - submit(vehicles: list[Vehicle] | None, fleet: str | None, k: int) -> dict:
+            Queues a query and waits for its answer.
+
+    """
+
+    def __init__(self, fleets: dict = None, batch_window: float = 0.002, max_batch_size: int = 256) -> None:
+        if batch_window < 0:
+            raise ValueError("The batch window must be non-negative.")
+        validate_positive_int('max_batch_size', max_batch_size)
+        self.fleets = dict(fleets or {})
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.latencies = LatencyRecorder()
+        self._queue = None
+        self._worker = None
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, vehicles=None, fleet: str = None, k: int = 1) -> dict:
+        """
+        Queues a query for the next batch.
+        :param vehicles: the vehicles to rank, or None to rank a registered fleet
+        :param fleet: the name of a registered fleet, used when vehicles is None
+        :param k: the number of best vehicles to return
+        :return: the answer, with the 'best' and 'top' entries
+        """
+        if vehicles is None and fleet not in self.fleets:
+            raise KeyError(f"Unknown fleet {fleet!r}.")
+        loop = asyncio.get_running_loop()
+        request = _PendingRequest(vehicles, fleet, k, loop.create_future(), time.perf_counter())
+        self._queue.put_nowait(request)
+        return await request.future
+
+    def stats(self) -> dict:
+        p50, p99 = self.latencies.percentile(50), self.latencies.percentile(99)
+        return {
+            'requests': self.latencies.count,
+            'batches': self.batches,
+            'p50_ms': None if p50 is None else p50 * 1000,
+            'p99_ms': None if p99 is None else p99 * 1000,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                self._evaluate(batch)
+            except Exception as error:
+                # The batch's unanswered requests fail, the worker keeps serving the next batches.
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(error)
+
+    def _evaluate(self, batch: list) -> None:
+        self.batches += 1
+        inline = [request for request in batch if request.vehicles is not None]
+
+        # One distance pass for all the vehicle specs of the batch, sliced back per request.
+        vehicles = [vehicle for request in inline for vehicle in request.vehicles]
+        distances = VehicleFleet.from_vehicles(vehicles).compute_maximal_distances()
+        start = 0
+        for request in inline:
+            stop = start + len(request.vehicles)
+            self._answer(request, distances[start:stop], lambda position, offset=start: vehicles[offset + position])
+            start = stop
+
+        # Registered fleets are evaluated once per batch, however many requests name them.
+        fleet_distances = {}
+        for request in batch:
+            if request.vehicles is None:
+                fleet = self.fleets[request.fleet]
+                if request.fleet not in fleet_distances:
+                    fleet_distances[request.fleet] = fleet.compute_maximal_distances()
+                self._answer(request, fleet_distances[request.fleet], fleet.vehicle)
+
+    def _answer(self, request: _PendingRequest, distances: np.ndarray, vehicle_at) -> None:
+        if request.future.done():
+            # The client went away.
+            return
+        top = [{'position': int(position), 'distance': int(distances[position]),
+                'vehicle': record_from_vehicle(vehicle_at(int(position)))}
+               for position in top_k_positions(distances, request.k)]
+        request.future.set_result({'best': top[0] if top else None, 'top': top})
+        self.latencies.record(time.perf_counter() - request.arrival)
+
+
+class FleetServer:
+    """
+
+    The JSON-lines front end of a MicroBatcher, listening on TCP or on a Unix socket. A request line longer
+    than stream_limit bytes is answered with an error and ends its connection.
+
+    Methods:
+        - start(host: str, port: int) -> None:
+            Starts listening on TCP, port 0 picking a free port (see the port attribute).
+
+        - start_unix(path: str) -> None:
+            Starts listening on a Unix socket.
+
+        - close() -> None:
+            Stops listening and stops the batcher.
+
+    """
+
+    def __init__(self, fleets: dict = None, batch_window: float = 0.002, max_batch_size: int = 256,
+                 stream_limit: int = STREAM_LIMIT) -> None:
+        self.batcher = MicroBatcher(fleets, batch_window, max_batch_size)
+        self.stream_limit = stream_limit
+        self.port = None
+        self._server = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> None:
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port,
+                                                  limit=self.stream_limit)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def start_unix(self, path: str) -> None:
+        self.batcher.start()
+        self._server = await asyncio.start_unix_server(self._handle_connection, path,
+                                                       limit=self.stream_limit)
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def __aenter__(self) -> 'FleetServer':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Requests of a connection are processed concurrently so that a pipelining client fills batches too;
+        # answers are matched to requests by their 'id'.
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line exceeds stream_limit: its end cannot be found reliably, so the connection stops
+                    # reading once the error is answered.
+                    writer.write(json.dumps({'error': f"request line longer than {self.stream_limit} bytes",
+                                             'id': None}).encode() + b'\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._handle_line(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _handle_line(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request must be a JSON object")
+            request_id = request.get('id')
+            response = await self._handle_request(request)
+        except KeyError as error:
+            response = {'error': f"unknown or missing {error.args[0]}"}
+        except (TypeError, ValueError, OverflowError) as error:
+            response = {'error': str(error)}
+        response['id'] = request_id
+        writer.write(json.dumps(response).encode() + b'\n')
+        await writer.drain()
+
+    async def _handle_request(self, request: dict) -> dict:
+        if request.get('stats'):
+            return self.batcher.stats()
+        k = request.get('k', 1)
+        # JSON true would pass as the int 1.
+        if isinstance(k, bool):
+            raise TypeError("k must be of type int.")
+        validate_positive_int('k', k)
+        if 'vehicles' in request:
+            if not isinstance(request['vehicles'], list):
+                raise ValueError("'vehicles' must be a list of records")
+            vehicles = [vehicle_from_record(record) for record in request['vehicles']]
+            for vehicle in vehicles:
+                # Larger Python ints are valid attributes but do not fit in the batch's int64 columns.
+                if not all(INT64_MIN <= value <= INT64_MAX
+                           for value in (vehicle.year, vehicle.tank_size, vehicle.consumption)):
+                    raise ValueError("vehicle attributes must fit in a 64-bit integer")
+            return await self.batcher.submit(vehicles=vehicles, k=k)
+        if 'fleet' in request:
+            return await self.batcher.submit(fleet=request['fleet'], k=k)
+        raise ValueError("a request needs 'vehicles', 'fleet' or 'stats'")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serve best-vehicle queries over JSON lines.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='listen on this Unix socket path instead of TCP')
+    parser.add_argument('--fleet', action='append', default=[], metavar='NAME=PATH',
+                        help='register the vehicles of a CSV or JSON-lines file under NAME')
+    parser.add_argument('--batch-window', type=float, default=0.002, help='seconds a batch stays open')
+    parser.add_argument('--max-batch-size', type=int, default=256, help='maximal number of requests per batch')
+    args = parser.parse_args(argv)
+
+    fleets = {}
+    for spec in args.fleet:
+        name, _, path = spec.partition('=')
+        fleets[name] = VehicleFleet.from_vehicles(read_vehicles(path))
+
+    async def serve():
+        server = FleetServer(fleets, args.batch_window, args.max_batch_size)
+        if args.unix:
+            await server.start_unix(args.unix)
+        else:
+            await server.start(args.host, args.port)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,479 @@
+"""
+Bounded-memory, mergeable statistics over unbounded streams of vehicles.
+
+Each sketch summarizes a stream in memory that does not grow with its length, and two sketches with the same
+parameters merge into the sketch of both streams, so shards or time windows can be summarized independently and
+combined later, as with FleetSummary. The guarantees, for a stream of n values:
+
+    - QuantileSketch: relative-error quantiles of the maximal distances, in at most max_buckets buckets. The
+      estimated q-quantile is within relative_accuracy of the exact one (the value of rank floor(q * (n - 1)) in
+      sorted order), as long as the sketch never had to collapse its lowest buckets, which takes values spread
+      over a ratio of about (1 + 2 * relative_accuracy) ** max_buckets (more than 1e17 with the defaults).
+    - DistanceHistogram: exact counts of fixed-width distance bins, the distances above the last bin being
+      counted together as overflow.
+    - HeavyHitters: Misra-Gries frequent items, e.g. (type, year) models, in at most capacity counters. Every
+      estimated count is at most the exact one and at least the exact one minus error_bound(), which is at most
+      n / (capacity + 1): every item more frequent than that is reported.
+    - TopVehicles: the exact k best vehicles, ranked as find_best_vehicles ranks them, in memory O(k).
+
+StreamStatistics feeds all of them from one stream, computing each vehicle's distance once; add_fleet() feeds a
+VehicleFleet chunk with vectorized counting.
+"""
+import heapq
+import math
+import numbers
+import operator
+from collections import Counter
+
+from technical_test_fortis.vehicle import validate_positive_int
+
+
+def _check_value(value, what: str):
+    """
+    :return: the value as a Python int or float; NumPy numbers, e.g. from compute_maximal_distances(), are accepted
+    """
+    if isinstance(value, bool) or not isinstance(value, numbers.Real):
+        raise TypeError(f"{what} must be numbers.")
+    value = operator.index(value) if isinstance(value, numbers.Integral) else float(value)
+    if not 0 <= value < math.inf:
+        raise ValueError(f"{what} must be finite and non-negative.")
+    return value
+
+
+def _check_mergeable(sketch, other, *names) -> None:
+    if type(other) is not type(sketch):
+        raise TypeError(f"Cannot merge {type(sketch).__name__} with {type(other).__name__}.")
+    for name in names:
+        if getattr(sketch, name) != getattr(other, name):
+            raise ValueError(f"Cannot merge sketches with different {name}.")
+
+
+class QuantileSketch:
+    """
+
+    This class estimates quantiles of non-negative values with a bounded relative error (a DDSketch).
+
+    A positive value x is counted in bucket ceil(log(x) / log(gamma)), with gamma = (1 + a) / (1 - a) for the
+    relative accuracy a: every value of a bucket is within a relative error a of the bucket's estimate, so the
+    estimate of any quantile is too. Zeros are counted apart and estimated exactly. When more than max_buckets
+    buckets are needed, the lowest ones are collapsed into one, which only degrades the lowest quantiles.
+
+    Attributes:
+        - relative_accuracy (float): The relative error bound a, between 0 and 1.
+        - max_buckets (int): The maximal number of buckets kept.
+        - count (int): The number of values added.
+        - minimum (int | float | None) / maximum (int | float | None): The exact extreme values, None when empty.
+
+    Methods:
+        - add(value, count: int = 1) -> None / extend(values: Iterable) -> None:
+            Adds values.
+
+        - quantile(q: float) -> float:
+            Returns the estimated q-quantile, None when empty.
+
+        - merge(other: QuantileSketch) -> QuantileSketch:
+            Returns the sketch of both streams.
+
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        if isinstance(relative_accuracy, bool) or not isinstance(relative_accuracy, (int, float)):
+            raise TypeError("relative_accuracy must be a number.")
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        validate_positive_int('max_buckets', max_buckets)
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._inverse_log_gamma = 1 / math.log(self._gamma)
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+        self._zeros = 0
+        # bucket index -> count; indices below _floor have been collapsed into _floor
+        self._buckets = {}
+        self._floor = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._buckets) + (1 if self._zeros else 0)
+
+    def _index(self, value) -> int:
+        index = math.ceil(math.log(value) * self._inverse_log_gamma)
+        return index if self._floor is None or index > self._floor else self._floor
+
+    def add(self, value, count: int = 1) -> None:
+        """
+        :param value: a non-negative number
+        :param count: the number of times the value is added
+        """
+        value = _check_value(value, "Values")
+        validate_positive_int('count', count)
+        if value == 0:
+            self._zeros += count
+        else:
+            index = self._index(value)
+            self._buckets[index] = self._buckets.get(index, 0) + count
+            if len(self._buckets) > self.max_buckets:
+                self._collapse()
+        self.count += count
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def extend(self, values) -> None:
+        # Counting first computes one logarithm per distinct value, few for integer distances.
+        for value, count in Counter(values).items():
+            self.add(value, count)
+
+    def _collapse(self) -> None:
+        indices = sorted(self._buckets)
+        excess = len(indices) - self.max_buckets
+        floor = indices[excess]
+        self._buckets[floor] += sum(self._buckets.pop(index) for index in indices[:excess])
+        self._floor = floor
+
+    def quantile(self, q: float):
+        """
+        :param q: the quantile, between 0 and 1 (0.5 for the median)
+        :return: the estimated value of rank floor(q * (count - 1)), exact for the minimum and the maximum; None
+            when the sketch is empty
+        """
+        if isinstance(q, bool) or not isinstance(q, (int, float)):
+            raise TypeError("q must be a number.")
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1.")
+        if not self.count:
+            return None
+        rank = math.floor(q * (self.count - 1))
+        if rank == 0 or rank == self.count - 1:
+            return self.minimum if rank == 0 else self.maximum
+        if rank < self._zeros:
+            return 0
+        seen = self._zeros
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                estimate = 2 * self._gamma ** index / (self._gamma + 1)
+                # Clamping to the exact extremes can only bring the estimate closer to the exact value.
+                return min(max(estimate, self.minimum), self.maximum)
+        return self.maximum
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        _check_mergeable(self, other, 'relative_accuracy', 'max_buckets')
+        merged = QuantileSketch(self.relative_accuracy, self.max_buckets)
+        merged.count = self.count + other.count
+        merged.minimum = min((value for value in (self.minimum, other.minimum) if value is not None), default=None)
+        merged.maximum = max((value for value in (self.maximum, other.maximum) if value is not None), default=None)
+        merged._zeros = self._zeros + other._zeros
+        floors = [floor for floor in (self._floor, other._floor) if floor is not None]
+        merged._floor = max(floors) if floors else None
+        for buckets in (self._buckets, other._buckets):
+            for index, count in buckets.items():
+                if merged._floor is not None and index < merged._floor:
+                    index = merged._floor
+                merged._buckets[index] = merged._buckets.get(index, 0) + count
+        if len(merged._buckets) > merged.max_buckets:
+            merged._collapse()
+        return merged
+
+
+class DistanceHistogram:
+    """
+
+    This class counts distances in fixed-width bins: bin i holds the distances from i * bin_width to
+    (i + 1) * bin_width - 1, and the distances beyond the last bin are counted as overflow. Counts are exact.
+
+    Attributes:
+        - bin_width (int): The range of distances of a bin.
+        - bins (int): The number of bins.
+        - count (int): The number of distances added, overflow included.
+        - overflow (int): The number of distances of at least bin_width * bins.
+
+    Methods:
+        - add(distance, count: int = 1) -> None / extend(distances: Iterable) -> None:
+            Adds distances.
+
+        - counts() -> Counter:
+            Maps the first distance of each non-empty bin to its count, as histogram_objects does.
+
+        - merge(other: DistanceHistogram) -> DistanceHistogram:
+            Returns the histogram of both streams.
+
+    """
+
+    def __init__(self, bin_width: int = 10, bins: int = 100) -> None:
+        validate_positive_int('bin_width', bin_width)
+        validate_positive_int('bins', bins)
+        self.bin_width = bin_width
+        self.bins = bins
+        self.count = 0
+        self.overflow = 0
+        self._counts = [0] * bins
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, distance, count: int = 1) -> None:
+        distance = _check_value(distance, "Distances")
+        validate_positive_int('count', count)
+        index = int(distance // self.bin_width)
+        if index < self.bins:
+            self._counts[index] += count
+        else:
+            self.overflow += count
+        self.count += count
+
+    def extend(self, distances) -> None:
+        for distance in distances:
+            self.add(distance)
+
+    def counts(self) -> Counter:
+        return Counter({index * self.bin_width: count for index, count in enumerate(self._counts) if count})
+
+    def merge(self, other: 'DistanceHistogram') -> 'DistanceHistogram':
+        _check_mergeable(self, other, 'bin_width', 'bins')
+        merged = DistanceHistogram(self.bin_width, self.bins)
+        merged.count = self.count + other.count
+        merged.overflow = self.overflow + other.overflow
+        merged._counts = [first + second for first, second in zip(self._counts, other._counts)]
+        return merged
+
+
+class HeavyHitters:
+    """
+
+    This class finds the frequent items of a stream with at most capacity counters (Misra-Gries).
+
+    When an item needs a counter and all are taken, every counter is decreased by the smallest one and the
+    counters reaching zero are freed. Each decrease removes the same amount from at least capacity + 1 items, so
+    no estimate is lower than the exact count by more than (count - sum of the counters) / (capacity + 1).
+
+    Attributes:
+        - capacity (int): The maximal number of counters.
+        - count (int): The number of items added.
+
+    Methods:
+        - add(item, count: int = 1) -> None / extend(items: Iterable) -> None:
+            Adds hashable items.
+
+        - estimate(item) -> int:
+            Returns a lower bound of the item's count, within error_bound() of it.
+
+        - error_bound() -> float:
+            Returns the maximal underestimation of any count.
+
+        - most_common(n: int = None) -> list[tuple]:
+            Returns the (item, estimate) pairs kept, most frequent first.
+
+        - merge(other: HeavyHitters) -> HeavyHitters:
+            Returns the summary of both streams, with the same guarantee.
+
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        validate_positive_int('capacity', capacity)
+        self.capacity = capacity
+        self.count = 0
+        self._counters = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, item, count: int = 1) -> None:
+        validate_positive_int('count', count)
+        self._counters[item] = self._counters.get(item, 0) + count
+        self.count += count
+        if len(self._counters) > self.capacity:
+            self._reduce()
+
+    def extend(self, items) -> None:
+        for item in items:
+            self.add(item)
+
+    def _reduce(self) -> None:
+        # Subtracting the (capacity + 1)-th largest counter frees at least one counter.
+        cut = heapq.nlargest(self.capacity + 1, self._counters.values())[-1]
+        self._counters = {item: value - cut for item, value in self._counters.items() if value > cut}
+
+    def estimate(self, item) -> int:
+        return self._counters.get(item, 0)
+
+    def error_bound(self) -> float:
+        return (self.count - sum(self._counters.values())) / (self.capacity + 1)
+
+    def most_common(self, n: int = None) -> list:
+        return Counter(self._counters).most_common(n)
+
+    def merge(self, other: 'HeavyHitters') -> 'HeavyHitters':
+        _check_mergeable(self, other, 'capacity')
+        merged = HeavyHitters(self.capacity)
+        merged.count = self.count + other.count
+        merged._counters = dict(self._counters)
+        for item, value in other._counters.items():
+            merged._counters[item] = merged._counters.get(item, 0) + value
+        if len(merged._counters) > merged.capacity:
+            merged._reduce()
+        return merged
+
+
+class TopVehicles:
+    """
+
+    This class keeps the k best vehicles of a stream, exactly: top() is find_best_vehicles(stream, k).
+
+    Attributes:
+        - k (int): The number of vehicles kept.
+        - count (int): The number of vehicles added.
+
+    Methods:
+        - add(vehicle: Vehicle, distance: int = None) -> None / extend(vehicles: Iterable[Vehicle]) -> None:
+            Adds vehicles, the distance being computed when omitted.
+
+        - top() -> list[Vehicle]:
+            Returns the k best vehicles, best first.
+
+        - merge(other: TopVehicles) -> TopVehicles:
+            Returns the top of this stream followed by the other one: on equal distance the other's vehicles win.
+
+    """
+
+    def __init__(self, k: int = 10) -> None:
+        validate_positive_int('k', k)
+        self.k = k
+        self.count = 0
+        # Min-heap of (distance, position, vehicle), as in find_best_vehicles.
+        self._heap = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _push(self, entry: tuple) -> None:
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def add(self, vehicle, distance: int = None) -> None:
+        if distance is None:
+            distance = vehicle.compute_maximal_distance()
+        self._push((distance, self.count, vehicle))
+        self.count += 1
+
+    def extend(self, vehicles) -> None:
+        for vehicle in vehicles:
+            self.add(vehicle)
+
+    def top(self) -> list:
+        return [vehicle for _, _, vehicle in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def merge(self, other: 'TopVehicles') -> 'TopVehicles':
+        _check_mergeable(self, other, 'k')
+        merged = TopVehicles(self.k)
+        merged.count = self.count + other.count
+        merged._heap = list(self._heap)
+        for distance, position, vehicle in other._heap:
+            merged._push((distance, self.count + position, vehicle))
+        return merged
+
+
+def _model(vehicle) -> tuple:
+    return type(vehicle).__name__.lower(), vehicle.year
+
+
+class StreamStatistics:
+    """
+
+    This class feeds a vehicle stream to a QuantileSketch and a DistanceHistogram of the maximal distances, to
+    HeavyHitters of the (type, year) models and to TopVehicles, computing each distance once.
+
+    Attributes:
+        - quantiles (QuantileSketch), histogram (DistanceHistogram), models (HeavyHitters), best (TopVehicles):
+            The sketches, with the parameters given to the constructor.
+        - count (int): The number of vehicles added.
+        - total (int): The sum of their maximal distances, exact.
+
+    Methods:
+        - add(vehicle: Vehicle) -> None / extend(vehicles: Iterable[Vehicle]) -> None:
+            Adds vehicles.
+
+        - add_fleet(fleet: VehicleFleet) -> None:
+            Adds the vehicles of a columnar fleet with vectorized counting, see its docstring for the
+            difference with extend().
+
+        - mean() -> float:
+            Returns the exact mean distance, None when empty.
+
+        - merge(other: StreamStatistics) -> StreamStatistics:
+            Returns the statistics of this stream followed by the other one.
+
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048, bin_width: int = 10,
+                 bins: int = 100, capacity: int = 64, k: int = 10) -> None:
+        self.quantiles = QuantileSketch(relative_accuracy, max_buckets)
+        self.histogram = DistanceHistogram(bin_width, bins)
+        self.models = HeavyHitters(capacity)
+        self.best = TopVehicles(k)
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def count(self) -> int:
+        return self.best.count
+
+    def add(self, vehicle) -> None:
+        distance = vehicle.compute_maximal_distance()
+        self.quantiles.add(distance)
+        self.histogram.add(distance)
+        self.models.add(_model(vehicle))
+        self.best.add(vehicle, distance)
+        self.total += distance
+
+    def extend(self, vehicles) -> None:
+        for vehicle in vehicles:
+            self.add(vehicle)
+
+    def add_fleet(self, fleet) -> None:
+        """
+        Adds the vehicles of a fleet, rebuilding only the vehicles that enter the top. The count, total,
+        histogram, quantiles and top are the same as after extend(fleet.to_vehicles()). The models are counted
+        per distinct model rather than in row order, and Misra-Gries counters depend on the order: they may differ
+        from extend()'s, within the same error_bound() of the exact counts.
+        :param fleet: a VehicleFleet
+        """
+        import numpy as np
+
+        from technical_test_fortis.fleet import CAR
+
+        distances = fleet.compute_maximal_distances()
+        for distance, count in zip(*(column.tolist() for column in np.unique(distances, return_counts=True))):
+            self.quantiles.add(distance, count)
+            self.histogram.add(distance, count)
+        # Each (kind, year) model as one integer, a one-dimensional np.unique being much faster than axis=0.
+        models = np.asarray(fleet.year, dtype=np.int64) * 2 + (np.asarray(fleet.kind) != CAR)
+        for model, count in zip(*(column.tolist() for column in np.unique(models, return_counts=True))):
+            self.models.add(('bike' if model % 2 else 'car', model // 2), count)
+        offset = self.best.count
+        for position in fleet.find_best_indices(self.best.k, distances).tolist():
+            self.best._push((int(distances[position]), offset + position, fleet.vehicle(position)))
+        self.best.count += len(fleet)
+        self.total += int(distances.sum())
+
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def merge(self, other: 'StreamStatistics') -> 'StreamStatistics':
+        if not isinstance(other, StreamStatistics):
+            raise TypeError(f"Cannot merge StreamStatistics with {type(other).__name__}.")
+        merged = StreamStatistics.__new__(StreamStatistics)
+        merged.quantiles = self.quantiles.merge(other.quantiles)
+        merged.histogram = self.histogram.merge(other.histogram)
+        merged.models = self.models.merge(other.models)
+        merged.best = self.best.merge(other.best)
+        merged.total = self.total + other.total
+        return merged
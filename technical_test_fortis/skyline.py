@@ -0,0 +1,221 @@
+"""
+Skyline (Pareto front) queries over vehicles: the vehicles that no other vehicle beats on every criterion at
+once, the criteria being a higher maximal distance, a newer year and a lower consumption.
+
+A vehicle dominates another one when it is at least as good on all three criteria and strictly better on one.
+Vehicles with identical criteria do not dominate each other, so they are all on the front or all off it.
+
+The front is computed by sorting, in O(n log n) rather than with pairwise comparisons: the vehicles are swept by
+decreasing distance, and a vehicle is dominated exactly when a front vehicle already swept has a newer or equal
+year with a lower or equal consumption. Those swept vehicles are kept as a (year, consumption) staircase searched
+with bisect.
+
+Results are ordered by decreasing distance, then decreasing year, increasing consumption and arrival order; a
+top-k of a layer is its first k vehicles.
+"""
+from bisect import bisect_left
+from math import inf
+
+from technical_test_fortis.vehicle import validate_positive_int
+
+
+def _front_indices(keys) -> list:
+    """
+    :param keys: a list of (distance, year, consumption) tuples
+    :return: the indices of the non-dominated keys, in the result order of the module
+    """
+    order = sorted(range(len(keys)), key=lambda i: (-keys[i][0], -keys[i][1], keys[i][2]))
+    # Staircase of the front found so far, over strictly larger distances: years increasing with consumptions
+    # increasing, so the lowest consumption among the years >= y is at bisect_left(years, y).
+    years, consumptions = [], []
+    front = []
+    start = 0
+    while start < len(order):
+        distance = keys[order[start]][0]
+        end = start
+        while end < len(order) and keys[order[end]][0] == distance:
+            end += 1
+
+        # Vehicles of equal distance, by decreasing year then increasing consumption.
+        group_front = []
+        lowest_newer = inf  # lowest consumption among the group's vehicles with a strictly newer year
+        lowest_same_year, current_year = inf, None
+        for index in order[start:end]:
+            _, year, consumption = keys[index]
+            if year != current_year:
+                lowest_newer = min(lowest_newer, lowest_same_year)
+                lowest_same_year, current_year = consumption, year
+            position = bisect_left(years, year)
+            if position < len(years) and consumptions[position] <= consumption:
+                continue  # dominated by a vehicle with a larger distance
+            if lowest_newer <= consumption or lowest_same_year < consumption:
+                continue  # dominated within the group
+            group_front.append(index)
+
+        for index in group_front:
+            _, year, consumption = keys[index]
+            position = bisect_left(years, year)
+            if position < len(years) and consumptions[position] <= consumption:
+                continue  # an equal (year, consumption) pair is already on the staircase
+            # Drop the staircase steps the new one covers: older or equal years with higher consumptions.
+            first = bisect_left(consumptions, consumption, 0, position)
+            last = position + 1 if position < len(years) and years[position] == year else position
+            years[first:last] = [year]
+            consumptions[first:last] = [consumption]
+
+        front.extend(group_front)
+        start = end
+    return front
+
+
+def _vehicle_key(vehicle) -> tuple:
+    return vehicle.compute_maximal_distance(), vehicle.year, vehicle.consumption
+
+
+def _check_limits(layers, k) -> None:
+    for name, value in (('layers', layers), ('k', k)):
+        if value is not None:
+            validate_positive_int(name, value)
+
+
+def skyline(vehicles) -> list:
+    """
+    :param vehicles: an iterable of vehicles
+    :return: the vehicles on the Pareto front of (distance, year, consumption)
+    """
+    vehicles = list(vehicles)
+    return [vehicles[index] for index in _front_indices([_vehicle_key(vehicle) for vehicle in vehicles])]
+
+
+def skyline_layers(vehicles, layers: int = None, k: int = None) -> list:
+    """
+    Peels the successive fronts: the first layer is the skyline, the second one the skyline of the remaining
+    vehicles, and so on.
+    :param vehicles: an iterable of vehicles
+    :param layers: the maximal number of layers to return, all of them when omitted
+    :param k: when given, only the first k vehicles of each layer are returned
+    :return: a list of layers, each one a list of vehicles
+    """
+    _check_limits(layers, k)
+    remaining = list(vehicles)
+    keys = [_vehicle_key(vehicle) for vehicle in remaining]
+    result = []
+    while remaining and (layers is None or len(result) < layers):
+        front = _front_indices(keys)
+        result.append([remaining[index] for index in front[:k]])
+        on_front = set(front)
+        remaining = [vehicle for index, vehicle in enumerate(remaining) if index not in on_front]
+        keys = [key for index, key in enumerate(keys) if index not in on_front]
+    return result
+
+
+class SkylineAccumulator:
+    """
+
+    This class maintains the skyline of a stream of vehicles in memory proportional to the front.
+
+    Vehicles are buffered and merged with the current front chunk by chunk: only the front of everything seen so
+    far is kept, as a vehicle dominated once stays dominated.
+
+    Methods:
+        - add(vehicle: Vehicle) -> None / extend(vehicles: Iterable[Vehicle]) -> None:
+            Feeds vehicles.
+
+        - front() -> list[Vehicle]:
+            Returns the skyline of the vehicles seen so far, in the order of skyline().
+
+    """
+
+    def __init__(self, chunk_size: int = 4096) -> None:
+        validate_positive_int('chunk_size', chunk_size)
+        self.chunk_size = chunk_size
+        self.seen = 0
+        # (key, vehicle) pairs, in arrival order
+        self._front = []
+        self._pending = []
+
+    def add(self, vehicle) -> None:
+        self._pending.append((_vehicle_key(vehicle), vehicle))
+        self.seen += 1
+        if len(self._pending) >= self.chunk_size:
+            self._merge()
+
+    def extend(self, vehicles) -> None:
+        for vehicle in vehicles:
+            self.add(vehicle)
+
+    def _merge(self) -> None:
+        candidates = self._front + self._pending
+        front = _front_indices([key for key, _ in candidates])
+        # Kept in arrival order, so that the result order breaks ties like skyline() does.
+        self._front = [candidates[index] for index in sorted(front)]
+        self._pending = []
+
+    def front(self) -> list:
+        if self._pending:
+            self._merge()
+        return [self._front[index][1] for index in _front_indices([key for key, _ in self._front])]
+
+
+def _fleet_front(distances, years, consumptions, positions):
+    """
+    :return: the positions of the non-dominated vehicles among the given ones, in the result order of the module
+    """
+    import numpy as np
+
+    if len(positions) == 0:
+        return positions
+    # Only the vehicles with the largest distance of their (year, consumption) pair can be on the front, the
+    # others are dominated by it. The Python sweep then only runs over the distinct pairs.
+    order = np.lexsort((consumptions, years))
+    sorted_years, sorted_consumptions = years[order], consumptions[order]
+    new_pair = np.empty(len(order), dtype=bool)
+    new_pair[0] = True
+    np.not_equal(sorted_years[1:], sorted_years[:-1], out=new_pair[1:])
+    new_pair[1:] |= sorted_consumptions[1:] != sorted_consumptions[:-1]
+    starts = np.flatnonzero(new_pair)
+    pair_of = np.empty(len(order), dtype=np.intp)
+    pair_of[order] = np.cumsum(new_pair) - 1
+    best = np.maximum.reduceat(distances[order], starts)
+    keys = list(zip(best.tolist(), sorted_years[starts].tolist(), sorted_consumptions[starts].tolist()))
+    on_front = np.zeros(len(starts), dtype=bool)
+    on_front[_front_indices(keys)] = True
+
+    selected = np.flatnonzero(on_front[pair_of] & (distances == best[pair_of]))
+    order = np.lexsort((positions[selected], consumptions[selected], -years[selected], -distances[selected]))
+    return positions[selected[order]]
+
+
+def fleet_skyline(fleet, distances=None):
+    """
+    Columnar counterpart of skyline().
+    :param fleet: a VehicleFleet
+    :param distances: precomputed result of fleet.compute_maximal_distances(), computed when omitted
+    :return: an int64 array of the positions of the vehicles on the front
+    """
+    import numpy as np
+
+    layers = fleet_skyline_layers(fleet, layers=1, distances=distances)
+    return layers[0] if layers else np.empty(0, dtype=np.int64)
+
+
+def fleet_skyline_layers(fleet, layers: int = None, k: int = None, distances=None) -> list:
+    """
+    Columnar counterpart of skyline_layers().
+    :return: a list of layers, each one an int64 array of positions
+    """
+    import numpy as np
+
+    _check_limits(layers, k)
+    distances = fleet.compute_maximal_distances() if distances is None else np.asarray(distances)
+    distances = distances.astype(np.int64, copy=False)
+    years = np.asarray(fleet.year, dtype=np.int64)
+    consumptions = np.asarray(fleet.consumption, dtype=np.int64)
+    remaining = np.arange(len(fleet), dtype=np.int64)
+    result = []
+    while len(remaining) and (layers is None or len(result) < layers):
+        front = _fleet_front(distances[remaining], years[remaining], consumptions[remaining],
+                             np.arange(len(remaining)))
+        result.append(remaining[front[:k]])
+        remaining = np.delete(remaining, front)
+    return result
@@ -0,0 +1,168 @@
+"""
+Flyweight interning of vehicle specifications.
+
+Large fleets hold many identical models. An InternedFleet files every vehicle under its VehicleSpec, an immutable
+record of its type and attributes shared by all the identical vehicles, and computes the maximal distance once
+per distinct spec. Ranking and aggregation then work on the distinct specs and their multiplicities: their cost
+depends on the number of specs, not on the number of vehicles, except for the vehicles actually returned.
+"""
+import heapq
+from collections import Counter, namedtuple
+from itertools import groupby
+
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.ingest import FIELDS, vehicle_from_record
+from technical_test_fortis.vehicle import validate_positive_int
+
+
+def _spec_fields(vehicle) -> tuple:
+    if isinstance(vehicle, Car):
+        return 'car', vehicle.year, vehicle.tank_size, vehicle.consumption, vehicle.technical_inspection, False
+    if isinstance(vehicle, Bike):
+        return 'bike', vehicle.year, 0, vehicle.consumption, False, vehicle.saddle_comfort
+    raise TypeError(f"Unsupported vehicle type '{type(vehicle).__name__}'.")
+
+
+class VehicleSpec(namedtuple('VehicleSpec', FIELDS)):
+    """
+    The type ('car' or 'bike') and attributes of a vehicle, with the fields of technical_test_fortis.ingest
+    records. Bikes have a tank_size of 0 and no technical_inspection, cars no saddle_comfort.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_vehicle(cls, vehicle) -> 'VehicleSpec':
+        return cls._make(_spec_fields(vehicle))
+
+    def vehicle(self):
+        """
+        :return: a new Car or Bike with this spec
+        """
+        return vehicle_from_record(self._asdict())
+
+
+class InternedFleet:
+    """
+
+    This class stores vehicles grouped by identical spec, with one maximal distance computed per distinct spec.
+
+    Every vehicle keeps its arrival position, so results are actual vehicle objects, ranked with the usual
+    tie-breaking: on equal distance the later vehicle wins. A vehicle is filed under its spec at the time it is
+    added; a vehicle modified afterwards must be added to a new fleet to be filed under its new spec.
+
+    Attributes:
+        - vehicles (list[Vehicle]): The vehicles, in arrival order.
+
+    Methods:
+        - add(vehicle: Vehicle) -> VehicleSpec / extend(vehicles: Iterable[Vehicle]) -> None:
+            Adds vehicles, returning the shared spec of the added vehicle.
+
+        - distance(spec: VehicleSpec) -> int / multiplicity(spec: VehicleSpec) -> int:
+            Returns the distance, or the number of vehicles, of a spec.
+
+        - best() -> Vehicle / top(k: int) -> list[Vehicle]:
+            Ranks the vehicles like find_best_vehicle and find_best_vehicles.
+
+        - distance_counts() -> Counter / total_distance() -> int / count_by(field: str) -> Counter:
+            Aggregates over the specs, weighted by their multiplicities.
+
+    """
+
+    def __init__(self, vehicles=()) -> None:
+        self.vehicles = []
+        # spec -> [shared spec, distance, positions of its vehicles in arrival order]
+        self._entries = {}
+        self.extend(vehicles)
+
+    def __len__(self) -> int:
+        return len(self.vehicles)
+
+    @property
+    def distinct_count(self) -> int:
+        return len(self._entries)
+
+    def specs(self) -> list:
+        """
+        :return: the distinct specs, in order of first arrival
+        """
+        return [entry[0] for entry in self._entries.values()]
+
+    def add(self, vehicle) -> VehicleSpec:
+        # A plain tuple finds the equal VehicleSpec key, the record is only built for a new spec.
+        fields = _spec_fields(vehicle)
+        entry = self._entries.get(fields)
+        if entry is None:
+            spec = VehicleSpec._make(fields)
+            entry = self._entries[spec] = [spec, vehicle.compute_maximal_distance(), []]
+        entry[2].append(len(self.vehicles))
+        self.vehicles.append(vehicle)
+        return entry[0]
+
+    def extend(self, vehicles) -> None:
+        for vehicle in vehicles:
+            self.add(vehicle)
+
+    def distance(self, spec: VehicleSpec) -> int:
+        return self._entries[spec][1]
+
+    def multiplicity(self, spec: VehicleSpec) -> int:
+        return len(self._entries[spec][2])
+
+    def members(self, spec: VehicleSpec) -> list:
+        """
+        :return: the vehicles filed under the spec, in arrival order
+        """
+        return [self.vehicles[position] for position in self._entries[spec][2]]
+
+    def best(self):
+        """
+        :return: the vehicle with the highest autonomy, the latest one on equal distance, in O(distinct specs);
+            None when the fleet is empty
+        """
+        if not self._entries:
+            return None
+        _, _, positions = max(self._entries.values(), key=lambda entry: (entry[1], entry[2][-1]))
+        return self.vehicles[positions[-1]]
+
+    def top(self, k: int) -> list:
+        """
+        Same result as find_best_vehicles(self.vehicles, k), in O(S log S + k log S) for S distinct specs.
+        :param k: the number of vehicles to return
+        :return: the k vehicles with the highest autonomy, best first
+        """
+        validate_positive_int('k', k)
+        entries = sorted(self._entries.values(), key=lambda entry: entry[1], reverse=True)
+        positions = []
+        for _, group in groupby(entries, key=lambda entry: entry[1]):
+            # Within a distance, the vehicles of all the specs are merged by decreasing position.
+            merged = heapq.merge(*(reversed(entry[2]) for entry in group), reverse=True)
+            positions.extend(position for _, position in zip(range(k - len(positions)), merged))
+            if len(positions) == k:
+                break
+        return [self.vehicles[position] for position in positions]
+
+    def distance_counts(self) -> Counter:
+        """
+        :return: a Counter mapping each maximal distance to its number of vehicles
+        """
+        counts = Counter()
+        for _, distance, positions in self._entries.values():
+            counts[distance] += len(positions)
+        return counts
+
+    def total_distance(self) -> int:
+        return sum(distance * len(positions) for _, distance, positions in self._entries.values())
+
+    def count_by(self, field: str) -> Counter:
+        """
+        :param field: a VehicleSpec field, e.g. 'type' or 'year'
+        :return: a Counter mapping each value of the field to its number of vehicles
+        """
+        if field not in VehicleSpec._fields:
+            raise ValueError(f"Unknown spec field {field!r}, expected one of {VehicleSpec._fields}.")
+        index = VehicleSpec._fields.index(field)
+        counts = Counter()
+        for spec, _, positions in self._entries.values():
+            counts[spec[index]] += len(positions)
+        return counts
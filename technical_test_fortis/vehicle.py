@@ -1,4 +1,246 @@
+import functools
+import heapq
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from operator import attrgetter
+
+DistanceCacheInfo = namedtuple('DistanceCacheInfo', ['hits', 'misses', 'enabled'])
+
+# Opt-in memoization of compute_maximal_distance, see enable_distance_cache().
+_distance_cache_enabled = False
+# (class, original method, memoizing wrapper) for every method replaced by enable_distance_cache()
+_distance_cache_methods = []
+_distance_cache_hits = 0
+_distance_cache_misses = 0
+
+
+YEAR_ERROR = "The year of manufacture must be a positive integer."
+TANK_SIZE_ERROR = "The tank size must be a non-negative integer."
+CONSUMPTION_ERROR = "The consumption must be a positive integer."
+
+
+def validate_input(input_value, minimum, error_message):
+    if not isinstance(input_value, int):
+        raise TypeError("Input value must be of type int.")
+    elif input_value < minimum:
+        raise ValueError(error_message)
+
+
+def validate_positive_int(name: str, value) -> None:
+    """
+    Checks a count-like argument, such as k or chunk_size.
+    :param name: the name of the argument, used in the error messages
+    :param value: the value to check
+    :raises TypeError: if the value is not an int
+    :raises ValueError: if the value is below 1
+    """
+    if not isinstance(value, int):
+        raise TypeError(f"{name} must be of type int.")
+    if value < 1:
+        raise ValueError(f"{name} must be a positive integer.")
+
+
+def _column_error(exception_type, error_message: str, indices: list) -> Exception:
+    shown = ', '.join(str(index) for index in indices[:20])
+    if len(indices) > 20:
+        shown += ', ...'
+    error = exception_type(f"{error_message} Offending indices ({len(indices)}): [{shown}]")
+    # The first offending row lets validate_columns report the error the row-by-row construction would raise.
+    error.first_index = indices[0]
+    return error
+
+
+def _as_column(values):
+    # NumPy is only needed by the bulk constructors.
+    import numpy as np
+
+    array = np.asarray(values)
+    if array.ndim != 1:
+        raise ValueError("Bulk columns must be one-dimensional.")
+    # The original objects are kept for the per-element checks, as np.asarray may have converted them.
+    return array, array.tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def validate_int_column(values, minimum, error_message) -> list:
+    """
+    Vectorized counterpart of validate_input for a whole column of values.
+    An integer NumPy array (or a sequence NumPy converts to one) is checked with a single comparison,
+    other inputs fall back to per-element type checks.
+    :param values: a sequence or a one-dimensional array
+    :param minimum: the smallest valid value
+    :param error_message: the message of the ValueError raised for values below minimum
+    :return: the values as a list of Python ints
+    :raises TypeError, ValueError: like validate_input for the first offending value, listing the indices of
+        all the values failing the same way
+    """
+    array, column = _as_column(values)
+    if array.dtype.kind in 'iub':
+        wrong_type = []
+        invalid = (array < minimum).nonzero()[0].tolist()
+        column = array.tolist()
+    else:
+        wrong_type = [index for index, value in enumerate(column) if not isinstance(value, int)]
+        invalid = [index for index, value in enumerate(column) if isinstance(value, int) and value < minimum]
+    if wrong_type and (not invalid or wrong_type[0] < invalid[0]):
+        raise _column_error(TypeError, "Input value must be of type int.", wrong_type)
+    if invalid:
+        raise _column_error(ValueError, error_message, invalid)
+    return column
+
+
+def validate_bool_column(values, exception_type, error_message) -> list:
+    """
+    Checks that a whole column holds booleans, with a single dtype check for boolean NumPy arrays.
+    :param values: a sequence or a one-dimensional array
+    :param exception_type: the exception raised for non-boolean values, as the scalar validation does
+    :param error_message: the message of the exception
+    :return: the values as a list of Python bools
+    """
+    array, column = _as_column(values)
+    if array.dtype.kind == 'b':
+        return array.tolist()
+    wrong_type = [index for index, value in enumerate(column) if not isinstance(value, bool)]
+    if wrong_type:
+        raise _column_error(exception_type, error_message, wrong_type)
+    return column
+
+
+def validate_columns(*validations) -> list:
+    """
+    Runs the validation of every column of a bulk construction. When several values are invalid, the error
+    raised is the one the constructor would raise first when building the objects one by one: the error of the
+    earliest row, and for that row, of the first column in constructor order.
+    :param validations: (validator, values, *arguments) tuples, in constructor order
+    :return: the validated columns
+    """
+    lengths = {len(values) for _, values, *_ in validations}
+    if len(lengths) > 1:
+        raise ValueError("All bulk columns must have the same length.")
+
+    columns, errors = [], []
+    for order, (validate, values, *arguments) in enumerate(validations):
+        try:
+            columns.append(validate(values, *arguments))
+        except (TypeError, ValueError) as error:
+            errors.append((getattr(error, 'first_index', 0), order, error))
+    if errors:
+        raise min(errors, key=lambda error: error[:2])[2]
+    return columns
+
+
+def validated_attribute(name: str, validate, doc: str = None) -> property:
+    """
+    Creates a property storing a vehicle attribute in the private slot '_<name>'.
+    Every assignment, including the ones done in __init__, is checked by the given validator and
+    invalidates the memoized distance of the vehicle.
+    :param name: the public name of the attribute
+    :param validate: a callable raising TypeError or ValueError for an invalid value
+    :param doc: the docstring of the property
+    :return: the property to assign to the class attribute called name
+    """
+    private_name = '_' + name
+
+    def setter(self, value):
+        validate(value)
+        setattr(self, private_name, value)
+        self._cached_distance = None
+
+    # attrgetter avoids a Python frame on reads, a property read still costs about three plain slot reads.
+    return property(attrgetter(private_name), setter, doc=doc)
+
+
+def memoized_distance(compute_maximal_distance):
+    """
+    Decorator marking a compute_maximal_distance implementation for the distance cache. The method is returned
+    unchanged, so vehicles pay nothing while the cache is disabled: enable_distance_cache() replaces it with
+    a wrapper storing the result on the vehicle until one of its validated attributes is reassigned.
+    """
+    compute_maximal_distance.memoized = True
+    return compute_maximal_distance
+
+
+def _memoizing_wrapper(compute_maximal_distance):
+    @functools.wraps(compute_maximal_distance)
+    def wrapper(self) -> int:
+        global _distance_cache_hits, _distance_cache_misses
+        if not _distance_cache_enabled:
+            # Only reached when another wrapper (e.g. the instrumentation) kept this one after disabling.
+            return compute_maximal_distance(self)
+        distance = self._cached_distance
+        if distance is not None:
+            _distance_cache_hits += 1
+            return distance
+        _distance_cache_misses += 1
+        distance = self._cached_distance = compute_maximal_distance(self)
+        return distance
+
+    wrapper.memoizing = True
+    return wrapper
+
+
+def _install_distance_cache(cls) -> None:
+    method = cls.__dict__.get('compute_maximal_distance')
+    # Walks down other wrappers (e.g. the instrumentation's) to the decorated method or to a memoizing wrapper,
+    # which is left in place when the instrumentation kept it after disabling.
+    function = method
+    while function is not None and not getattr(function, 'memoized', False):
+        function = getattr(function, '__wrapped__', None)
+    if function is None:
+        return
+    if not getattr(function, 'memoizing', False):
+        wrapper = _memoizing_wrapper(method)
+        _distance_cache_methods.append((cls, method, wrapper))
+        cls.compute_maximal_distance = wrapper
+    elif function is method:
+        _distance_cache_methods.append((cls, method.__wrapped__, method))
+
+
+def _vehicle_classes(cls) -> list:
+    classes = []
+    for subclass in cls.__subclasses__():
+        classes += [subclass] + _vehicle_classes(subclass)
+    return classes
+
+
+def enable_distance_cache() -> None:
+    """
+    Enables the memoization of compute_maximal_distance for all vehicles, by installing the memoizing wrapper
+    on every vehicle class whose method is decorated with memoized_distance.
+    """
+    global _distance_cache_enabled
+    if _distance_cache_enabled:
+        return
+    _distance_cache_enabled = True
+    for cls in _vehicle_classes(Vehicle):
+        _install_distance_cache(cls)
+
+
+def disable_distance_cache() -> None:
+    """
+    Disables the memoization of compute_maximal_distance and puts the original methods back. Distances memoized
+    so far are kept on the vehicles and are still invalidated by attribute assignments, so re-enabling the cache
+    never returns stale values.
+    """
+    global _distance_cache_enabled
+    _distance_cache_enabled = False
+    while _distance_cache_methods:
+        cls, method, wrapper = _distance_cache_methods.pop()
+        # A method wrapped again since (e.g. by the instrumentation) is left to its wrapper, which restores ours.
+        if cls.__dict__.get('compute_maximal_distance') is wrapper:
+            cls.compute_maximal_distance = method
+
+
+def distance_cache_info() -> DistanceCacheInfo:
+    """
+    Returns the hit and miss counters of the distance cache, in the spirit of functools.lru_cache's cache_info().
+    The counters are not synchronized between threads.
+    """
+    return DistanceCacheInfo(_distance_cache_hits, _distance_cache_misses, _distance_cache_enabled)
+
+
+def reset_distance_cache_info() -> None:
+    global _distance_cache_hits, _distance_cache_misses
+    _distance_cache_hits = _distance_cache_misses = 0
 
 
 class Vehicle(ABC):
@@ -19,18 +261,29 @@ class Vehicle(ABC):
         - compute_maximal_distance() -> int:
             Computes and returns the maximal distance that the vehicle can travel with its current fuel.
 
+    The attributes are stored in __slots__ rather than in a per-instance __dict__ to keep large fleets compact,
+    so subclasses must declare __slots__ for the attributes they add.
+    They are validated again on every assignment, which also invalidates the memoized distance
+    (see enable_distance_cache()).
+
     """
-    def __init__(self, year: int, tank_size: int, consumption: int) -> None:
+    __slots__ = ('_year', '_tank_size', '_consumption', '_cached_distance')
 
-        def validate_input(input_value, minimum, error_message):
-            if not isinstance(input_value, int):
-                raise TypeError("Input value must be of type int.")
-            elif input_value < minimum:
-                raise ValueError(error_message)
+    year = validated_attribute('year', lambda value: validate_input(value, 1, YEAR_ERROR),
+                               "The year of manufacture of the vehicle.")
+    tank_size = validated_attribute('tank_size', lambda value: validate_input(value, 0, TANK_SIZE_ERROR),
+                                    "The size of the vehicle's fuel tank.")
+    consumption = validated_attribute('consumption', lambda value: validate_input(value, 1, CONSUMPTION_ERROR),
+                                      "The fuel consumption rate of the vehicle.")
 
-        validate_input(year, 1, "The year of manufacture must be a positive integer.")
-        validate_input(tank_size, 0, "The tank size must be a non-negative integer.")
-        validate_input(consumption, 1, "The consumption must be a positive integer.")
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # A vehicle type defined while the distance cache is enabled is memoized too.
+        if _distance_cache_enabled:
+            _install_distance_cache(cls)
+
+    def __init__(self, year: int, tank_size: int, consumption: int) -> None:
+        self._cached_distance = None
         self.year = year
         self.tank_size = tank_size
         self.consumption = consumption  # 5L per km -> consumption = 5
@@ -52,3 +305,29 @@ def find_best_vehicle(vehicle1: Vehicle, vehicle2: Vehicle) -> Vehicle:
         return vehicle1
     else:
         return vehicle2
+
+
+def find_best_vehicles(vehicles, k: int = 1) -> list:
+    """
+    This function returns the k vehicles with the highest autonomy, best first, in a single pass.
+    Each vehicle's distance is computed exactly once and only k candidates are kept in memory, so any
+    iterable (including a generator) can be ranked in O(n log k) time.
+    On equal distance the later vehicle wins, so the first result is the one obtained by folding the
+    vehicles with find_best_vehicle.
+    :param vehicles: an iterable of vehicles
+    :param k: the number of vehicles to return
+    :return: a list of at most k vehicles, sorted from the highest to the lowest autonomy
+    """
+    validate_positive_int('k', k)
+
+    # Min-heap of (distance, position, vehicle): the root is the weakest candidate kept so far, and a later
+    # position ranks above an earlier one with the same distance.
+    heap = []
+    for position, vehicle in enumerate(vehicles):
+        entry = (vehicle.compute_maximal_distance(), position, vehicle)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    return [vehicle for _, _, vehicle in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
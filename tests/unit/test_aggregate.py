@@ -0,0 +1,109 @@
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+
+import pytest
+from technical_test_fortis.aggregate import FleetSummary, summarize_shard, summarize_shards
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.binary import write_fleet
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.ingest import record_from_vehicle
+
+SHARDS = {
+    'a': [Car(2005, 50, 5, True), Bike(2005, 1, True), Car(2005, 50, 5, False)],
+    'b': [Bike(2005, 1, True), Car(2015, 50, 5, True)],
+    'c': [],
+    'd': [Bike(2005, 2, False), Bike(2005, 1, True)],
+}
+
+
+@pytest.fixture
+def summaries():
+    return {shard: FleetSummary.from_fleet(VehicleFleet.from_vehicles(vehicles), shard, k=3)
+            for shard, vehicles in SHARDS.items()}
+
+
+@pytest.fixture
+def shard_files(tmp_path):
+    paths = []
+    for shard, vehicles in SHARDS.items():
+        if shard == 'a':
+            path = tmp_path / f"{shard}.jsonl"
+            path.write_text(''.join(json.dumps(record_from_vehicle(vehicle)) + '\n' for vehicle in vehicles)
+                            + '{"type": "car"}\n')
+        else:
+            path = tmp_path / f"{shard}.bin"
+            write_fleet(path, vehicles)
+        paths.append(path)
+    return paths
+
+
+class TestFleetSummary:
+    def test_from_fleet(self, summaries):
+        summary = summaries['a']
+        assert (summary.count, summary.total, summary.minimum, summary.maximum) == (3, 210, 0, 200)
+        assert summary.type_counts == {'car': 2, 'bike': 1}
+        assert [entry[:3] for entry in summary.top] == [(200, 'a', 1), (10, 'a', 0), (0, 'a', 2)]
+        assert summary.best[3] == {'type': 'bike', 'year': 2005, 'consumption': 1, 'saddle_comfort': True}
+
+    def test_empty_summary(self, summaries):
+        summary = summaries['c']
+        assert (summary.count, summary.total, summary.minimum, summary.maximum, summary.best) == (0, 0, None, None,
+                                                                                                   None)
+
+    def test_merge_is_order_independent(self, summaries):
+        serialized = {reduce(FleetSummary.merge, order).to_json()
+                      for order in itertools.permutations(summaries.values())}
+        assert len(serialized) == 1
+
+    def test_merge_is_associative(self, summaries):
+        a, b, c, d = summaries.values()
+        assert a.merge(b).merge(c.merge(d)) == a.merge(b.merge(c)).merge(d)
+
+    def test_merge_content_and_ties(self, summaries):
+        merged = reduce(FleetSummary.merge, summaries.values())
+        all_vehicles = [vehicle for vehicles in SHARDS.values() for vehicle in vehicles]
+        distances = [vehicle.compute_maximal_distance() for vehicle in all_vehicles]
+        assert merged.count == len(all_vehicles)
+        assert merged.total == sum(distances)
+        assert (merged.minimum, merged.maximum) == (min(distances), max(distances))
+        assert merged.type_counts == {'car': 3, 'bike': 4}
+        # Three bikes tie at 200: the one of the last shard wins.
+        assert [entry[1:3] for entry in merged.top] == [('d', 1), ('b', 0), ('a', 1)]
+
+    def test_merge_keeps_smallest_k(self, summaries):
+        small = FleetSummary.from_fleet(VehicleFleet.from_vehicles(SHARDS['b']), 'b', k=1)
+        assert len(summaries['a'].merge(small).top) == 1
+
+    def test_json_round_trip(self, summaries):
+        merged = reduce(FleetSummary.merge, summaries.values())
+        assert FleetSummary.from_json(merged.to_json()) == merged
+        assert FleetSummary.from_json(merged.to_json()).to_json() == merged.to_json()
+
+    def test_invalid_k(self):
+        with pytest.raises(ValueError):
+            FleetSummary(0)
+
+
+class TestSummarizeShards:
+    def test_summarize_text_shard_in_chunks(self, shard_files):
+        summary = summarize_shard(shard_files[0], k=3, chunk_size=2)
+        assert summary.count == 3
+        assert summary.rejected == 1
+        assert [entry[2] for entry in summary.top] == [1, 0, 2]
+
+    def test_summarize_shards_is_order_independent(self, shard_files):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            forward = summarize_shards(shard_files, k=3, executor=executor)
+            backward = summarize_shards(list(reversed(shard_files)), k=3, executor=executor)
+        assert forward.to_json() == backward.to_json()
+        assert forward.count == 7
+        assert forward.rejected == 1
+        assert forward.best[1].endswith('d.bin')
+
+    def test_summarize_shards_with_process_pool(self, shard_files):
+        with ThreadPoolExecutor() as executor:
+            expected = summarize_shards(shard_files, k=2, executor=executor)
+        assert summarize_shards(shard_files, k=2).to_json() == expected.to_json()
@@ -0,0 +1,59 @@
+import pytest
+from technical_test_fortis.assign import assign_fleet_trips, assign_trips
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import BIKE, CAR, VehicleFleet
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),  # 10
+        Bike(2005, 10, False),  # 10
+        Car(2015, 60, 6, True),  # 11
+        Bike(2005, 1, True),  # 200
+        Car(2005, 50, 5, False),  # 0
+    ]
+
+
+class TestAssignTrips:
+    def test_smallest_sufficient_vehicle(self, vehicles):
+        assignment = assign_trips(vehicles, [150, 5, 11, 0])
+        assert assignment.vehicles == [vehicles[3], vehicles[1], vehicles[2], vehicles[4]]
+        assert assignment.unassigned == []
+
+    def test_later_vehicle_preferred_on_equal_distance(self, vehicles):
+        assert assign_trips(vehicles, [10]).vehicles == [vehicles[1]]
+        assert assign_trips(vehicles, [10, 10]).vehicles == [vehicles[1], vehicles[0]]
+
+    def test_unassignable_trips(self, vehicles):
+        assignment = assign_trips(vehicles, [300, 10, 10, 10, 10, 2.5])
+        assert assignment.unassigned == [0, 4]
+        assert assignment.vehicles == [None, vehicles[0], vehicles[2], vehicles[3], None, vehicles[1]]
+
+    def test_vehicle_type_constraint(self, vehicles):
+        assert assign_trips(vehicles, [5, 5], Car).vehicles == [vehicles[0], vehicles[2]]
+        assert assign_trips(vehicles, [5, 5, 5], Bike) == ([vehicles[1], vehicles[3], None], [2])
+
+    def test_empty(self, vehicles):
+        assert assign_trips([], [1, 2]) == ([None, None], [0, 1])
+        assert assign_trips(vehicles, []) == ([], [])
+
+    def test_invalid_input(self, vehicles):
+        with pytest.raises(TypeError):
+            assign_trips(vehicles, ['10'])
+        with pytest.raises(TypeError):
+            assign_trips(vehicles, [True])
+        with pytest.raises(ValueError):
+            assign_trips(vehicles, [-1])
+        with pytest.raises(ValueError):
+            assign_trips(vehicles, [float('nan')])
+        with pytest.raises(TypeError):
+            assign_trips(vehicles, [1], vehicle_type=str)
+
+    def test_columnar(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert assign_fleet_trips(fleet, [300, 10, 10, 10, 10, 2.5]).tolist() == [-1, 0, 2, 3, -1, 1]
+        assert assign_fleet_trips(fleet, [5, 5], kind=CAR).tolist() == [0, 2]
+        assert assign_fleet_trips(fleet, [5, 5, 5], kind=BIKE).tolist() == [1, 3, -1]
+        assert assign_fleet_trips(fleet, []).tolist() == []
@@ -0,0 +1,44 @@
+from hypothesis import given, strategies as st
+from technical_test_fortis.assign import assign_fleet_trips, assign_trips
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import BIKE, CAR, VehicleFleet
+
+valid_years = st.integers(min_value=1990, max_value=2020)
+valid_tank_sizes = st.integers(min_value=0, max_value=60)
+valid_consumptions = st.integers(min_value=1, max_value=10)
+
+valid_cars = st.builds(Car, year=valid_years, tank_size=valid_tank_sizes, consumption=valid_consumptions,
+                       technical_inspection=st.booleans())
+valid_bikes = st.builds(Bike, year=valid_years, consumption=valid_consumptions, saddle_comfort=st.booleans())
+valid_vehicles = st.one_of(valid_cars, valid_bikes)
+trips_strategy = st.lists(st.one_of(st.integers(min_value=0, max_value=120),
+                                    st.floats(min_value=0, max_value=120)), max_size=30)
+
+
+def maximum_served(distances, trips) -> int:
+    # Longest trips first, each matched with the longest remaining vehicle when it covers it.
+    distances, served = sorted(distances, reverse=True), 0
+    for trip in sorted(trips, reverse=True):
+        if served < len(distances) and distances[served] >= trip:
+            served += 1
+    return served
+
+
+class TestAssignTrips:
+    @given(st.lists(valid_vehicles, max_size=30), trips_strategy)
+    def test_assignment_is_feasible_and_maximal(self, vehicles, trips):
+        assignment = assign_trips(vehicles, trips)
+        served = [(trip, vehicle) for trip, vehicle in zip(trips, assignment.vehicles) if vehicle is not None]
+        assert all(vehicle.compute_maximal_distance() >= trip for trip, vehicle in served)
+        assert len({id(vehicle) for _, vehicle in served}) == len(served)
+        assert assignment.unassigned == [index for index, vehicle in enumerate(assignment.vehicles) if vehicle is None]
+        assert len(served) == maximum_served([vehicle.compute_maximal_distance() for vehicle in vehicles], trips)
+
+    @given(st.lists(valid_vehicles, max_size=30), trips_strategy, st.sampled_from([None, Car, Bike]))
+    def test_columnar_is_identical(self, vehicles, trips, vehicle_type):
+        expected = assign_trips(vehicles, trips, vehicle_type).vehicles
+        position = {id(vehicle): index for index, vehicle in enumerate(vehicles)}
+        kind = {None: None, Car: CAR, Bike: BIKE}[vehicle_type]
+        assert assign_fleet_trips(VehicleFleet.from_vehicles(vehicles), trips, kind).tolist() == \
+            [-1 if vehicle is None else position[id(vehicle)] for vehicle in expected]
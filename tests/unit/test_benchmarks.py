@@ -0,0 +1,50 @@
+import json
+
+import pytest
+from benchmarks import memory, registry_throughput, suite
+
+
+class TestMemoryBenchmark:
+    def test_slotted_layout_is_smaller(self):
+        results = memory.run(count=10_000)
+        for name in ('Car', 'Bike'):
+            assert results['after'][name] < results['before'][name]
+
+    def test_budget_exceeded_fails(self, capsys):
+        assert memory.main(['--count', '1000', '--max-bytes', '1']) == 1
+        assert memory.main(['--count', '1000', '--max-bytes', '10000']) == 0
+
+
+class TestBenchmarkSuite:
+    def test_run_suite_covers_every_path(self):
+        results = suite.run_suite(scales=[50], repeat=1)
+        assert set(results) == {f'{name}@50' for name in suite.BENCHMARKS}
+        assert all(seconds >= 0 for seconds in results.values())
+
+    def test_run_suite_filter(self):
+        assert set(suite.run_suite(scales=[10, 20], repeat=1, only='fleet.compute')) == {
+            'fleet.compute_maximal_distances@10', 'fleet.compute_maximal_distances@20'}
+
+    def test_find_regressions(self):
+        baseline = {'a@10': 1.0, 'b@10': 1.0, 'c@10': 1.0}
+        results = {'a@10': 1.2, 'b@10': 1.4, 'c@10': 0.5, 'd@10': 3.0}
+        assert suite.find_regressions(results, baseline, threshold=25) == {'b@10': pytest.approx(40)}
+
+    def test_baseline_round_trip_and_failure(self, tmp_path, capsys):
+        path = tmp_path / "baseline.json"
+        assert suite.main(['--scales', '20', '--repeat', '1', '--only', 'construct', '--save', str(path)]) == 0
+        assert set(suite.load_baseline(path)) == {'car.construct@20', 'bike.construct@20'}
+
+        document = json.loads(path.read_text())
+        document['results'] = {key: 1e-12 for key in document['results']}
+        path.write_text(json.dumps(document))
+        assert suite.main(['--scales', '20', '--repeat', '1', '--only', 'construct', '--compare', str(path)]) == 1
+        assert "Regression" in capsys.readouterr().err
+
+
+class TestRegistryThroughput:
+    def test_snapshots_stay_consistent(self):
+        results = registry_throughput.run(count=1000, readers=2, seconds=0.2)
+        assert results['inconsistencies'] == 0
+        assert results['reads'] > 0
+        assert results['writes'] > 0
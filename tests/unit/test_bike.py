@@ -59,3 +59,27 @@ class TestBike:
     def test_bike_creation_type_errors(self, create_bike, year, consumption, saddle_comfort, expected_exception):
         with pytest.raises(expected_exception):
             create_bike(year, consumption, saddle_comfort)
+
+
+class TestBikeBulk:
+    def test_bulk_matches_constructor(self, create_bike):
+        columns = ([2005, 2005, 1990], [1, 2, 10], [True, False, False])
+        bikes = Bike.bulk(*columns)
+        assert [str(bike) for bike in bikes] == [str(create_bike(*arguments)) for arguments in zip(*columns)]
+        assert [bike.tank_size for bike in bikes] == [0, 0, 0]
+        assert [bike.compute_maximal_distance() for bike in bikes] == [200, 50, 10]
+
+    @pytest.mark.parametrize("columns, expected_exception", [
+        (([-2000, 2000], [1, 1], [True, True]), ValueError),
+        (([2000, 2000], [1, -1], [True, True]), ValueError),
+        (([2000, 2000], [1, 1.5], [True, True]), TypeError),
+        (([2000, 2000], [1, 1], [True, "Comfy"]), TypeError),
+        (([2000, 2000], [1, 1], [1, True]), TypeError),
+    ])
+    def test_bulk_invalid_columns(self, columns, expected_exception):
+        with pytest.raises(expected_exception, match="Offending indices"):
+            Bike.bulk(*columns)
+
+    def test_bulk_trusted(self):
+        bikes = Bike.bulk([2005], [1], [True], trusted=True)
+        assert str(bikes[0]) == "Bike(year=2005, consumption=1, saddle_comfort=True)"
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.binary import HEADER, RECORD_DTYPE, MappedFleet, open_fleet, write_fleet
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),
+        Car(1995, 50, 5, True),
+        Car(2015, 50, 5, True),
+        Car(2005, 50, 5, False),
+        Bike(2005, 1, True),
+        Bike(2005, 2, False),
+    ]
+
+
+class TestBinaryFleet:
+    def test_round_trip(self, tmp_path, vehicles):
+        path = tmp_path / "fleet.bin"
+        assert write_fleet(path, vehicles) == len(vehicles)
+        assert path.stat().st_size == HEADER.size + len(vehicles) * RECORD_DTYPE.itemsize
+
+        fleet = open_fleet(path)
+        assert isinstance(fleet, MappedFleet)
+        assert [str(vehicle) for vehicle in fleet.to_vehicles()] == [str(vehicle) for vehicle in vehicles]
+
+    def test_distances_and_best_vehicle(self, tmp_path, vehicles):
+        path = tmp_path / "fleet.bin"
+        write_fleet(path, VehicleFleet.from_vehicles(vehicles))
+        fleet = open_fleet(path)
+        assert fleet.compute_maximal_distances().tolist() == [v.compute_maximal_distance() for v in vehicles]
+        assert fleet.find_best_indices(k=2).tolist() == [4, 5]
+
+    def test_columns_are_not_copied(self, tmp_path, vehicles):
+        path = tmp_path / "fleet.bin"
+        write_fleet(path, vehicles)
+        fleet = open_fleet(path)
+        assert isinstance(fleet.records, np.memmap)
+        for column in (fleet.kind, fleet.year, fleet.tank_size, fleet.consumption):
+            assert np.shares_memory(column, fleet.records)
+
+    def test_streamed_write_in_chunks(self, tmp_path, vehicles):
+        path = tmp_path / "fleet.bin"
+        assert write_fleet(path, iter(vehicles), chunk_size=4) == len(vehicles)
+        assert len(open_fleet(path)) == len(vehicles)
+
+    def test_empty_fleet(self, tmp_path):
+        path = tmp_path / "fleet.bin"
+        write_fleet(path, [])
+        fleet = open_fleet(path)
+        assert len(fleet) == 0
+        assert fleet.compute_maximal_distances().tolist() == []
+
+    def test_values_out_of_range(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_fleet(tmp_path / "fleet.bin", [Car(2005, 2 ** 40, 5, True)])
+
+    @pytest.mark.parametrize("content", [
+        b"",
+        b"NOPE" + bytes(12),
+        HEADER.pack(b"VFLT", 99, RECORD_DTYPE.itemsize, 0),
+    ])
+    def test_invalid_header(self, tmp_path, content):
+        path = tmp_path / "fleet.bin"
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            open_fleet(path)
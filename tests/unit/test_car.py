@@ -62,3 +62,53 @@ class TestCar:
     def test_car_invalid_inputs(self, create_car, year, tank_size, consumption, technical_inspection):
         with pytest.raises(ValueError):
             create_car(year, tank_size, consumption, technical_inspection)
+
+
+class TestCarBulk:
+    def test_bulk_matches_constructor(self):
+        columns = ([2005, 1995, 2015], [50, 50, 0], [5, 5, 5], [True, True, False])
+        cars = Car.bulk(*columns)
+        expected = [Car(*arguments) for arguments in zip(*columns)]
+        assert [str(car) for car in cars] == [str(car) for car in expected]
+        assert [car.compute_maximal_distance() for car in cars] == [10, 9, 0]
+
+    def test_bulk_accepts_numpy_arrays(self):
+        import numpy as np
+        cars = Car.bulk(np.array([2005, 2015]), np.array([50, 60]), np.array([5, 6]), np.array([True, False]))
+        assert type(cars[0].year) is int
+        assert type(cars[1].technical_inspection) is bool
+        assert str(cars[0]) == "Car(year=2005, tank_size=50, consumption=5, technical_inspection=True)"
+
+    def test_bulk_cars_validate_assignments(self):
+        car = Car.bulk([2005], [50], [5], [True])[0]
+        with pytest.raises(ValueError):
+            car.consumption = 0
+
+    @pytest.mark.parametrize("columns, expected_exception, expected_indices", [
+        (([2005, -1, 0], [50, 50, 50], [5, 5, 5], [True, True, True]), ValueError, "[1, 2]"),
+        (([2005, 2005.0, '2005'], [50, 50, 50], [5, 5, 5], [True, True, True]), TypeError, "[1, 2]"),
+        (([2005, 2005], [50, -50], [5, 5], [True, True]), ValueError, "[1]"),
+        (([2005, 2005], [50, 50], [0, 5], [True, True]), ValueError, "[0]"),
+        (([2005, 2005], [50, 50], [5, 5], [True, "Yes"]), ValueError, "[1]"),
+        (([2005, 2005], [50, 50], [5, 5], [True, 1]), ValueError, "[1]"),
+    ])
+    def test_bulk_invalid_columns(self, columns, expected_exception, expected_indices):
+        with pytest.raises(expected_exception, match=expected_indices.replace('[', r'\[').replace(']', r'\]')):
+            Car.bulk(*columns)
+
+    @pytest.mark.parametrize("columns, expected_exception", [
+        (([2005, -1], [50, "x"], [5, 5], [True, True]), ValueError),  # row 1 fails on its year first
+        (([2005, 2005], [50, "x"], [0, 5], [True, True]), ValueError),  # row 0 fails on its consumption
+        (([2005, 2005], ["x", 50], [0, 5], [True, True]), TypeError),  # row 0 fails on its tank size first
+    ])
+    def test_bulk_raises_first_row_error(self, columns, expected_exception):
+        with pytest.raises(expected_exception):
+            Car.bulk(*columns)
+
+    def test_bulk_column_lengths(self):
+        with pytest.raises(ValueError):
+            Car.bulk([2005, 2005], [50], [5, 5], [True, True])
+
+    def test_bulk_trusted_skips_validation(self):
+        cars = Car.bulk([2005, -1], [50, 50], [5, 5], [True, True], trusted=True)
+        assert cars[1].year == -1
@@ -63,4 +63,31 @@ class TestCar:
         elif car.year == 1800:
             assert distance <= car.tank_size // car.consumption
         elif car.year == 2100:
-            assert distance >= car.tank_size // car.consumption
\ No newline at end of file
+            assert distance >= car.tank_size // car.consumption
+
+
+class TestCarBulk:
+    @given(st.lists(st.tuples(valid_years, valid_tank_sizes, valid_consumptions, valid_technical_inspections),
+                    max_size=20))
+    def test_bulk_matches_constructor(self, rows):
+        """Test that bulk construction builds the same cars as the constructor."""
+        columns = [list(column) for column in zip(*rows)] or [[], [], [], []]
+        assert [str(car) for car in Car.bulk(*columns)] == [str(Car(*row)) for row in rows]
+
+    @given(st.lists(st.one_of(valid_years, st.integers(max_value=0), st.floats(), st.text()), min_size=1,
+                    max_size=10))
+    def test_bulk_raises_like_constructor(self, years):
+        """Test that bulk construction raises the exception the first invalid constructor call raises."""
+        expected = None
+        for year in years:
+            try:
+                Car(year, 50, 5, True)
+            except (TypeError, ValueError) as error:
+                expected = type(error)
+                break
+        count = len(years)
+        if expected is None:
+            assert len(Car.bulk(years, [50] * count, [5] * count, [True] * count)) == count
+        else:
+            with pytest.raises(expected):
+                Car.bulk(years, [50] * count, [5] * count, [True] * count)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import BIKE, CAR, VehicleFleet
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),
+        Car(1995, 50, 5, True),
+        Car(2015, 50, 5, True),
+        Car(2005, 50, 5, False),
+        Car(2005, 0, 5, True),
+        Bike(2005, 1, True),
+        Bike(2005, 2, False),
+        Bike(2005, 10, False),
+    ]
+
+
+class TestVehicleFleet:
+    def test_from_vehicles_columns(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert len(fleet) == len(vehicles)
+        assert fleet.kind.tolist() == [CAR] * 5 + [BIKE] * 3
+        assert fleet.year.dtype == np.int64
+        assert fleet.tank_size.tolist() == [50, 50, 50, 50, 0, 0, 0, 0]
+        assert fleet.technical_inspection.tolist() == [True, True, True, False, True, False, False, False]
+        assert fleet.saddle_comfort.tolist() == [False] * 5 + [True, False, False]
+
+    def test_compute_maximal_distances(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        expected = [vehicle.compute_maximal_distance() for vehicle in vehicles]
+        assert fleet.compute_maximal_distances().tolist() == expected
+        assert expected == [10, 9, 11, 0, 0, 200, 50, 10]
+
+    def test_round_trip(self, vehicles):
+        rebuilt = VehicleFleet.from_vehicles(vehicles).to_vehicles()
+        assert [str(vehicle) for vehicle in rebuilt] == [str(vehicle) for vehicle in vehicles]
+        assert [type(vehicle) for vehicle in rebuilt] == [type(vehicle) for vehicle in vehicles]
+
+    def test_empty_fleet(self):
+        fleet = VehicleFleet.from_vehicles([])
+        assert len(fleet) == 0
+        assert fleet.compute_maximal_distances().tolist() == []
+        assert fleet.to_vehicles() == []
+
+    def test_unsupported_vehicle_type(self):
+        with pytest.raises(TypeError):
+            VehicleFleet.from_vehicles(["Not a vehicle"])
+
+    def test_values_outside_int64(self):
+        with pytest.raises(ValueError, match='tank_size'):
+            VehicleFleet.from_vehicles([Car(2005, 50, 5, True), Car(2005, 10 ** 30, 5, True)])
+        with pytest.raises(ValueError, match='consumption'):
+            VehicleFleet.from_vehicles([Bike(2005, 2 ** 63, True)])
+
+    @pytest.mark.parametrize('column, value, message', [
+        ('kind', 7, 'CAR or BIKE'),
+        ('kind', -1, 'CAR or BIKE'),
+        ('consumption', 0, 'consumption must be a positive integer'),
+        ('year', 0, 'year of manufacture must be a positive integer'),
+        ('tank_size', -1, 'tank size must be a non-negative integer'),
+    ])
+    def test_invalid_rows(self, column, value, message):
+        columns = {'kind': [CAR, BIKE], 'year': [2005, 2005], 'tank_size': [50, 0], 'consumption': [5, 2],
+                   'technical_inspection': [True, False], 'saddle_comfort': [False, True]}
+        columns[column] = [columns[column][0], value]
+        with pytest.raises(ValueError, match=message):
+            VehicleFleet(**columns)
+
+    def test_mismatched_column_lengths(self):
+        with pytest.raises(ValueError):
+            VehicleFleet([CAR, CAR], [2005], [50, 50], [5, 5], [True, True], [False, False])
+
+    def test_find_best_indices(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles + [Bike(2005, 1, True)])
+        assert fleet.find_best_indices().tolist() == [8]
+        assert fleet.find_best_indices(k=4).tolist() == [8, 5, 6, 2]
+        assert len(fleet.find_best_indices(k=100)) == 9
+
+    def test_find_best_indices_invalid_k(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        with pytest.raises(ValueError):
+            fleet.find_best_indices(k=0)
@@ -0,0 +1,48 @@
+from hypothesis import given, strategies as st
+from technical_test_fortis.car import Car
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.vehicle import find_best_vehicles
+
+# Define strategies for valid inputs
+valid_years = st.integers(min_value=1800, max_value=2100)
+valid_tank_sizes = st.integers(min_value=0, max_value=10 ** 6)
+valid_consumptions = st.integers(min_value=1, max_value=200)
+
+valid_cars = st.builds(
+    Car,
+    year=valid_years,
+    tank_size=valid_tank_sizes,
+    consumption=valid_consumptions,
+    technical_inspection=st.booleans()
+)
+
+valid_bikes = st.builds(
+    Bike,
+    year=valid_years,
+    consumption=valid_consumptions,
+    saddle_comfort=st.booleans()
+)
+
+valid_fleets = st.lists(st.one_of(valid_cars, valid_bikes), max_size=50)
+
+
+class TestVehicleFleet:
+    @given(valid_fleets)
+    def test_compute_maximal_distances_matches_scalar(self, vehicles):
+        """Test that the vectorized distances are identical to the per-object ones."""
+        distances = VehicleFleet.from_vehicles(vehicles).compute_maximal_distances()
+        assert distances.tolist() == [vehicle.compute_maximal_distance() for vehicle in vehicles]
+
+    @given(valid_fleets)
+    def test_round_trip(self, vehicles):
+        """Test that a fleet rebuilds the vehicles it was created from."""
+        rebuilt = VehicleFleet.from_vehicles(vehicles).to_vehicles()
+        assert [str(vehicle) for vehicle in rebuilt] == [str(vehicle) for vehicle in vehicles]
+
+    @given(valid_fleets, st.integers(min_value=1, max_value=60))
+    def test_find_best_indices_matches_find_best_vehicles(self, vehicles, k):
+        """Test that the columnar top-k selects the same vehicles as find_best_vehicles."""
+        indices = VehicleFleet.from_vehicles(vehicles).find_best_indices(k)
+        expected = find_best_vehicles(vehicles, k)
+        assert [vehicles[index] for index in indices] == expected
@@ -0,0 +1,67 @@
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.index import DistanceIndex
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),  # 10
+        Bike(2005, 1, True),  # 200
+        Car(2015, 50, 5, True),  # 11
+        Bike(2005, 2, False),  # 50
+        Car(2005, 50, 5, False),  # 0
+        Car(2005, 50, 5, True),  # 10
+    ]
+
+
+class TestDistanceIndex:
+    def test_threshold_query(self, vehicles):
+        index = DistanceIndex(vehicles)
+        assert index.at_least(11) == [vehicles[2], vehicles[3], vehicles[1]]
+        assert index.at_least(10) == [vehicles[0], vehicles[5], vehicles[2], vehicles[3], vehicles[1]]
+        assert index.at_least(10.5) == [vehicles[2], vehicles[3], vehicles[1]]
+        assert index.count_at_least(10) == 5
+        assert index.at_least(201) == []
+
+    def test_range_query(self, vehicles):
+        index = DistanceIndex(vehicles)
+        assert index.between(10, 50) == [vehicles[0], vehicles[5], vehicles[2], vehicles[3]]
+        assert index.between(10, 10.5) == [vehicles[0], vehicles[5]]
+        assert index.between(50, 10) == []
+
+    def test_best(self, vehicles):
+        index = DistanceIndex(vehicles)
+        assert index.best() is vehicles[1]
+        assert DistanceIndex().best() is None
+
+    def test_insert_and_remove(self, vehicles):
+        index = DistanceIndex(vehicles[:3])
+        index.insert(vehicles[3])
+        assert index.between(50, 50) == [vehicles[3]]
+        index.remove(vehicles[1])
+        assert vehicles[1] not in index
+        assert index.best() is vehicles[3]
+        assert len(index) == 3
+
+    def test_update_keeps_insertion_order(self, vehicles):
+        index = DistanceIndex(vehicles)
+        vehicles[4].technical_inspection = True
+        index.update(vehicles[4])
+        assert index.distance(vehicles[4]) == 10
+        assert index.between(10, 10) == [vehicles[0], vehicles[4], vehicles[5]]
+        vehicles[1].consumption = 100
+        index.update(vehicles[1])
+        assert index.best() is vehicles[3]
+
+    def test_invalid_operations(self, vehicles):
+        index = DistanceIndex(vehicles[:2])
+        with pytest.raises(ValueError):
+            index.insert(vehicles[0])
+        with pytest.raises(KeyError):
+            index.remove(vehicles[2])
+        with pytest.raises(TypeError):
+            index.insert("Not a vehicle")
+        with pytest.raises(ValueError):
+            DistanceIndex([vehicles[0], vehicles[0]])
@@ -0,0 +1,62 @@
+from hypothesis import given, strategies as st
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.index import DistanceIndex
+
+# Define strategies for valid inputs
+valid_years = st.integers(min_value=1800, max_value=2100)
+valid_tank_sizes = st.integers(min_value=0, max_value=100)
+valid_consumptions = st.integers(min_value=1, max_value=20)
+
+valid_cars = st.builds(Car, year=valid_years, tank_size=valid_tank_sizes, consumption=valid_consumptions,
+                       technical_inspection=st.booleans())
+valid_bikes = st.builds(Bike, year=valid_years, consumption=valid_consumptions, saddle_comfort=st.booleans())
+valid_vehicles = st.lists(st.one_of(valid_cars, valid_bikes), max_size=30)
+
+# Operations: (kind, position, value), applied to the vehicle at position modulo the fleet size.
+operations = st.lists(st.tuples(st.sampled_from(['consumption', 'inspection', 'remove', 'insert']),
+                                st.integers(min_value=0, max_value=100), st.integers(min_value=1, max_value=20)),
+                      max_size=20)
+
+
+def _scan(vehicles, low, high):
+    return [vehicle for vehicle in vehicles if low <= vehicle.compute_maximal_distance() <= high]
+
+
+class TestDistanceIndex:
+    @given(valid_vehicles, st.integers(min_value=0, max_value=250), st.integers(min_value=0, max_value=250))
+    def test_queries_match_brute_force(self, vehicles, low, high):
+        """Test that range and threshold queries agree with a scan over the vehicles."""
+        index = DistanceIndex(vehicles)
+        key = lambda vehicle: (vehicle.compute_maximal_distance(), vehicles.index(vehicle))
+        assert index.between(low, high) == sorted(_scan(vehicles, low, high), key=key)
+        assert index.at_least(low) == sorted(_scan(vehicles, low, float('inf')), key=key)
+
+    @given(valid_vehicles, operations, valid_vehicles, st.integers(min_value=0, max_value=250))
+    def test_incremental_updates_match_brute_force(self, vehicles, changes, extra, threshold):
+        """Test that the index stays consistent with a scan while vehicles change."""
+        index = DistanceIndex(vehicles)
+        fleet = list(vehicles)
+        extra = iter(extra)
+        for kind, position, value in changes:
+            if kind == 'insert':
+                vehicle = next(extra, None)
+                if vehicle is not None:
+                    index.insert(vehicle)
+                    fleet.append(vehicle)
+                continue
+            if not fleet:
+                continue
+            vehicle = fleet[position % len(fleet)]
+            if kind == 'remove':
+                index.remove(vehicle)
+                fleet.remove(vehicle)
+                continue
+            if kind == 'consumption':
+                vehicle.consumption = value
+            elif isinstance(vehicle, Car):
+                vehicle.technical_inspection = not vehicle.technical_inspection
+            index.update(vehicle)
+
+        assert len(index) == len(fleet)
+        assert set(map(id, index.at_least(threshold))) == set(map(id, _scan(fleet, threshold, float('inf'))))
@@ -0,0 +1,140 @@
+import io
+import json
+
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.ingest import (RowError, iter_fleet_chunks, read_csv, read_jsonl, read_vehicles,
+                                          vehicle_from_record)
+from technical_test_fortis.vehicle import find_best_vehicles
+
+CSV_TEXT = """type,year,tank_size,consumption,technical_inspection,saddle_comfort
+car,2005,50,5,true,
+bike,2005,,1,,True
+car,2015,50,5,1,
+car,2005,50,0,true,
+plane,2005,50,5,true,
+car,2005,fifty,5,true,
+bike,2005,,2,,maybe
+car,2005,50,5,false,
+"""
+
+JSONL_LINES = [
+    {"type": "car", "year": 2005, "tank_size": 50, "consumption": 5, "technical_inspection": True},
+    {"type": "bike", "year": 2005, "consumption": 1, "saddle_comfort": True},
+    {"type": "car", "year": 2005, "tank_size": 50, "consumption": 5},
+    {"type": "car", "year": 2005.5, "tank_size": 50, "consumption": 5, "technical_inspection": True},
+]
+
+
+@pytest.fixture
+def jsonl_text():
+    lines = [json.dumps(record) for record in JSONL_LINES]
+    lines.insert(2, '')
+    lines.append('{not json')
+    lines.append('[1, 2]')
+    return '\n'.join(lines) + '\n'
+
+
+class TestVehicleFromRecord:
+    def test_car_and_bike(self):
+        car = vehicle_from_record(JSONL_LINES[0])
+        bike = vehicle_from_record(JSONL_LINES[1])
+        assert str(car) == "Car(year=2005, tank_size=50, consumption=5, technical_inspection=True)"
+        assert str(bike) == "Bike(year=2005, consumption=1, saddle_comfort=True)"
+
+    @pytest.mark.parametrize("record, expected_exception", [
+        ({"type": "car", "year": 2005}, KeyError),
+        ({"type": "boat"}, ValueError),
+        (JSONL_LINES[3], TypeError),
+    ])
+    def test_invalid_records(self, record, expected_exception):
+        with pytest.raises(expected_exception):
+            vehicle_from_record(record)
+
+
+class TestReadCsv:
+    def test_valid_rows_and_errors(self):
+        errors = []
+        vehicles = list(read_csv(io.StringIO(CSV_TEXT), on_error=errors.append))
+        assert [str(vehicle) for vehicle in vehicles] == [
+            "Car(year=2005, tank_size=50, consumption=5, technical_inspection=True)",
+            "Bike(year=2005, consumption=1, saddle_comfort=True)",
+            "Car(year=2015, tank_size=50, consumption=5, technical_inspection=True)",
+            "Car(year=2005, tank_size=50, consumption=5, technical_inspection=False)",
+        ]
+        assert [error.line_number for error in errors] == [5, 6, 7, 8]
+        assert all(isinstance(error, RowError) for error in errors)
+
+    def test_type_is_case_insensitive(self):
+        text = "type,year,tank_size,consumption,technical_inspection,saddle_comfort\nCar,2005,50,5,true,\n"
+        assert isinstance(next(read_csv(io.StringIO(text))), Car)
+
+    def test_malformed_row_is_skipped(self):
+        # A field over csv.field_size_limit() makes the reader raise csv.Error.
+        text = CSV_TEXT.replace("plane", "x" * 200_000)
+        errors = []
+        vehicles = list(read_csv(io.StringIO(text), on_error=errors.append))
+        assert len(vehicles) == 4
+        assert [error.line_number for error in errors] == [5, 6, 7, 8]
+        assert errors[1].message.startswith("invalid CSV")
+
+    def test_default_error_handler_logs(self, caplog):
+        vehicles = list(read_csv(io.StringIO(CSV_TEXT)))
+        assert len(vehicles) == 4
+        assert "line 5" in caplog.text
+
+    def test_read_from_path(self, tmp_path):
+        path = tmp_path / "fleet.csv"
+        path.write_text(CSV_TEXT)
+        assert len(list(read_vehicles(path, on_error=lambda error: None))) == 4
+
+    def test_is_lazy(self):
+        vehicles = read_csv(io.StringIO(CSV_TEXT))
+        assert isinstance(next(vehicles), Car)
+        assert isinstance(next(vehicles), Bike)
+
+
+class TestReadJsonl:
+    def test_valid_lines_and_errors(self, jsonl_text):
+        errors = []
+        vehicles = list(read_jsonl(io.StringIO(jsonl_text), on_error=errors.append))
+        assert [type(vehicle) for vehicle in vehicles] == [Car, Bike]
+        assert [error.line_number for error in errors] == [4, 5, 6, 7]
+        assert errors[0].message == "missing field 'technical_inspection'"
+
+    def test_type_is_case_insensitive(self):
+        text = '{"type": "Car", "year": 2005, "tank_size": 50, "consumption": 5, "technical_inspection": true}\n'
+        assert isinstance(next(read_jsonl(io.StringIO(text))), Car)
+
+    def test_deeply_nested_line_is_skipped(self):
+        errors = []
+        text = '[' * 100_000 + '\n' + json.dumps(JSONL_LINES[1]) + '\n'
+        assert [type(vehicle) for vehicle in read_jsonl(io.StringIO(text), on_error=errors.append)] == [Bike]
+        assert [error.line_number for error in errors] == [1]
+
+    def test_read_from_path(self, tmp_path, jsonl_text):
+        path = tmp_path / "fleet.jsonl"
+        path.write_text(jsonl_text)
+        assert len(list(read_vehicles(path, on_error=lambda error: None))) == 2
+
+    def test_unknown_extension(self, tmp_path):
+        with pytest.raises(ValueError):
+            read_vehicles(tmp_path / "fleet.xml")
+
+
+class TestPipeline:
+    def test_best_vehicle_from_stream(self):
+        best = find_best_vehicles(read_csv(io.StringIO(CSV_TEXT), on_error=lambda error: None), k=2)
+        assert [vehicle.compute_maximal_distance() for vehicle in best] == [200, 11]
+
+    def test_fleet_chunks(self):
+        vehicles = list(read_csv(io.StringIO(CSV_TEXT), on_error=lambda error: None))
+        chunks = list(iter_fleet_chunks(iter(vehicles), chunk_size=3))
+        assert [len(chunk) for chunk in chunks] == [3, 1]
+        distances = [distance for chunk in chunks for distance in chunk.compute_maximal_distances().tolist()]
+        assert distances == [vehicle.compute_maximal_distance() for vehicle in vehicles]
+
+    def test_fleet_chunks_invalid_size(self):
+        with pytest.raises(ValueError):
+            list(iter_fleet_chunks([], chunk_size=0))
@@ -0,0 +1,83 @@
+import pytest
+from technical_test_fortis import instrumentation
+from technical_test_fortis import vehicle as vehicle_module
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+
+
+@pytest.fixture
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_counts_per_method_and_type(self, instrumented):
+        cars = [Car(2005, 50, 5, True) for _ in range(3)]
+        bike = Bike(2005, 1, True)
+        for car in cars:
+            car.compute_maximal_distance()
+        vehicle_module.find_best_vehicle(cars[0], bike)
+        vehicle_module.find_best_vehicles(cars + [bike], k=2)
+
+        data = instrumentation.snapshot()
+        assert set(data['__init__']) == {'Car', 'Bike'}
+        assert data['__init__']['Car']['calls'] == 3
+        assert data['__init__']['Bike']['calls'] == 1
+        assert data['Vehicle.__init__']['Car']['calls'] == 3
+        assert data['compute_maximal_distance']['Car']['calls'] == 3 + 1 + 3
+        assert data['compute_maximal_distance']['Bike']['calls'] == 2
+        assert data['find_best_vehicle']['any']['calls'] == 1
+        assert data['find_best_vehicles']['any']['calls'] == 1
+        assert data['__init__']['Car']['seconds'] > 0
+
+    def test_validation_errors_are_counted(self, instrumented):
+        with pytest.raises(ValueError):
+            Car(-1, 50, 5, True)
+        assert instrumentation.snapshot()['__init__']['Car']['calls'] == 1
+
+    def test_sampling(self, instrumented):
+        instrumentation.enable(sample_every=4)
+        car = Car(2005, 50, 5, True)
+        for _ in range(10):
+            car.compute_maximal_distance()
+        statistics = instrumentation.snapshot()['compute_maximal_distance']['Car']
+        assert (statistics['calls'], statistics['timed_calls']) == (10, 2)
+        assert statistics['estimated_seconds'] == pytest.approx(statistics['seconds'] * 5)
+
+    def test_disable_restores_originals(self):
+        original_init = Car.__dict__['__init__']
+        original_compute = Bike.__dict__['compute_maximal_distance']
+        original_find = vehicle_module.find_best_vehicle
+        instrumentation.enable()
+        assert instrumentation.is_enabled()
+        assert Car.__dict__['__init__'] is not original_init
+        instrumentation.disable()
+        assert not instrumentation.is_enabled()
+        assert Car.__dict__['__init__'] is original_init
+        assert Bike.__dict__['compute_maximal_distance'] is original_compute
+        assert vehicle_module.find_best_vehicle is original_find
+
+    def test_disabled_collects_nothing(self):
+        instrumentation.reset()
+        Car(2005, 50, 5, True).compute_maximal_distance()
+        assert instrumentation.snapshot() == {}
+
+    def test_invalid_sampling_rate(self):
+        with pytest.raises(ValueError):
+            instrumentation.enable(sample_every=0)
+        assert not instrumentation.is_enabled()
+
+    def test_prometheus_export(self, instrumented, tmp_path):
+        Car(2005, 50, 5, True)
+        text = instrumentation.to_prometheus()
+        assert '# TYPE technical_test_fortis_calls_total counter' in text
+        assert 'technical_test_fortis_calls_total{method="__init__",vehicle_type="Car"} 1\n' in text
+
+        path = tmp_path / "fleet.prom"
+        instrumentation.write_prometheus(path)
+        assert path.read_text() == instrumentation.to_prometheus()
+        assert [entry.name for entry in tmp_path.iterdir()] == ["fleet.prom"]
@@ -0,0 +1,122 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.binary import write_fleet
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.lazy import LazyBike, LazyCar, LazyFleetView, lazy_vehicle, open_lazy
+from technical_test_fortis.vehicle import (Vehicle, disable_distance_cache, enable_distance_cache,
+                                           find_best_vehicles)
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),
+        Car(1995, 50, 5, True),
+        Car(2015, 50, 5, False),
+        Bike(2005, 1, True),
+        Bike(2005, 2, False),
+    ]
+
+
+@pytest.fixture(params=['columnar', 'mapped'])
+def view(request, tmp_path, vehicles):
+    if request.param == 'columnar':
+        return LazyFleetView(VehicleFleet.from_vehicles(vehicles))
+    path = tmp_path / "fleet.bin"
+    write_fleet(path, vehicles)
+    return open_lazy(path)
+
+
+class TestLazyVehicles:
+    def test_behaves_like_the_vehicles(self, view, vehicles):
+        assert len(view) == len(vehicles)
+        assert [str(vehicle) for vehicle in view] == [str(vehicle) for vehicle in vehicles]
+        assert [vehicle.compute_maximal_distance() for vehicle in view] == \
+            [vehicle.compute_maximal_distance() for vehicle in vehicles]
+        assert all(isinstance(vehicle, Vehicle) for vehicle in view)
+        assert isinstance(view[0], Car) and isinstance(view[0], LazyCar)
+        assert isinstance(view[3], Bike) and isinstance(view[3], LazyBike)
+        assert type(view[0].year) is int and type(view[0].technical_inspection) is bool
+
+    def test_fields_are_decoded_on_first_access(self, view):
+        car = view[1]
+        assert car.source is view.source and car.index == 1
+        with pytest.raises(AttributeError):
+            object.__getattribute__(car, '_year')
+        assert car.year == 1995
+        assert object.__getattribute__(car, '_year') == 1995
+        with pytest.raises(AttributeError):
+            object.__getattribute__(car, '_consumption')
+
+    def test_view_indexing(self, view):
+        assert view[0] is view[0]
+        assert view[-1] is view[4]
+        assert view[1:3] == [view[1], view[2]]
+        assert view.materialized_count() == 4
+        with pytest.raises(IndexError):
+            view[5]
+        with pytest.raises(IndexError):
+            view[-6]
+        assert view[-5] is view[0]
+        assert view.materialized_count() == 4
+        with pytest.raises(TypeError):
+            view['0']
+
+    def test_numpy_indices(self, view, vehicles):
+        positions = VehicleFleet.from_vehicles(vehicles).find_best_indices(2)
+        assert [view[position] for position in positions] == [view[int(position)] for position in positions]
+        assert view[np.int64(-1)] is view[4]
+        assert lazy_vehicle(view.source, np.int64(2)).index == 2
+
+    def test_assignment_is_validated_and_local(self, view):
+        car = view[0]
+        car.tank_size = 100
+        assert car.compute_maximal_distance() == 20
+        assert view.source.tank_size[0] == 50
+        with pytest.raises(ValueError):
+            car.consumption = 0
+        with pytest.raises(AttributeError):
+            car.colour
+
+    def test_distance_cache(self, view):
+        enable_distance_cache()
+        try:
+            bike = view[3]
+            assert bike.compute_maximal_distance() == 200
+            bike.saddle_comfort = False
+            assert bike.compute_maximal_distance() == 100
+        finally:
+            disable_distance_cache()
+
+    def test_ranking(self, view, vehicles):
+        assert [str(vehicle) for vehicle in find_best_vehicles(view, 3)] == \
+            [str(vehicle) for vehicle in find_best_vehicles(vehicles, 3)]
+
+    def test_lazy_vehicle(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert str(lazy_vehicle(fleet, -2)) == str(vehicles[3])
+        with pytest.raises(IndexError):
+            lazy_vehicle(fleet, len(vehicles))
+
+    def test_memory_scales_with_touched_vehicles(self, tmp_path):
+        count = 200_000
+        rng = np.random.default_rng(0)
+        path = tmp_path / "large.bin"
+        write_fleet(path, VehicleFleet(rng.integers(0, 2, count), rng.integers(1950, 2030, count),
+                                       rng.integers(0, 100, count), rng.integers(1, 20, count),
+                                       rng.random(count) < 0.8, rng.random(count) < 0.5))
+        tracemalloc.start()
+        try:
+            view = open_lazy(path)
+            reports = [str(view[index]) for index in range(0, count, count // 10)]
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(reports) == 10
+        # Decoding a whole boolean column alone would take count bytes.
+        assert peak < count // 4
+        assert 'technical_inspection' not in view.source.__dict__
@@ -0,0 +1,107 @@
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.leader import ChangeEvent, FleetLeader
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),  # 10
+        Bike(2005, 10, False),  # 10
+        Car(2015, 60, 6, True),  # 11
+        Bike(2005, 20, True),  # 10
+    ]
+
+
+class TestFleetLeader:
+    def test_empty(self):
+        leader = FleetLeader()
+        assert leader.best() is None
+        assert leader.top(3) == []
+        assert len(leader) == 0
+
+    def test_best_and_top(self, vehicles):
+        leader = FleetLeader(vehicles)
+        assert leader.best() is vehicles[2]
+        # On equal distance the later arrival wins.
+        assert leader.top(3) == [vehicles[2], vehicles[3], vehicles[1]]
+        assert leader.top(10) == [vehicles[2], vehicles[3], vehicles[1], vehicles[0]]
+
+    def test_failed_inspection(self, vehicles):
+        leader = FleetLeader(vehicles)
+        leader.update(vehicles[2], technical_inspection=False)
+        assert vehicles[2].technical_inspection is False
+        assert leader.best() is vehicles[3]
+
+    def test_update_keeps_arrival_position(self, vehicles):
+        leader = FleetLeader(vehicles)
+        leader.update(vehicles[2], consumption=60)  # 1
+        leader.update(vehicles[2], consumption=6)  # back to 11
+        assert leader.top(4) == [vehicles[2], vehicles[3], vehicles[1], vehicles[0]]
+        leader.update(vehicles[2], consumption=12)  # 5
+        leader.update(vehicles[0], consumption=5)  # unchanged
+        assert leader.top(4) == [vehicles[3], vehicles[1], vehicles[0], vehicles[2]]
+
+    def test_update_in_place(self, vehicles):
+        leader = FleetLeader(vehicles)
+        vehicles[0].tank_size = 500
+        leader.update(vehicles[0])
+        assert leader.best() is vehicles[0]
+
+    def test_failed_update_still_re_ranks(self, vehicles):
+        leader = FleetLeader(vehicles)
+        with pytest.raises(ValueError):
+            leader.update(vehicles[0], tank_size=500, consumption=0)
+        # The valid first change was applied, the leader follows it.
+        assert vehicles[0].tank_size == 500
+        assert leader.best() is vehicles[0]
+        assert leader.top(2) == [vehicles[0], vehicles[2]]
+
+    def test_retire_and_add_again(self, vehicles):
+        leader = FleetLeader(vehicles)
+        leader.retire(vehicles[2])
+        assert vehicles[2] not in leader
+        assert leader.best() is vehicles[3]
+        leader.add(Car(2005, 50, 5, True))
+        leader.retire(vehicles[3])
+        leader.add(vehicles[3])
+        assert leader.best() is vehicles[3]
+
+    def test_events(self, vehicles):
+        leader = FleetLeader()
+        best = leader.consume([
+            ChangeEvent('add', vehicles[0]),
+            ('add', vehicles[1]),
+            ChangeEvent('add', vehicles[2]),
+            ChangeEvent('update', vehicles[2], {'technical_inspection': False}),
+            ChangeEvent('retire', vehicles[1]),
+        ])
+        assert best is vehicles[0]
+        assert len(leader) == 2
+
+    def test_heap_stays_bounded(self, vehicles):
+        leader = FleetLeader(vehicles)
+        for consumption in range(1, 1000):
+            leader.update(vehicles[0], consumption=consumption)
+        assert len(leader._heap) <= 2 * len(leader) + 17
+        assert leader.top(4)[-1] is vehicles[0]
+
+    def test_invalid_operations(self, vehicles):
+        leader = FleetLeader(vehicles[:1])
+        with pytest.raises(ValueError):
+            leader.add(vehicles[0])
+        with pytest.raises(TypeError):
+            leader.add('car')
+        with pytest.raises(KeyError):
+            leader.retire(vehicles[1])
+        with pytest.raises(KeyError):
+            leader.update(vehicles[1], consumption=2)
+        with pytest.raises(ValueError):
+            leader.apply(ChangeEvent('repaint', vehicles[0]))
+        with pytest.raises(ValueError):
+            leader.update(vehicles[0], consumption=0)
+        with pytest.raises(TypeError):
+            leader.top(1.5)
+        with pytest.raises(ValueError):
+            leader.top(0)
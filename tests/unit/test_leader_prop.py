@@ -0,0 +1,49 @@
+from functools import reduce
+
+from hypothesis import given, settings, strategies as st
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.leader import FleetLeader
+from technical_test_fortis.vehicle import find_best_vehicle, find_best_vehicles
+
+# Small domains so that equal distances, and thus the tie-breaking, are frequent.
+valid_years = st.sampled_from([1995, 2005, 2015])
+valid_tank_sizes = st.integers(min_value=0, max_value=30)
+valid_consumptions = st.integers(min_value=1, max_value=10)
+
+valid_cars = st.builds(Car, year=valid_years, tank_size=valid_tank_sizes, consumption=valid_consumptions,
+                       technical_inspection=st.booleans())
+valid_bikes = st.builds(Bike, year=valid_years, consumption=valid_consumptions, saddle_comfort=st.booleans())
+valid_vehicles = st.one_of(valid_cars, valid_bikes)
+
+events = st.one_of(
+    st.tuples(st.just('add'), valid_vehicles),
+    st.tuples(st.just('retire'), st.integers(min_value=0)),
+    st.tuples(st.just('inspection'), st.integers(min_value=0), st.booleans()),
+    st.tuples(st.just('consumption'), st.integers(min_value=0), valid_consumptions),
+)
+
+
+class TestFleetLeader:
+    @settings(max_examples=100)
+    @given(st.lists(valid_vehicles, max_size=10), st.lists(events, max_size=60), st.integers(min_value=1, max_value=5))
+    def test_matches_a_full_rescan(self, initial, feed, k):
+        """Test that after every event, best() and top(k) equal a full rescan of the fleet in arrival order."""
+        leader = FleetLeader(initial)
+        fleet = list(initial)
+        for event in feed:
+            if event[0] == 'add':
+                leader.add(event[1])
+                fleet.append(event[1])
+            elif fleet:
+                vehicle = fleet[event[1] % len(fleet)]
+                if event[0] == 'retire':
+                    leader.retire(vehicle)
+                    fleet.remove(vehicle)
+                elif event[0] == 'inspection' and isinstance(vehicle, Car):
+                    leader.update(vehicle, technical_inspection=event[2])
+                elif event[0] == 'consumption':
+                    leader.update(vehicle, consumption=event[2])
+
+            assert leader.best() is (reduce(find_best_vehicle, fleet) if fleet else None)
+            assert leader.top(k) == (find_best_vehicles(fleet, k) if fleet else [])
@@ -0,0 +1,86 @@
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.lookup import DistanceTable, year_buckets, year_edges
+from technical_test_fortis.rules import Bracket
+
+
+@pytest.fixture(scope='module')
+def table():
+    return DistanceTable(tank_sizes=range(0, 101), consumptions=range(1, 21))
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),
+        Car(1995, 50, 5, True),
+        Car(2015, 50, 5, True),
+        Car(2000, 73, 7, True),
+        Car(2010, 73, 7, True),
+        Car(2011, 99, 7, True),
+        Car(2005, 50, 5, False),
+        Car(2015, 5000, 5, True),  # tank size outside the domain
+        Car(2015, 50, 50, True),  # consumption outside the domain
+        Bike(2005, 1, True),
+        Bike(2005, 3, False),
+        Bike(2005, 30, True),  # consumption outside the domain
+    ]
+
+
+class TestDistanceTable:
+    def test_table_shapes(self, table):
+        assert table.car_table.shape == (101, 20, 3)
+        assert table.bike_table.shape == (20, 2)
+
+    def test_scalar_lookup(self, table, vehicles):
+        assert [table.distance(vehicle) for vehicle in vehicles] == \
+            [vehicle.compute_maximal_distance() for vehicle in vehicles]
+
+    def test_columnar_lookup(self, table, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert table.distances(fleet).tolist() == fleet.compute_maximal_distances().tolist()
+
+    def test_empty_fleet(self, table):
+        assert table.distances(VehicleFleet.from_vehicles([])).tolist() == []
+
+    @pytest.mark.parametrize("kwargs", [
+        {'tank_sizes': range(0)},
+        {'tank_sizes': range(0, 10, 2)},
+        {'tank_sizes': range(-1, 10)},
+        {'consumptions': range(0, 10)},
+        {'consumptions': [1, 2, 3]},
+    ])
+    def test_invalid_domains(self, kwargs):
+        with pytest.raises(ValueError):
+            DistanceTable(**kwargs)
+
+    def test_every_bucket_matches_the_rules(self, table):
+        compute_maximal_distance = Car.DISTANCE_RULES.compile_scalar()
+        edges = table.year_edges
+        assert table.car_table.shape[2] == len(edges) + 1
+        # The first and last years of every bucket.
+        for year in sorted({1, *edges, *(edge - 1 for edge in edges), 3000}):
+            for tank_size, consumption in ((0, 1), (73, 7), (100, 20), (99, 3)):
+                car = Car(year, tank_size, consumption, True)
+                assert table.distance(car) == compute_maximal_distance(car), car
+                assert table.distances(VehicleFleet.from_vehicles([car])).tolist() == \
+                    [compute_maximal_distance(car)], car
+
+
+class TestYearBuckets:
+    def test_edges_follow_the_brackets(self):
+        assert year_edges() == (2000, 2011)
+        moved = Car.DISTANCE_RULES.replace(brackets=(Bracket('year', 0.9, upper=2005),
+                                                     Bracket('year', 1.2, lower=2005, upper=2015),
+                                                     Bracket('year', 1.1, lower=2014)))
+        assert year_edges(moved) == (2005, 2006, 2015)
+        assert year_edges(Car.DISTANCE_RULES.replace(brackets=())) == ()
+
+    def test_buckets(self):
+        assert year_buckets([1, 1999, 2000, 2010, 2011, 3000], (2000, 2011)).tolist() == [0, 0, 1, 1, 2, 2]
+
+    def test_only_year_brackets(self):
+        with pytest.raises(ValueError):
+            year_edges(Car.DISTANCE_RULES.replace(brackets=(Bracket('tank_size', 0.5, lower=50),)))
@@ -0,0 +1,39 @@
+from hypothesis import given, settings, strategies as st
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.lookup import DistanceTable
+
+TABLE = DistanceTable(tank_sizes=range(0, 201), consumptions=range(1, 31))
+
+# The strategies go beyond the table domains to exercise the fallback path.
+valid_years = st.integers(min_value=1800, max_value=2100)
+valid_tank_sizes = st.integers(min_value=0, max_value=400)
+valid_consumptions = st.integers(min_value=1, max_value=60)
+
+valid_cars = st.builds(Car, year=valid_years, tank_size=valid_tank_sizes, consumption=valid_consumptions,
+                       technical_inspection=st.booleans())
+valid_bikes = st.builds(Bike, year=valid_years, consumption=valid_consumptions, saddle_comfort=st.booleans())
+valid_vehicles = st.one_of(valid_cars, valid_bikes)
+
+
+class TestDistanceTable:
+    @given(valid_vehicles)
+    def test_scalar_lookup_is_identical(self, vehicle):
+        """Test that the scalar lookup is identical to compute_maximal_distance, inside and outside the domain."""
+        assert TABLE.distance(vehicle) == vehicle.compute_maximal_distance()
+
+    @settings(max_examples=50)
+    @given(st.lists(valid_vehicles, max_size=50))
+    def test_columnar_lookup_is_identical(self, vehicles):
+        """Test that the columnar lookup is identical to the per-object distances."""
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert TABLE.distances(fleet).tolist() == [vehicle.compute_maximal_distance() for vehicle in vehicles]
+
+    def test_whole_domain_is_identical(self):
+        """Test every table entry against the scalar path."""
+        for tank_size in TABLE.tank_sizes:
+            for consumption in TABLE.consumptions:
+                for year in (1999, 2000, 2010, 2011):
+                    car = Car(year, tank_size, consumption, True)
+                    assert TABLE.distance(car) == car.compute_maximal_distance()
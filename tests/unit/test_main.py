@@ -0,0 +1,118 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+from technical_test_fortis.__main__ import main
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.binary import write_fleet
+from technical_test_fortis.car import Car
+from technical_test_fortis.ingest import record_from_vehicle
+
+# Cumulative time allowed for importing the command-line entry point, measured with -X importtime.
+IMPORT_BUDGET_SECONDS = 0.1
+
+VEHICLES = [
+    Car(2015, 60, 6, True),  # 11
+    Bike(2005, 10, False),  # 10
+    Car(2005, 50, 5, True),  # 10
+    Bike(2005, 1, True),  # 200
+    Car(2005, 50, 5, False),  # 0
+]
+
+
+@pytest.fixture
+def jsonl_path(tmp_path):
+    path = tmp_path / "fleet.jsonl"
+    path.write_text(''.join(json.dumps(record_from_vehicle(vehicle)) + '\n' for vehicle in VEHICLES))
+    return path
+
+
+def run(argv, capsys):
+    status = main([str(argument) for argument in argv])
+    out, err = capsys.readouterr()
+    return status, out.splitlines(), err
+
+
+class TestCommandLine:
+    def test_best(self, jsonl_path, capsys):
+        assert run(['best', jsonl_path], capsys)[:2] == (0, [f"200\t{VEHICLES[3]}"])
+
+    def test_top(self, jsonl_path, capsys):
+        status, lines, _ = run(['top', '-k', 3, jsonl_path], capsys)
+        assert status == 0
+        # On equal distance the later vehicle wins.
+        assert lines == [f"200\t{VEHICLES[3]}", f"11\t{VEHICLES[0]}", f"10\t{VEHICLES[2]}"]
+
+    def test_histogram(self, jsonl_path, capsys):
+        status, lines, _ = run(['histogram', '--bin-width', 100, jsonl_path], capsys)
+        assert status == 0
+        assert [line.split()[:2] for line in lines] == [['0-99', '4'], ['100-199', '0'], ['200-299', '1']]
+
+    def test_histogram_size_depends_on_the_non_empty_bins(self, tmp_path, capsys):
+        path = tmp_path / "fleet.jsonl"
+        vehicles = [Car(2005, 10, 1, True), Car(2005, 10 ** 12, 1, True), Car(2005, 10 ** 12 + 5, 1, True)]
+        path.write_text(''.join(json.dumps(record_from_vehicle(vehicle)) + '\n' for vehicle in vehicles))
+        for columnar in ([], ['--columnar']):
+            status, lines, _ = run(['histogram', '--bin-width', 10, path] + columnar, capsys)
+            assert status == 0
+            assert [line.split()[:2] for line in lines] == [
+                ['0-9', '0'], ['10-19', '1'], [f'20-{10 ** 12 - 1}', '0'], [f'{10 ** 12}-{10 ** 12 + 9}', '2']]
+
+    @pytest.mark.parametrize('command', [['best'], ['top', '-k', 4], ['histogram', '--bin-width', 5]])
+    def test_columnar_path_is_identical(self, jsonl_path, tmp_path, capsys, command):
+        expected = run(command + [jsonl_path], capsys)
+        assert run(command + ['--columnar', '--chunk-size', 2, jsonl_path], capsys) == expected
+        binary_path = tmp_path / "fleet.bin"
+        write_fleet(binary_path, VEHICLES)
+        assert run(command + [binary_path], capsys) == expected
+
+    def test_stdin(self, jsonl_path, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(jsonl_path.read_text()))
+        assert run(['best'], capsys)[:2] == (0, [f"200\t{VEHICLES[3]}"])
+        csv_text = "type,year,tank_size,consumption,technical_inspection,saddle_comfort\ncar,2005,50,5,true,\n"
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(csv_text))
+        assert run(['best', '--format', 'csv', '-'], capsys)[:2] == (0, [f"10\t{VEHICLES[2]}"])
+
+    def test_errors(self, tmp_path, capsys):
+        empty = tmp_path / "empty.jsonl"
+        empty.write_text('')
+        assert run(['best', empty], capsys)[0] == 1
+        assert run(['best', tmp_path / "fleet.txt"], capsys)[0] == 2
+        assert run(['best', tmp_path / "missing.csv"], capsys)[0] == 2
+        with pytest.raises(SystemExit):
+            main(['top', '-k', '0'])
+
+
+def _cumulative_import_seconds(statement: str) -> float:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True,
+                            check=True)
+    microseconds = 0
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix('import time:').split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        # Nested imports are indented, only the top-level ones are added up.
+        if fields[2].startswith(' technical_test_fortis'):
+            microseconds += int(fields[1])
+    return microseconds / 1e6
+
+
+class TestStartup:
+    def test_import_does_not_load_numpy(self):
+        statement = ("import sys, technical_test_fortis, technical_test_fortis.__main__, technical_test_fortis.ingest; "
+                     "print('numpy' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', statement], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == 'False'
+
+    def test_object_path_does_not_load_numpy(self, jsonl_path):
+        statement = ("import sys; from technical_test_fortis.__main__ import main; "
+                     f"main(['top', {str(jsonl_path)!r}]); print('numpy' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', statement], capture_output=True, text=True, check=True)
+        assert result.stdout.splitlines()[-1] == 'False'
+
+    def test_import_time_budget(self):
+        # The fastest of a few runs is kept, to be robust against a busy machine.
+        seconds = min(_cumulative_import_seconds('import technical_test_fortis.__main__') for _ in range(3))
+        assert seconds < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.parallel import SharedFleet, evaluate_fleet, merge_top_k, parallel_find_best_indices
+
+
+@pytest.fixture
+def fleet():
+    rng = np.random.default_rng(7)
+    count = 5000
+    # Small value ranges produce many ties, which exercises the merge of the chunks.
+    return VehicleFleet(rng.integers(0, 2, count), rng.integers(1990, 2020, count), rng.integers(0, 60, count),
+                        rng.integers(1, 10, count), rng.random(count) < 0.8, rng.random(count) < 0.5)
+
+
+class TestParallelEvaluation:
+    @pytest.mark.parametrize("workers, chunk_size", [
+        (1, None),
+        (1, 333),
+        (2, None),
+        (3, 1000),
+    ])
+    def test_matches_sequential_evaluation(self, fleet, workers, chunk_size):
+        distances, best = evaluate_fleet(fleet, k=10, workers=workers, chunk_size=chunk_size)
+        assert distances.tolist() == fleet.compute_maximal_distances().tolist()
+        assert best.tolist() == fleet.find_best_indices(10).tolist()
+
+    def test_tie_semantics(self):
+        vehicles = [Bike(2005, 1, True), Car(2005, 50, 5, True), Bike(2005, 1, True), Bike(2005, 1, True)]
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert parallel_find_best_indices(fleet, k=3, workers=2, chunk_size=1).tolist() == [3, 2, 0]
+
+    def test_empty_fleet(self):
+        distances, best = evaluate_fleet(VehicleFleet.from_vehicles([]), workers=2)
+        assert distances.tolist() == []
+        assert best.tolist() == []
+
+    def test_int64_values(self):
+        # The shared records keep the int64 columns, unlike the 32 bits file format.
+        fleet = VehicleFleet.from_vehicles([Car(2015, 2 ** 40, 1, True), Car(2005, 2 ** 50, 3, True),
+                                            Bike(2005, 1, True)])
+        distances, best = evaluate_fleet(fleet, k=3, workers=2, chunk_size=1)
+        assert distances.tolist() == fleet.compute_maximal_distances().tolist()
+        assert best.tolist() == fleet.find_best_indices(3).tolist()
+
+    @pytest.mark.parametrize("k, workers, chunk_size, expected_exception", [
+        (0, 1, None, ValueError),
+        (1, 0, None, ValueError),
+        (1, 1.5, None, TypeError),
+        (1, 1, 0, ValueError),
+        (1, 1, -1, ValueError),
+        (1, 1, 2.0, TypeError),
+    ])
+    def test_invalid_arguments(self, fleet, k, workers, chunk_size, expected_exception):
+        with pytest.raises(expected_exception):
+            evaluate_fleet(fleet, k=k, workers=workers, chunk_size=chunk_size)
+
+    def test_merge_top_k(self):
+        distances = np.array([5, 7, 7, 5])
+        indices = np.array([10, 3, 8, 12])
+        assert merge_top_k(distances, indices, 3).tolist() == [8, 3, 12]
+
+    def test_shared_fleet_is_unlinked(self, fleet):
+        with SharedFleet(fleet) as shared:
+            assert shared.fleet.year.tolist() == fleet.year.tolist()
+            name = shared.name
+        from multiprocessing import shared_memory
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
@@ -0,0 +1,195 @@
+import threading
+
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.registry import FleetRegistry
+from technical_test_fortis.vehicle import find_best_vehicles
+
+
+def fields_of(vehicle) -> tuple:
+    return type(vehicle), vehicle.year, vehicle.consumption, vehicle.compute_maximal_distance()
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),  # 10
+        Bike(2005, 10, False),  # 10
+        Car(2015, 60, 6, True),  # 11
+        Bike(2005, 20, True),  # 10
+    ]
+
+
+class TestFleetSnapshot:
+    def test_empty(self):
+        snapshot = FleetRegistry().snapshot()
+        assert snapshot.version == 0
+        assert len(snapshot) == 0
+        assert snapshot.best() is None
+        assert snapshot.top(3) == []
+
+    def test_ranking_matches_find_best(self, vehicles):
+        snapshot = FleetRegistry(vehicles).snapshot()
+        assert snapshot.version == 1
+        assert list(snapshot) == list(snapshot.vehicles)
+        assert [fields_of(vehicle) for vehicle in snapshot] == [fields_of(vehicle) for vehicle in vehicles]
+        assert snapshot.best() is find_best_vehicles(snapshot.vehicles, 1)[0]
+        assert snapshot.best() is snapshot.vehicles[2]
+        for k in (1, 3, 10):
+            assert snapshot.top(k) == find_best_vehicles(snapshot.vehicles, k)
+
+    def test_added_vehicles_are_copied(self, vehicles):
+        snapshot = FleetRegistry(vehicles).snapshot()
+        assert all(stored is not vehicle for stored, vehicle in zip(snapshot, vehicles))
+        vehicles[0].consumption = 1
+        assert snapshot.get(snapshot.ids[0]).consumption == 5
+
+    def test_lookup_by_id(self, vehicles):
+        snapshot = FleetRegistry(vehicles).snapshot()
+        vehicle_id = snapshot.ids[2]
+        assert vehicle_id in snapshot
+        assert snapshot.get(vehicle_id) is snapshot.vehicles[2]
+        assert snapshot.distance(vehicle_id) == 11
+        assert -1 not in snapshot
+        with pytest.raises(KeyError):
+            snapshot.get(-1)
+
+    def test_top_errors(self, vehicles):
+        snapshot = FleetRegistry(vehicles).snapshot()
+        with pytest.raises(TypeError):
+            snapshot.top(1.5)
+        with pytest.raises(ValueError):
+            snapshot.top(0)
+
+
+class TestFleetRegistry:
+    def test_update_copies_on_write(self, vehicles):
+        registry = FleetRegistry(vehicles)
+        before = registry.snapshot()
+        vehicle_id = before.ids[0]
+        updated = registry.update(vehicle_id, consumption=2)
+
+        after = registry.snapshot()
+        assert after.version == before.version + 1
+        assert after.get(vehicle_id) is updated
+        assert after.distance(vehicle_id) == 25
+        assert after.best() is updated
+        # The previous snapshot is untouched.
+        assert before.get(vehicle_id).consumption == 5
+        assert before.distance(vehicle_id) == 10
+        assert before.best() is before.vehicles[2]
+
+    def test_updated_vehicle_keeps_its_position(self, vehicles):
+        registry = FleetRegistry(vehicles)
+        ids = registry.snapshot().ids
+        registry.update(ids[3], saddle_comfort=False)
+        registry.update(ids[3], saddle_comfort=True)
+        snapshot = registry.snapshot()
+        assert snapshot.ids == ids
+        assert snapshot.top(2) == [snapshot.vehicles[2], snapshot.vehicles[3]]
+
+    def test_invalid_update_publishes_nothing(self, vehicles):
+        registry = FleetRegistry(vehicles)
+        before = registry.snapshot()
+        with pytest.raises(TypeError):
+            registry.update(before.ids[0], consumption='a lot')
+        assert registry.snapshot() is before
+        assert before.get(before.ids[0]).consumption == 5
+
+    def test_add_and_remove(self, vehicles):
+        registry = FleetRegistry(vehicles[:2])
+        first, second = registry.snapshot().ids
+        third = registry.add(vehicles[2])
+        assert third not in (first, second)
+        assert registry.snapshot().best() is registry.snapshot().get(third)
+
+        registry.remove(third)
+        snapshot = registry.snapshot()
+        assert snapshot.ids == (first, second)
+        assert third not in snapshot
+        assert snapshot.best() is snapshot.get(second)
+        with pytest.raises(KeyError):
+            registry.remove(third)
+
+    def test_ids_are_never_reused(self, vehicles):
+        registry = FleetRegistry(vehicles[:1])
+        first = registry.snapshot().ids[0]
+        registry.remove(first)
+        assert registry.add(vehicles[0]) != first
+
+    def test_transaction_publishes_once(self, vehicles):
+        registry = FleetRegistry(vehicles)
+        before = registry.snapshot()
+        with registry.transaction() as transaction:
+            vehicle_id = transaction.add(Car(2020, 100, 2, True))
+            transaction.update(vehicle_id, consumption=4)
+            transaction.remove(before.ids[1])
+            assert transaction.get(vehicle_id).consumption == 4
+            assert registry.snapshot() is before
+        after = registry.snapshot()
+        assert after.version == before.version + 1
+        assert len(after) == 4
+        assert after.distance(vehicle_id) == 27
+        assert after.best() is after.get(vehicle_id)
+
+    def test_aborted_transaction_publishes_nothing(self, vehicles):
+        registry = FleetRegistry(vehicles)
+        before = registry.snapshot()
+        with pytest.raises(RuntimeError):
+            with registry.transaction() as transaction:
+                transaction.update(before.ids[0], consumption=1)
+                raise RuntimeError
+        assert registry.snapshot() is before
+        # The lock was released.
+        registry.update(before.ids[0], consumption=1)
+        assert registry.snapshot().version == before.version + 1
+
+    def test_empty_transaction_publishes_nothing(self, vehicles):
+        registry = FleetRegistry(vehicles)
+        before = registry.snapshot()
+        with registry.transaction():
+            pass
+        assert registry.snapshot() is before
+
+    def test_concurrent_readers_and_writers(self):
+        registry = FleetRegistry(Car(2000 + index % 20, 40 + index % 7, 5, True) for index in range(500))
+        pair = registry.snapshot().ids[:2]
+        stop = threading.Event()
+        errors = []
+        reads = []
+
+        def read() -> None:
+            count, version = 0, -1
+            while not stop.is_set():
+                snapshot = registry.snapshot()
+                first, second = (snapshot.get(vehicle_id) for vehicle_id in pair)
+                best = snapshot.best()
+                if first.consumption != second.consumption or snapshot.version < version:
+                    errors.append(snapshot.version)
+                if snapshot.distances[snapshot.vehicles.index(best)] != max(snapshot.distances):
+                    errors.append(snapshot.version)
+                version = snapshot.version
+                count += 1
+            reads.append(count)
+
+        def write(offset: int) -> None:
+            for step in range(50):
+                with registry.transaction() as transaction:
+                    for vehicle_id in pair:
+                        transaction.update(vehicle_id, consumption=1 + (offset + step) % 9)
+                    transaction.remove(transaction.add(Bike(2020, 10, True)))
+
+        readers = [threading.Thread(target=read) for _ in range(3)]
+        writers = [threading.Thread(target=write, args=(offset,)) for offset in range(2)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+        assert errors == []
+        assert sum(reads) > 0
+        assert registry.snapshot().version == 1 + 100
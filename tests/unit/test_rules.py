@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.rules import Bracket, DistanceRules, FlagMultiplier
+
+
+def columns(**values):
+    return SimpleNamespace(**{name: np.asarray(value) for name, value in values.items()})
+
+
+class TestDistanceRules:
+    def test_car_and_bike_methods_are_compiled(self):
+        assert Car.compute_maximal_distance.rules is Car.DISTANCE_RULES
+        assert Bike.compute_maximal_distance.rules is Bike.DISTANCE_RULES
+
+    def test_car_distances(self):
+        assert Car(1995, 50, 5, True).compute_maximal_distance() == 9
+        assert Car(2000, 50, 5, True).compute_maximal_distance() == 10
+        assert Car(2010, 50, 5, True).compute_maximal_distance() == 10
+        assert Car(2011, 50, 5, True).compute_maximal_distance() == 11
+        assert Car(2011, 50, 5, False).compute_maximal_distance() == 0
+
+    def test_bike_distances(self):
+        assert Bike(2005, 3, False).compute_maximal_distance() == 33
+        assert Bike(2005, 3, True).compute_maximal_distance() == 66
+
+    def test_brackets_are_exclusive(self):
+        rules = DistanceRules('tank_size', brackets=(Bracket('year', 0.5, upper=2000), Bracket('year', 3, upper=2010)))
+        scalar = rules.compile_scalar()
+        vehicles = [SimpleNamespace(year=year, tank_size=10, consumption=1) for year in (1990, 2005, 2020)]
+        assert [scalar(vehicle) for vehicle in vehicles] == [5, 30, 10]
+        batch = rules.compile_batch()(columns(year=[1990, 2005, 2020], tank_size=[10] * 3, consumption=[1] * 3))
+        assert batch.tolist() == [5, 30, 10]
+
+    def test_flags_and_zero_conditions_combine(self):
+        rules = DistanceRules(60, flags=(FlagMultiplier('electric', 1.5), FlagMultiplier('trailer', 0.5)),
+                              zero_unless=('insured', 'registered'))
+        scalar = rules.compile_scalar()
+        rows = [(True, True, True, True), (True, False, True, True), (False, False, True, True),
+                (True, True, False, True), (True, True, True, False)]
+        vehicles = [SimpleNamespace(consumption=4, electric=e, trailer=t, insured=i, registered=r)
+                    for e, t, i, r in rows]
+        assert [scalar(vehicle) for vehicle in vehicles] == [11, 22, 15, 0, 0]
+        electric, trailer, insured, registered = zip(*rows)
+        batch = rules.compile_batch()(columns(consumption=[4] * 5, electric=electric, trailer=trailer,
+                                              insured=insured, registered=registered))
+        assert batch.tolist() == [11, 22, 15, 0, 0]
+
+    def test_unscaled_distances_stay_exact(self):
+        rules = DistanceRules('tank_size', flags=(FlagMultiplier('boost', 2.0),))
+        big = 2 ** 62 + 1
+        batch = rules.compile_batch()(columns(tank_size=[big], consumption=[1], boost=[False]))
+        assert batch.tolist() == [big]
+        assert rules.compile_scalar()(SimpleNamespace(tank_size=big, consumption=1, boost=False)) == big
+
+    def test_int64_boundary(self):
+        kernel = Car.DISTANCE_RULES.compile_batch()
+
+        def columns_of(cars):
+            return columns(**{name: [getattr(car, name) for car in cars]
+                              for name in ('year', 'tank_size', 'consumption', 'technical_inspection')})
+
+        # Largest distances still representable after the 1.1 factor: both paths agree.
+        cars = [Car(2015, 8 * 10 ** 18, 1, True), Car(2005, 2 ** 63 - 1, 1, True), Car(1995, 2 ** 63 - 1, 1, True),
+                Car(2015, 2 ** 63 - 1, 1, False)]
+        assert kernel(columns_of(cars)).tolist() == [car.compute_maximal_distance() for car in cars]
+        # Beyond int64 the scalar path returns a Python int the batch kernel cannot represent.
+        car = Car(2015, 2 ** 63 - 1, 1, True)
+        assert car.compute_maximal_distance() > 2 ** 63 - 1
+        with pytest.raises(ValueError):
+            kernel(columns_of([car]))
+
+    def test_scalar_source(self):
+        assert Bike.DISTANCE_RULES.scalar_source() == (
+            'def compute_maximal_distance(self) -> int:\n'
+            '    distance = 100 // self.consumption\n'
+            '    if self.saddle_comfort:\n'
+            '        distance = distance * 2.0\n'
+            '    return int(distance)\n'
+        )
+
+    def test_replace(self):
+        rules = Car.DISTANCE_RULES.replace(zero_unless=())
+        assert rules.compile_scalar()(Car(2005, 50, 5, False)) == 10
+        assert Car.DISTANCE_RULES.zero_unless == ('technical_inspection',)
+
+    def test_invalid_declarations(self):
+        with pytest.raises(ValueError):
+            DistanceRules('tank_size; import os')
+        with pytest.raises(ValueError):
+            DistanceRules('tank_size', denominator='_consumption')
+        with pytest.raises(ValueError):
+            DistanceRules('tank_size', zero_unless=('class',))
+        with pytest.raises(TypeError):
+            DistanceRules(1.5)
+        with pytest.raises(TypeError):
+            DistanceRules(True)
+        with pytest.raises(TypeError):
+            DistanceRules('tank_size', flags=(FlagMultiplier('boost', '2'),))
+        with pytest.raises(TypeError):
+            DistanceRules('tank_size', brackets=(Bracket('year', 0.9, upper=2000.5),))
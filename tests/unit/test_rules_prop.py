@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.rules import Bracket, DistanceRules, FlagMultiplier
+
+valid_years = st.integers(min_value=1, max_value=3000)
+valid_tank_sizes = st.integers(min_value=0, max_value=10 ** 6)
+valid_consumptions = st.integers(min_value=1, max_value=1000)
+
+
+def hand_written_car_distance(year, tank_size, consumption, technical_inspection):
+    # The implementation Car had before its rules were declared.
+    if not technical_inspection:
+        return 0
+    theoretical_max_distance = tank_size // consumption
+    if year < 2000:
+        theoretical_max_distance *= 0.9
+    elif year > 2010:
+        theoretical_max_distance *= 1.1
+    return int(theoretical_max_distance)
+
+
+def hand_written_bike_distance(consumption, saddle_comfort):
+    # The implementation Bike had before its rules were declared.
+    base_distance = 100 // consumption
+    if saddle_comfort:
+        return int(2.0 * base_distance)
+    return int(base_distance)
+
+
+factors = st.one_of(st.integers(min_value=0, max_value=5), st.floats(min_value=0, max_value=5))
+bounds = st.one_of(st.none(), st.integers(min_value=1900, max_value=2100))
+rules_strategy = st.builds(
+    DistanceRules,
+    numerator=st.one_of(st.just('tank_size'), st.integers(min_value=0, max_value=1000)),
+    brackets=st.lists(st.builds(Bracket, attribute=st.just('year'), factor=factors, lower=bounds, upper=bounds),
+                      max_size=3),
+    flags=st.lists(st.builds(FlagMultiplier, attribute=st.sampled_from(['a', 'b']), factor=factors), max_size=2),
+    zero_unless=st.lists(st.sampled_from(['a', 'b']), max_size=2),
+)
+rows = st.tuples(valid_years, valid_tank_sizes, valid_consumptions, st.booleans(), st.booleans())
+
+
+class TestDistanceRules:
+    @given(valid_years, valid_tank_sizes, valid_consumptions, st.booleans())
+    def test_car_is_identical_to_hand_written(self, year, tank_size, consumption, technical_inspection):
+        assert Car(year, tank_size, consumption, technical_inspection).compute_maximal_distance() == \
+            hand_written_car_distance(year, tank_size, consumption, technical_inspection)
+
+    @given(valid_years, valid_consumptions, st.booleans())
+    def test_bike_is_identical_to_hand_written(self, year, consumption, saddle_comfort):
+        assert Bike(year, consumption, saddle_comfort).compute_maximal_distance() == \
+            hand_written_bike_distance(consumption, saddle_comfort)
+
+    @settings(max_examples=50)
+    @given(st.lists(st.one_of(
+        st.builds(Car, year=valid_years, tank_size=valid_tank_sizes, consumption=valid_consumptions,
+                  technical_inspection=st.booleans()),
+        st.builds(Bike, year=valid_years, consumption=valid_consumptions, saddle_comfort=st.booleans())),
+        max_size=50))
+    def test_fleet_kernels_are_identical(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert fleet.compute_maximal_distances().tolist() == [vehicle.compute_maximal_distance()
+                                                              for vehicle in vehicles]
+
+    @settings(max_examples=200)
+    @given(rules_strategy, st.lists(rows, min_size=1, max_size=20))
+    def test_scalar_and_batch_are_identical(self, rules, data):
+        """Test that any declaration compiles into a scalar method and a batch kernel with equal results."""
+        scalar = rules.compile_scalar()
+        expected = [scalar(SimpleNamespace(year=y, tank_size=t, consumption=c, a=a, b=b)) for y, t, c, a, b in data]
+        year, tank_size, consumption, a, b = (np.asarray(column) for column in zip(*data))
+        kernel = rules.compile_batch()
+        assert kernel(SimpleNamespace(year=year, tank_size=tank_size, consumption=consumption, a=a, b=b)).tolist() \
+            == expected
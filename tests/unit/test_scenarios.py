@@ -0,0 +1,155 @@
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.binary import open_fleet, write_fleet
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.ingest import record_from_vehicle, vehicle_from_record
+from technical_test_fortis.rules import Bracket
+from technical_test_fortis.scenarios import (COLUMNS, Scenario, ScenarioResult, evaluate_scenarios,
+                                             scenario_distances)
+
+
+def reference_distances(vehicles, scenario) -> list:
+    """
+    The distances of the scenario computed the slow way, on modified copies of the vehicles.
+    """
+    distances = []
+    for vehicle in vehicles:
+        vehicle = vehicle_from_record(record_from_vehicle(vehicle))
+        if scenario.vehicle_type is None or isinstance(vehicle, scenario.vehicle_type):
+            for column, value in (scenario.overrides or {}).items():
+                if hasattr(vehicle, column):
+                    setattr(vehicle, column, value)
+            for column, delta in (scenario.deltas or {}).items():
+                setattr(vehicle, column, max(getattr(vehicle, column) + delta, COLUMNS[column]))
+        rules = scenario.car_rules if isinstance(vehicle, Car) else scenario.bike_rules
+        distances.append(vehicle.compute_maximal_distance() if rules is None else rules.compile_scalar()(vehicle))
+    return distances
+
+
+MOVED_BRACKETS = Car.DISTANCE_RULES.replace(brackets=(Bracket('year', 0.9, upper=2005),
+                                                      Bracket('year', 1.1, lower=2015)))
+
+SCENARIOS = [
+    Scenario('baseline'),
+    Scenario('inspection fails', overrides={'technical_inspection': False}),
+    Scenario('consumption improves', deltas={'consumption': -1}),
+    Scenario('moved brackets', car_rules=MOVED_BRACKETS),
+    Scenario('bike saddles', overrides={'saddle_comfort': True}, vehicle_type=Bike),
+    Scenario('old cars', overrides={'year': 1990}, deltas={'tank_size': 5}, vehicle_type=Car,
+             car_rules=MOVED_BRACKETS),
+]
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(1995, 50, 5, True),  # 9
+        Car(2008, 40, 1, True),  # 40
+        Bike(2005, 10, False),  # 10
+        Car(2012, 60, 6, False),  # 0
+        Bike(2020, 5, True),  # 40
+        Car(2003, 44, 4, True),  # 11
+    ]
+
+
+class TestScenarioDistances:
+    def test_matches_modified_copies(self, vehicles):
+        grid = scenario_distances(VehicleFleet.from_vehicles(vehicles), SCENARIOS)
+        assert grid.shape == (len(SCENARIOS), len(vehicles))
+        for row, scenario in zip(grid.tolist(), SCENARIOS):
+            assert row == reference_distances(vehicles, scenario), scenario.name
+
+    def test_baseline_matches_fleet(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert scenario_distances(fleet, [Scenario('baseline')])[0].tolist() == \
+            fleet.compute_maximal_distances().tolist()
+
+    def test_fleet_is_not_modified(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        scenario_distances(fleet, SCENARIOS)
+        assert [vehicle.compute_maximal_distance() for vehicle in fleet.to_vehicles()] == \
+            [vehicle.compute_maximal_distance() for vehicle in vehicles]
+
+    def test_consumption_is_clamped(self, vehicles):
+        grid = scenario_distances(VehicleFleet.from_vehicles(vehicles), [Scenario('', deltas={'consumption': -10})])
+        # Every consumption drops to 1: cars get tank_size * their year factor, bikes 100 (200 with comfort).
+        assert grid[0].tolist() == [45, 40, 100, 0, 200, 44]
+
+    def test_deltas_do_not_wrap_around(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        with pytest.raises(ValueError):
+            scenario_distances(fleet, [Scenario('', deltas={'tank_size': 2 ** 63 - 10})])
+        grid = scenario_distances(fleet, [Scenario('', deltas={'tank_size': 2 ** 62}, vehicle_type=Car)])
+        assert grid[0].tolist() == reference_distances(vehicles, Scenario('', deltas={'tank_size': 2 ** 62},
+                                                                         vehicle_type=Car))
+        grid = scenario_distances(fleet, [Scenario('', deltas={'consumption': -2 ** 63, 'year': -2 ** 63})])
+        assert grid.tolist() == scenario_distances(fleet, [Scenario('', deltas={'consumption': -10,
+                                                                                'year': -3000})]).tolist()
+
+    def test_values_outside_int64_are_rejected(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        with pytest.raises(ValueError):
+            scenario_distances(fleet, [Scenario('', overrides={'tank_size': 10 ** 30})])
+        with pytest.raises(ValueError):
+            scenario_distances(fleet, [Scenario('', deltas={'tank_size': 2 ** 63})])
+        with pytest.raises(ValueError):
+            scenario_distances(fleet, [Scenario('', deltas={'consumption': -2 ** 63 - 1})])
+
+    def test_mapped_fleet_is_evaluated_in_int64(self, tmp_path):
+        # A mapped fleet stores int32 columns, the scenarios must not wrap around or overflow them.
+        vehicles = [Car(2015, 2 ** 31 - 10, 1, True), Car(2008, 40, 1, True), Bike(2005, 10, False)]
+        write_fleet(tmp_path / 'fleet.bin', vehicles)
+        fleet = open_fleet(tmp_path / 'fleet.bin')
+        scenarios = [Scenario('delta', deltas={'tank_size': 100}),
+                     Scenario('override', overrides={'tank_size': 2 ** 40}, vehicle_type=Car)]
+        grid = scenario_distances(fleet, scenarios)
+        for row, scenario in zip(grid.tolist(), scenarios):
+            assert row == reference_distances(vehicles, scenario), scenario.name
+        assert grid[0, 0] == int((2 ** 31 + 90) * 1.1)
+
+
+class TestEvaluateScenarios:
+    def test_results(self, vehicles):
+        results = evaluate_scenarios(VehicleFleet.from_vehicles(vehicles), SCENARIOS)
+        assert [result.name for result in results] == [scenario.name for scenario in SCENARIOS]
+        # On equal distance the later vehicle wins.
+        assert results[0] == ScenarioResult('baseline', 4, 40, 110, 110 / 6, 1)
+        assert results[1] == ScenarioResult('inspection fails', 4, 40, 50, 50 / 6, 4)
+        for result, scenario in zip(results, SCENARIOS):
+            distances = reference_distances(vehicles, scenario)
+            assert result.best_distance == max(distances)
+            assert result.best == len(distances) - 1 - distances[::-1].index(max(distances))
+            assert result.total == sum(distances)
+            assert result.stranded == distances.count(0)
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 4, 100])
+    def test_chunking_does_not_change_results(self, vehicles, chunk_size):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert evaluate_scenarios(fleet, SCENARIOS, chunk_size) == evaluate_scenarios(fleet, SCENARIOS)
+
+    def test_empty(self):
+        results = evaluate_scenarios(VehicleFleet.from_vehicles([]), [Scenario('baseline')])
+        assert results == [ScenarioResult('baseline', -1, None, 0, None, 0)]
+        assert evaluate_scenarios(VehicleFleet.from_vehicles([Car(2005, 10, 1, True)]), []) == []
+
+    def test_errors(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        with pytest.raises(TypeError):
+            evaluate_scenarios(fleet, [('baseline',)])
+        with pytest.raises(ValueError):
+            evaluate_scenarios(fleet, [Scenario('', overrides={'kind': 1})])
+        with pytest.raises(ValueError):
+            evaluate_scenarios(fleet, [Scenario('', overrides={'consumption': 0})])
+        with pytest.raises(TypeError):
+            evaluate_scenarios(fleet, [Scenario('', overrides={'technical_inspection': 1})])
+        with pytest.raises(ValueError):
+            evaluate_scenarios(fleet, [Scenario('', deltas={'saddle_comfort': 1})])
+        with pytest.raises(TypeError):
+            evaluate_scenarios(fleet, [Scenario('', deltas={'year': 1.5})])
+        with pytest.raises(TypeError):
+            evaluate_scenarios(fleet, [Scenario('', vehicle_type=str)])
+        with pytest.raises(TypeError):
+            evaluate_scenarios(fleet, [Scenario('', car_rules='tank_size // consumption')])
+        with pytest.raises(ValueError):
+            evaluate_scenarios(fleet, SCENARIOS, chunk_size=0)
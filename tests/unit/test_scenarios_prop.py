@@ -0,0 +1,63 @@
+from hypothesis import given, strategies as st
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.ingest import record_from_vehicle, vehicle_from_record
+from technical_test_fortis.rules import Bracket
+from technical_test_fortis.scenarios import COLUMNS, Scenario, evaluate_scenarios, scenario_distances
+
+valid_years = st.integers(min_value=1990, max_value=2025)
+valid_consumptions = st.integers(min_value=1, max_value=6)
+valid_cars = st.builds(Car, year=valid_years, tank_size=st.integers(min_value=0, max_value=60),
+                       consumption=valid_consumptions, technical_inspection=st.booleans())
+valid_bikes = st.builds(Bike, year=valid_years, consumption=valid_consumptions, saddle_comfort=st.booleans())
+valid_vehicles = st.one_of(valid_cars, valid_bikes)
+
+thresholds = st.integers(min_value=1990, max_value=2025)
+car_rules = st.one_of(st.none(), st.builds(
+    lambda upper, lower, factor: Car.DISTANCE_RULES.replace(
+        brackets=(Bracket('year', factor, upper=upper), Bracket('year', 1.1, lower=lower))),
+    thresholds, thresholds, st.sampled_from([0.5, 0.9, 1.25])))
+scenarios = st.builds(
+    Scenario,
+    name=st.just(''),
+    overrides=st.dictionaries(st.sampled_from(['technical_inspection', 'saddle_comfort']), st.booleans())
+    | st.fixed_dictionaries({'year': valid_years}),
+    deltas=st.dictionaries(st.sampled_from(['consumption', 'tank_size', 'year']),
+                           st.integers(min_value=-5, max_value=5)),
+    vehicle_type=st.sampled_from([None, Car, Bike]),
+    car_rules=car_rules,
+)
+
+
+def reference_distances(vehicles, scenario) -> list:
+    """
+    The distances of the scenario computed the slow way, on modified copies of the vehicles.
+    """
+    distances = []
+    for vehicle in vehicles:
+        vehicle = vehicle_from_record(record_from_vehicle(vehicle))
+        if scenario.vehicle_type is None or isinstance(vehicle, scenario.vehicle_type):
+            for column, value in (scenario.overrides or {}).items():
+                if hasattr(vehicle, column):
+                    setattr(vehicle, column, value)
+            for column, delta in (scenario.deltas or {}).items():
+                setattr(vehicle, column, max(getattr(vehicle, column) + delta, COLUMNS[column]))
+        rules = scenario.car_rules if isinstance(vehicle, Car) else scenario.bike_rules
+        distances.append(vehicle.compute_maximal_distance() if rules is None else rules.compile_scalar()(vehicle))
+    return distances
+
+
+class TestScenarios:
+    @given(st.lists(valid_vehicles, max_size=30), st.lists(scenarios, max_size=4),
+           st.integers(min_value=1, max_value=8))
+    def test_matches_modified_copies(self, vehicles, scenarios, chunk_size):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        grid = scenario_distances(fleet, scenarios)
+        results = evaluate_scenarios(fleet, scenarios, chunk_size)
+        for row, result, scenario in zip(grid.tolist(), results, scenarios):
+            distances = reference_distances(vehicles, scenario)
+            assert row == distances
+            assert result.total == sum(distances)
+            if distances:
+                assert result.best == len(distances) - 1 - distances[::-1].index(max(distances))
@@ -0,0 +1,191 @@
+import asyncio
+import json
+
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.ingest import record_from_vehicle
+from technical_test_fortis.server import FleetServer, LatencyRecorder, MicroBatcher
+
+VEHICLES = [Car(2005, 50, 5, True), Bike(2005, 1, True), Car(2015, 50, 5, True), Bike(2005, 1, True)]
+RECORDS = [record_from_vehicle(vehicle) for vehicle in VEHICLES]
+
+
+async def _query(reader, writer, requests):
+    for request in requests:
+        # Strings are sent as they are, to test malformed lines.
+        line = request if isinstance(request, str) else json.dumps(request)
+        writer.write(line.encode() + b'\n')
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in requests]
+    return {response['id']: response for response in responses}
+
+
+def _run_with_server(scenario, **kwargs):
+    async def main():
+        server = FleetServer({'north': VehicleFleet.from_vehicles(VEHICLES)}, **kwargs)
+        await server.start()
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            try:
+                return await scenario(server, reader, writer)
+            finally:
+                writer.close()
+
+    return asyncio.run(main())
+
+
+class TestFleetServer:
+    def test_vehicle_specs_and_fleet_queries(self):
+        async def scenario(server, reader, writer):
+            return await _query(reader, writer, [
+                {'id': 1, 'vehicles': RECORDS},
+                {'id': 2, 'vehicles': RECORDS[:1] + RECORDS[2:3], 'k': 2},
+                {'id': 3, 'fleet': 'north', 'k': 3},
+                {'id': 4, 'vehicles': []},
+            ])
+
+        responses = _run_with_server(scenario)
+        assert responses[1]['best'] == {'position': 3, 'distance': 200, 'vehicle': RECORDS[3]}
+        assert [entry['position'] for entry in responses[2]['top']] == [1, 0]
+        assert [entry['position'] for entry in responses[3]['top']] == [3, 1, 2]
+        assert responses[4] == {'id': 4, 'best': None, 'top': []}
+
+    def test_concurrent_requests_are_batched(self):
+        async def scenario(server, reader, writer):
+            responses = await _query(reader, writer, [{'id': i, 'vehicles': RECORDS[:i % 4 + 1]} for i in range(40)])
+            stats = await _query(reader, writer, [{'id': 'stats', 'stats': True}])
+            return responses, stats['stats']
+
+        responses, stats = _run_with_server(scenario, batch_window=0.05, max_batch_size=16)
+        for i, response in responses.items():
+            expected = max(range(i % 4 + 1), key=lambda position: (VEHICLES[position].compute_maximal_distance(),
+                                                                   position))
+            assert response['best']['position'] == expected
+        assert stats['requests'] == 40
+        assert 3 <= stats['batches'] < 40
+        assert stats['p50_ms'] <= stats['p99_ms']
+
+    def test_errors_are_reported(self):
+        async def scenario(server, reader, writer):
+            return await _query(reader, writer, [
+                'not json',
+                {'id': 1, 'fleet': 'south'},
+                {'id': 2, 'vehicles': [{'type': 'car', 'year': 2005}]},
+                {'id': 3, 'vehicles': RECORDS, 'k': 0},
+                {'id': 4},
+            ])
+
+        responses = _run_with_server(scenario)
+        assert set(responses) == {None, 1, 2, 3, 4}
+        assert all('error' in response for response in responses.values())
+
+    def test_oversized_int_does_not_stop_the_server(self):
+        async def scenario(server, reader, writer):
+            oversized = dict(RECORDS[0], tank_size=10 ** 30)
+            request = {'id': 1, 'vehicles': [oversized, RECORDS[1]]}
+            first = await asyncio.wait_for(_query(reader, writer, [request]), 5)
+            # A new connection is still served.
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            try:
+                second = await asyncio.wait_for(_query(reader, writer, [{'id': 2, 'vehicles': RECORDS}]), 5)
+            finally:
+                writer.close()
+            return first[1], second[2]
+
+        first, second = _run_with_server(scenario)
+        assert 'error' in first
+        assert second['best']['position'] == 3
+
+    def test_request_longer_than_64_kib(self):
+        async def scenario(server, reader, writer):
+            records = RECORDS * 250
+            assert len(json.dumps({'id': 1, 'vehicles': records})) > 2 ** 16
+            return await asyncio.wait_for(_query(reader, writer, [{'id': 1, 'vehicles': records}]), 5)
+
+        assert _run_with_server(scenario)[1]['best']['position'] == 999
+
+    def test_request_longer_than_the_limit(self):
+        async def scenario(server, reader, writer):
+            response = await asyncio.wait_for(_query(reader, writer, [{'id': 1, 'vehicles': RECORDS * 10}]), 5)
+            # The connection is closed once the error is answered.
+            return response, await asyncio.wait_for(reader.read(), 5)
+
+        response, rest = _run_with_server(scenario, stream_limit=256)
+        assert 'error' in response[None]
+        assert rest == b''
+
+    def test_unix_socket(self, tmp_path):
+        path = str(tmp_path / "fleet.sock")
+
+        async def main():
+            server = FleetServer()
+            await server.start_unix(path)
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(path)
+                try:
+                    return await _query(reader, writer, [{'id': 1, 'vehicles': RECORDS}])
+                finally:
+                    writer.close()
+
+        assert asyncio.run(main())[1]['best']['position'] == 3
+
+
+class TestMicroBatcher:
+    def test_max_batch_size_closes_batches(self):
+        async def main():
+            batcher = MicroBatcher(batch_window=10, max_batch_size=5)
+            batcher.start()
+            try:
+                await asyncio.gather(*(batcher.submit(vehicles=VEHICLES) for _ in range(10)))
+            finally:
+                await batcher.stop()
+            return batcher.batches
+
+        assert asyncio.run(main()) == 2
+
+    def test_failed_batch_keeps_the_worker_running(self):
+        async def main():
+            batcher = MicroBatcher()
+            batcher.start()
+            try:
+                with pytest.raises(ValueError):
+                    await asyncio.wait_for(batcher.submit(vehicles=[Car(2005, 10 ** 30, 5, True)]), 5)
+                return await asyncio.wait_for(batcher.submit(vehicles=VEHICLES), 5)
+            finally:
+                await batcher.stop()
+
+        assert asyncio.run(main())['best']['position'] == 3
+
+    def test_unknown_fleet(self):
+        async def main():
+            batcher = MicroBatcher()
+            batcher.start()
+            try:
+                await batcher.submit(fleet='south')
+            finally:
+                await batcher.stop()
+
+        with pytest.raises(KeyError):
+            asyncio.run(main())
+
+    @pytest.mark.parametrize("kwargs, expected_exception", [
+        ({'batch_window': -1}, ValueError),
+        ({'max_batch_size': 0}, ValueError),
+        ({'max_batch_size': 1.5}, TypeError),
+    ])
+    def test_invalid_limits(self, kwargs, expected_exception):
+        with pytest.raises(expected_exception):
+            MicroBatcher(**kwargs)
+
+
+class TestLatencyRecorder:
+    def test_percentiles(self):
+        recorder = LatencyRecorder(window_size=100)
+        assert recorder.percentile(50) is None
+        for milliseconds in range(1, 201):
+            recorder.record(milliseconds / 1000)
+        assert recorder.count == 200
+        assert recorder.percentile(50) == pytest.approx(0.1505)
+        assert recorder.percentile(99) == pytest.approx(0.19901)
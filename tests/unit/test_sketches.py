@@ -0,0 +1,254 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+from technical_test_fortis.__main__ import histogram_objects
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.sketches import (DistanceHistogram, HeavyHitters, QuantileSketch, StreamStatistics,
+                                            TopVehicles)
+from technical_test_fortis.vehicle import find_best_vehicles
+
+
+def exact_quantile(values, q):
+    return sorted(values)[int(q * (len(values) - 1))]
+
+
+@pytest.fixture
+def vehicles():
+    rng = random.Random(7)
+    return [Car(rng.randint(1990, 2020), rng.randint(0, 100), rng.randint(1, 20), rng.random() < 0.8)
+            if rng.random() < 0.7 else Bike(rng.randint(1990, 2020), rng.randint(1, 20), rng.random() < 0.5)
+            for _ in range(5000)]
+
+
+class TestQuantileSketch:
+    def test_empty(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) is None
+        assert len(sketch) == 0
+
+    @pytest.mark.parametrize('relative_accuracy', [0.001, 0.01, 0.05])
+    def test_relative_error(self, relative_accuracy):
+        rng = random.Random(1)
+        values = [int(rng.lognormvariate(4, 2)) for _ in range(20_000)]
+        sketch = QuantileSketch(relative_accuracy)
+        sketch.extend(values)
+        assert sketch.count == len(values)
+        for q in (0, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999, 1):
+            exact = exact_quantile(values, q)
+            assert abs(sketch.quantile(q) - exact) <= relative_accuracy * exact * (1 + 1e-9)
+
+    def test_extremes_are_exact(self):
+        sketch = QuantileSketch(0.1)
+        sketch.extend([3, 1000, 7])
+        assert sketch.quantile(0) == 3
+        assert sketch.quantile(1) == 1000
+
+    def test_zeros(self):
+        sketch = QuantileSketch()
+        sketch.add(0, 3)
+        sketch.add(10)
+        assert sketch.quantile(0.5) == 0
+        assert sketch.quantile(1) == 10
+
+    def test_memory_is_bounded(self):
+        sketch = QuantileSketch(0.01, max_buckets=50)
+        sketch.extend(range(1, 100_000))
+        assert sketch.bucket_count <= 50
+        # Collapsing only degrades the lowest quantiles.
+        for q in (0.5, 0.9, 1):
+            exact = exact_quantile(range(1, 100_000), q)
+            assert abs(sketch.quantile(q) - exact) <= 0.01 * exact * (1 + 1e-9)
+
+    def test_merge_equals_single_sketch(self):
+        rng = random.Random(2)
+        first = [rng.randint(0, 10_000) for _ in range(1000)]
+        second = [rng.randint(0, 50) for _ in range(1000)]
+        merged = QuantileSketch()
+        merged.extend(first)
+        other = QuantileSketch()
+        other.extend(second)
+        merged = merged.merge(other)
+        single = QuantileSketch()
+        single.extend(first + second)
+        assert merged.count == single.count
+        for q in (0, 0.1, 0.5, 0.9, 1):
+            assert merged.quantile(q) == single.quantile(q)
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(0)
+        with pytest.raises(TypeError):
+            QuantileSketch(max_buckets=1.5)
+        sketch = QuantileSketch()
+        with pytest.raises(ValueError):
+            sketch.add(-1)
+        with pytest.raises(ValueError):
+            sketch.add(float('nan'))
+        with pytest.raises(TypeError):
+            sketch.add(True)
+        with pytest.raises(ValueError):
+            sketch.add(1, 0)
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
+        with pytest.raises(ValueError):
+            sketch.merge(QuantileSketch(0.05))
+        with pytest.raises(TypeError):
+            sketch.merge(DistanceHistogram())
+
+    def test_numpy_values(self, vehicles):
+        distances = VehicleFleet.from_vehicles(vehicles).compute_maximal_distances()
+        from_numpy, from_python = QuantileSketch(), QuantileSketch()
+        from_numpy.extend(distances)
+        from_numpy.add(np.float64(2.5))
+        from_python.extend(distances.tolist())
+        from_python.add(2.5)
+        for q in (0, 0.5, 0.9, 1):
+            assert from_numpy.quantile(q) == from_python.quantile(q)
+        assert type(from_numpy.maximum) is int
+
+
+class TestDistanceHistogram:
+    def test_matches_exact_histogram(self, vehicles):
+        histogram = DistanceHistogram(bin_width=5, bins=1000)
+        histogram.extend(vehicle.compute_maximal_distance() for vehicle in vehicles)
+        assert histogram.counts() == histogram_objects(vehicles, 5)
+        assert histogram.overflow == 0
+
+    def test_overflow(self):
+        histogram = DistanceHistogram(bin_width=10, bins=2)
+        histogram.extend([0, 9, 10, 19, 20, 500])
+        assert histogram.counts() == Counter({0: 2, 10: 2})
+        assert histogram.overflow == 2
+        assert histogram.count == 6
+
+    def test_merge(self):
+        first, second = DistanceHistogram(10, 5), DistanceHistogram(10, 5)
+        first.extend([1, 2, 100])
+        second.extend([3, 45])
+        merged = first.merge(second)
+        assert merged.counts() == Counter({0: 3, 40: 1})
+        assert merged.overflow == 1
+        with pytest.raises(ValueError):
+            first.merge(DistanceHistogram(10, 6))
+
+    def test_numpy_and_invalid_values(self, vehicles):
+        histogram = DistanceHistogram(bin_width=5, bins=1000)
+        histogram.extend(VehicleFleet.from_vehicles(vehicles).compute_maximal_distances())
+        assert histogram.counts() == histogram_objects(vehicles, 5)
+        for value in (float('inf'), float('nan'), -1):
+            with pytest.raises(ValueError, match='finite and non-negative'):
+                histogram.add(value)
+        with pytest.raises(TypeError):
+            histogram.add('1')
+        with pytest.raises(TypeError):
+            histogram.add(1, count=1.0)
+
+
+class TestHeavyHitters:
+    def test_exact_below_capacity(self):
+        hitters = HeavyHitters(capacity=3)
+        hitters.extend(['a', 'b', 'a', 'c', 'a'])
+        assert hitters.most_common() == [('a', 3), ('b', 1), ('c', 1)]
+        assert hitters.error_bound() == 0
+
+    def test_guarantee(self):
+        rng = random.Random(3)
+        items = [rng.choice('ab') if rng.random() < 0.4 else rng.randint(0, 10_000) for _ in range(20_000)]
+        hitters = HeavyHitters(capacity=20)
+        hitters.extend(items)
+        exact = Counter(items)
+        assert len(hitters.most_common()) <= 20
+        assert hitters.error_bound() <= len(items) / 21
+        for item, count in exact.items():
+            assert count - hitters.error_bound() <= hitters.estimate(item) <= count
+        assert {item for item, _ in hitters.most_common(2)} == {'a', 'b'}
+
+    def test_merge_keeps_guarantee(self):
+        rng = random.Random(4)
+        parts = [[rng.choice('xyz') if rng.random() < 0.3 else rng.randint(0, 500) for _ in range(3000)]
+                 for _ in range(4)]
+        merged = HeavyHitters(capacity=10)
+        for part in parts:
+            hitters = HeavyHitters(capacity=10)
+            hitters.extend(part)
+            merged = merged.merge(hitters)
+        exact = Counter(item for part in parts for item in part)
+        assert merged.count == 12_000
+        assert merged.error_bound() <= 12_000 / 11
+        for item, count in exact.items():
+            assert count - merged.error_bound() <= merged.estimate(item) <= count
+
+
+class TestTopVehicles:
+    def test_matches_find_best_vehicles(self, vehicles):
+        best = TopVehicles(k=25)
+        best.extend(vehicles)
+        assert best.top() == find_best_vehicles(vehicles, 25)
+
+    def test_merge_is_concatenation(self, vehicles):
+        first, second = TopVehicles(k=25), TopVehicles(k=25)
+        first.extend(vehicles[:2000])
+        second.extend(vehicles[2000:])
+        assert first.merge(second).top() == find_best_vehicles(vehicles, 25)
+
+    def test_errors(self):
+        with pytest.raises(TypeError):
+            TopVehicles('3')
+        with pytest.raises(ValueError):
+            TopVehicles(0)
+
+
+class TestStreamStatistics:
+    def test_combines_the_sketches(self, vehicles):
+        statistics = StreamStatistics(bin_width=5, k=5)
+        statistics.extend(iter(vehicles))
+        distances = [vehicle.compute_maximal_distance() for vehicle in vehicles]
+        assert len(statistics) == len(vehicles)
+        assert statistics.total == sum(distances)
+        assert statistics.mean() == pytest.approx(sum(distances) / len(distances))
+        assert statistics.best.top() == find_best_vehicles(vehicles, 5)
+        assert statistics.histogram.counts() == histogram_objects(vehicles, 5)
+        median = exact_quantile(distances, 0.5)
+        assert abs(statistics.quantiles.quantile(0.5) - median) <= 0.01 * median
+        models = Counter((type(vehicle).__name__.lower(), vehicle.year) for vehicle in vehicles)
+        for model, count in models.items():
+            assert count - statistics.models.error_bound() <= statistics.models.estimate(model) <= count
+
+    def test_add_fleet_matches_objects(self, vehicles):
+        by_objects = StreamStatistics(k=7)
+        by_objects.extend(vehicles)
+        by_fleet = StreamStatistics(k=7)
+        for start in range(0, len(vehicles), 1500):
+            by_fleet.add_fleet(VehicleFleet.from_vehicles(vehicles[start:start + 1500]))
+        assert len(by_fleet) == len(vehicles)
+        assert by_fleet.total == by_objects.total
+        assert by_fleet.histogram.counts() == by_objects.histogram.counts()
+        for q in (0, 0.5, 0.9, 1):
+            assert by_fleet.quantiles.quantile(q) == by_objects.quantiles.quantile(q)
+        expected = find_best_vehicles(vehicles, 7)
+        assert [(type(vehicle), vehicle.year, vehicle.compute_maximal_distance()) for vehicle in by_fleet.best.top()] \
+            == [(type(vehicle), vehicle.year, vehicle.compute_maximal_distance()) for vehicle in expected]
+        exact = Counter((type(vehicle).__name__.lower(), vehicle.year) for vehicle in vehicles)
+        for model, count in exact.items():
+            assert count - by_fleet.models.error_bound() <= by_fleet.models.estimate(model) <= count
+
+    def test_merge(self, vehicles):
+        first, second = StreamStatistics(), StreamStatistics()
+        first.extend(vehicles[:100])
+        second.extend(vehicles[100:])
+        merged = first.merge(second)
+        assert len(merged) == len(vehicles)
+        assert merged.best.top() == find_best_vehicles(vehicles, 10)
+        assert merged.total == sum(vehicle.compute_maximal_distance() for vehicle in vehicles)
+
+    def test_empty(self):
+        statistics = StreamStatistics()
+        assert statistics.mean() is None
+        assert statistics.quantiles.quantile(0.5) is None
+        assert statistics.best.top() == []
+        statistics.add_fleet(VehicleFleet.from_vehicles([]))
+        assert len(statistics) == 0
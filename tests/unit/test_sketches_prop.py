@@ -0,0 +1,74 @@
+from collections import Counter
+
+from hypothesis import given, strategies as st
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.sketches import DistanceHistogram, HeavyHitters, QuantileSketch, TopVehicles
+from technical_test_fortis.vehicle import find_best_vehicles
+
+valid_years = st.sampled_from([1995, 2005, 2015])
+valid_cars = st.builds(Car, year=valid_years, tank_size=st.integers(min_value=0, max_value=20),
+                       consumption=st.integers(min_value=1, max_value=4), technical_inspection=st.booleans())
+valid_bikes = st.builds(Bike, year=valid_years, consumption=st.integers(min_value=1, max_value=4),
+                        saddle_comfort=st.booleans())
+valid_vehicles = st.one_of(valid_cars, valid_bikes)
+
+values = st.lists(st.integers(min_value=0, max_value=10 ** 9), min_size=1, max_size=200)
+accuracies = st.sampled_from([0.001, 0.01, 0.1, 0.5])
+quantiles = st.floats(min_value=0, max_value=1)
+
+
+class TestQuantileSketch:
+    @given(values, accuracies, quantiles)
+    def test_relative_error(self, values, relative_accuracy, q):
+        sketch = QuantileSketch(relative_accuracy)
+        sketch.extend(values)
+        exact = sorted(values)[int(q * (len(values) - 1))]
+        assert abs(sketch.quantile(q) - exact) <= relative_accuracy * exact * (1 + 1e-9)
+
+    @given(values, values, accuracies, quantiles)
+    def test_merge_equals_single_sketch(self, first, second, relative_accuracy, q):
+        merged = QuantileSketch(relative_accuracy)
+        merged.extend(first)
+        other = QuantileSketch(relative_accuracy)
+        other.extend(second)
+        single = QuantileSketch(relative_accuracy)
+        single.extend(first + second)
+        assert merged.merge(other).quantile(q) == single.quantile(q)
+        assert other.merge(merged).quantile(q) == single.quantile(q)
+
+
+class TestDistanceHistogram:
+    @given(values, st.integers(min_value=1, max_value=10 ** 8), st.integers(min_value=1, max_value=20))
+    def test_counts_are_exact(self, values, bin_width, bins):
+        histogram = DistanceHistogram(bin_width, bins)
+        histogram.extend(values)
+        assert histogram.counts() == Counter(value // bin_width * bin_width for value in values
+                                             if value < bin_width * bins)
+        assert histogram.overflow == sum(value >= bin_width * bins for value in values)
+
+
+class TestHeavyHitters:
+    @given(st.lists(st.lists(st.integers(min_value=0, max_value=15), max_size=80), min_size=1, max_size=4),
+           st.integers(min_value=1, max_value=8))
+    def test_guarantee_survives_merges(self, parts, capacity):
+        merged = HeavyHitters(capacity)
+        for part in parts:
+            hitters = HeavyHitters(capacity)
+            hitters.extend(part)
+            merged = merged.merge(hitters)
+        items = [item for part in parts for item in part]
+        assert len(merged.most_common()) <= capacity
+        assert merged.error_bound() <= len(items) / (capacity + 1)
+        for item, count in Counter(items).items():
+            assert count - merged.error_bound() <= merged.estimate(item) <= count
+
+
+class TestTopVehicles:
+    @given(st.lists(valid_vehicles, max_size=60), st.integers(min_value=0, max_value=60),
+           st.integers(min_value=1, max_value=10))
+    def test_merge_matches_find_best_vehicles(self, vehicles, split, k):
+        first, second = TopVehicles(k), TopVehicles(k)
+        first.extend(vehicles[:split])
+        second.extend(vehicles[split:])
+        assert first.merge(second).top() == find_best_vehicles(vehicles, k)
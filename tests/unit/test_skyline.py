@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.skyline import (SkylineAccumulator, fleet_skyline, fleet_skyline_layers, skyline,
+                                           skyline_layers)
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),  # 0: (10, 2005, 5), dominated by 1 and 5
+        Car(2015, 50, 5, True),  # 1: (11, 2015, 5)
+        Bike(2005, 1, True),  # 2: (200, 2005, 1)
+        Car(2020, 10, 5, True),  # 3: (2, 2020, 5)
+        Car(2015, 50, 5, True),  # 4: duplicate of 1, on the front as well
+        Bike(2005, 2, False),  # 5: (50, 2005, 2), dominated by 2
+        Car(2020, 10, 5, False),  # 6: (0, 2020, 5), dominated by 3
+    ]
+
+
+class TestSkyline:
+    def test_front(self, vehicles):
+        assert skyline(vehicles) == [vehicles[2], vehicles[1], vehicles[4], vehicles[3]]
+
+    def test_empty(self):
+        assert skyline([]) == []
+        assert skyline_layers([]) == []
+        assert SkylineAccumulator().front() == []
+
+    def test_equal_criteria_with_larger_distance_dominates(self):
+        bikes = [Bike(2005, 4, False), Bike(2005, 4, True)]
+        assert skyline(bikes) == [bikes[1]]
+
+    def test_layers(self, vehicles):
+        assert skyline_layers(vehicles) == [
+            [vehicles[2], vehicles[1], vehicles[4], vehicles[3]],
+            [vehicles[5], vehicles[6]],
+            [vehicles[0]],
+        ]
+        assert skyline_layers(vehicles, layers=1, k=2) == [[vehicles[2], vehicles[1]]]
+
+    def test_streaming(self, vehicles):
+        accumulator = SkylineAccumulator(chunk_size=2)
+        accumulator.extend(iter(vehicles))
+        assert accumulator.seen == len(vehicles)
+        assert accumulator.front() == skyline(vehicles)
+        accumulator.add(Car(2030, 500, 1, True))
+        assert len(accumulator.front()) == 1
+
+    def test_columnar(self, vehicles):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        assert fleet_skyline(fleet).tolist() == [2, 1, 4, 3]
+        assert [layer.tolist() for layer in fleet_skyline_layers(fleet)] == [[2, 1, 4, 3], [5, 6], [0]]
+        assert [layer.tolist() for layer in fleet_skyline_layers(fleet, layers=2, k=1)] == [[2], [5]]
+        empty = VehicleFleet.from_vehicles([])
+        assert fleet_skyline(empty).dtype == np.int64 and len(fleet_skyline(empty)) == 0
+
+    def test_invalid_limits(self, vehicles):
+        with pytest.raises(TypeError):
+            skyline_layers(vehicles, layers=1.0)
+        with pytest.raises(ValueError):
+            skyline_layers(vehicles, k=0)
+        with pytest.raises(ValueError):
+            SkylineAccumulator(chunk_size=0)
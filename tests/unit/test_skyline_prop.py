@@ -0,0 +1,62 @@
+from hypothesis import given, settings, strategies as st
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.fleet import VehicleFleet
+from technical_test_fortis.skyline import (SkylineAccumulator, fleet_skyline_layers, skyline,
+                                           skyline_layers)
+
+# Small domains so that duplicates and ties on each criterion are frequent.
+valid_years = st.integers(min_value=2008, max_value=2013)
+valid_tank_sizes = st.integers(min_value=0, max_value=30)
+valid_consumptions = st.integers(min_value=1, max_value=6)
+
+valid_cars = st.builds(Car, year=valid_years, tank_size=valid_tank_sizes, consumption=valid_consumptions,
+                       technical_inspection=st.booleans())
+valid_bikes = st.builds(Bike, year=valid_years, consumption=valid_consumptions, saddle_comfort=st.booleans())
+valid_vehicles = st.one_of(valid_cars, valid_bikes)
+
+
+def criteria(vehicle):
+    return vehicle.compute_maximal_distance(), vehicle.year, -vehicle.consumption
+
+
+def dominates(vehicle, other) -> bool:
+    better, worse = criteria(vehicle), criteria(other)
+    return all(a >= b for a, b in zip(better, worse)) and better != worse
+
+
+def brute_force_front(vehicles):
+    return [vehicle for vehicle in vehicles if not any(dominates(other, vehicle) for other in vehicles)]
+
+
+class TestSkyline:
+    @given(st.lists(valid_vehicles, max_size=40))
+    def test_front_matches_pairwise_definition(self, vehicles):
+        front = skyline(vehicles)
+        assert sorted(map(id, front)) == sorted(map(id, brute_force_front(vehicles)))
+        keys = [(-d, -y, -c) for d, y, c in map(criteria, front)]
+        assert keys == sorted(keys)
+
+    @settings(max_examples=50)
+    @given(st.lists(valid_vehicles, max_size=40))
+    def test_layers_partition_the_fleet(self, vehicles):
+        remaining = list(vehicles)
+        for layer in skyline_layers(vehicles):
+            assert layer == skyline(remaining)
+            remaining = [vehicle for vehicle in remaining if all(vehicle is not v for v in layer)]
+        assert remaining == []
+
+    @settings(max_examples=50)
+    @given(st.lists(valid_vehicles, max_size=40), st.integers(min_value=1, max_value=8))
+    def test_streaming_is_identical(self, vehicles, chunk_size):
+        accumulator = SkylineAccumulator(chunk_size)
+        accumulator.extend(vehicles)
+        assert accumulator.front() == skyline(vehicles)
+
+    @settings(max_examples=50)
+    @given(st.lists(valid_vehicles, max_size=40), st.one_of(st.none(), st.integers(min_value=1, max_value=3)))
+    def test_columnar_is_identical(self, vehicles, k):
+        fleet = VehicleFleet.from_vehicles(vehicles)
+        position = {id(vehicle): index for index, vehicle in enumerate(vehicles)}
+        expected = [[position[id(vehicle)] for vehicle in layer] for layer in skyline_layers(vehicles, k=k)]
+        assert [layer.tolist() for layer in fleet_skyline_layers(fleet, k=k)] == expected
@@ -0,0 +1,73 @@
+import pytest
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.specs import InternedFleet, VehicleSpec
+from technical_test_fortis.vehicle import find_best_vehicles
+
+
+@pytest.fixture
+def vehicles():
+    return [
+        Car(2005, 50, 5, True),  # 10
+        Bike(2005, 10, False),  # 10
+        Car(2005, 50, 5, True),  # 10, same spec as 0
+        Bike(2005, 1, True),  # 200
+        Car(2015, 60, 6, True),  # 11
+        Bike(2005, 10, False),  # 10, same spec as 1
+        Car(2005, 50, 5, False),  # 0
+    ]
+
+
+class TestVehicleSpec:
+    def test_from_vehicle(self):
+        assert VehicleSpec.from_vehicle(Car(2005, 50, 5, True)) == ('car', 2005, 50, 5, True, False)
+        assert VehicleSpec.from_vehicle(Bike(2005, 3, True)) == ('bike', 2005, 0, 3, False, True)
+        with pytest.raises(TypeError):
+            VehicleSpec.from_vehicle('car')
+
+    def test_vehicle(self):
+        spec = VehicleSpec('car', 2005, 50, 5, True, False)
+        assert str(spec.vehicle()) == str(Car(2005, 50, 5, True))
+        with pytest.raises(AttributeError):
+            spec.year = 2010
+
+
+class TestInternedFleet:
+    def test_interning(self, vehicles, monkeypatch):
+        calls = []
+        original = Car.compute_maximal_distance
+        monkeypatch.setattr(Car, 'compute_maximal_distance', lambda self: calls.append(self) or original(self))
+        fleet = InternedFleet(vehicles)
+        assert len(fleet) == 7
+        assert fleet.distinct_count == 5
+        # One distance computation per distinct car spec.
+        assert len(calls) == 3
+        spec = VehicleSpec.from_vehicle(vehicles[0])
+        assert fleet.add(Car(2005, 50, 5, True)) is fleet.specs()[0]
+        assert fleet.multiplicity(spec) == 3
+        assert fleet.distance(spec) == 10
+        assert fleet.members(spec)[:2] == [vehicles[0], vehicles[2]]
+
+    def test_best(self, vehicles):
+        assert InternedFleet().best() is None
+        assert InternedFleet(vehicles).best() is vehicles[3]
+        assert InternedFleet(vehicles[:3]).best() is vehicles[2]
+
+    def test_top(self, vehicles):
+        fleet = InternedFleet(vehicles)
+        for k in range(1, 9):
+            assert fleet.top(k) == find_best_vehicles(vehicles, k)
+        assert InternedFleet().top(3) == []
+        with pytest.raises(TypeError):
+            fleet.top('1')
+        with pytest.raises(ValueError):
+            fleet.top(0)
+
+    def test_aggregation(self, vehicles):
+        fleet = InternedFleet(vehicles)
+        assert fleet.distance_counts() == {10: 4, 200: 1, 11: 1, 0: 1}
+        assert fleet.total_distance() == 251
+        assert fleet.count_by('type') == {'car': 4, 'bike': 3}
+        assert fleet.count_by('year') == {2005: 6, 2015: 1}
+        with pytest.raises(ValueError):
+            fleet.count_by('colour')
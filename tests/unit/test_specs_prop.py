@@ -0,0 +1,33 @@
+from functools import reduce
+
+from hypothesis import given, strategies as st
+from technical_test_fortis.bike import Bike
+from technical_test_fortis.car import Car
+from technical_test_fortis.specs import InternedFleet
+from technical_test_fortis.vehicle import find_best_vehicle, find_best_vehicles
+
+# Small domains so that identical specs and equal distances are frequent.
+valid_years = st.sampled_from([1995, 2005, 2015])
+valid_tank_sizes = st.integers(min_value=0, max_value=20)
+valid_consumptions = st.integers(min_value=1, max_value=4)
+
+valid_cars = st.builds(Car, year=valid_years, tank_size=valid_tank_sizes, consumption=valid_consumptions,
+                       technical_inspection=st.booleans())
+valid_bikes = st.builds(Bike, year=valid_years, consumption=valid_consumptions, saddle_comfort=st.booleans())
+valid_vehicles = st.one_of(valid_cars, valid_bikes)
+
+
+class TestInternedFleet:
+    @given(st.lists(valid_vehicles, max_size=60), st.integers(min_value=1, max_value=70))
+    def test_ranking_is_identical(self, vehicles, k):
+        fleet = InternedFleet(vehicles)
+        assert fleet.best() is (reduce(find_best_vehicle, vehicles) if vehicles else None)
+        assert fleet.top(k) == find_best_vehicles(vehicles, k)
+
+    @given(st.lists(valid_vehicles, max_size=60))
+    def test_aggregation_is_identical(self, vehicles):
+        fleet = InternedFleet(vehicles)
+        distances = [vehicle.compute_maximal_distance() for vehicle in vehicles]
+        assert fleet.total_distance() == sum(distances)
+        assert sum(fleet.multiplicity(spec) for spec in fleet.specs()) == len(vehicles)
+        assert sorted(fleet.distance_counts().elements()) == sorted(distances)
@@ -1,7 +1,10 @@
 import pytest
 from technical_test_fortis.car import Car
 from technical_test_fortis.bike import Bike
-from technical_test_fortis.vehicle import Vehicle, find_best_vehicle
+from functools import reduce
+from technical_test_fortis.vehicle import (Vehicle, disable_distance_cache, distance_cache_info, enable_distance_cache,
+                                          find_best_vehicle, find_best_vehicles, memoized_distance,
+                                          reset_distance_cache_info)
 
 
 @pytest.fixture
@@ -25,6 +28,12 @@ class TestVehicle:
         with pytest.raises(TypeError):
             Vehicle(2000, 50, 5)
 
+    def test_vehicles_have_no_instance_dict(self, create_car, create_bike):
+        for vehicle in (create_car(2005, 50, 5, True), create_bike(2005, 1, True)):
+            assert not hasattr(vehicle, '__dict__')
+            with pytest.raises(AttributeError):
+                vehicle.color = 'red'
+
 
 class TestFindBestVehicle:
     @pytest.mark.parametrize("vehicle1, vehicle2, expected", [
@@ -64,3 +73,158 @@ class TestFindBestVehicle:
             find_best_vehicle("Not a vehicle", Car(2005, 50, 5, True))
         with pytest.raises(AttributeError):
             find_best_vehicle(Car(2005, 50, 5, True), "Not a vehicle")
+
+
+class TestFindBestVehicles:
+    @pytest.fixture
+    def fleet(self, create_car, create_bike):
+        return [
+            create_car(2005, 50, 5, True),  # 10
+            create_bike(2005, 1, True),  # 200
+            create_car(2015, 50, 5, True),  # 11
+            create_bike(2005, 1, True),  # 200, later than the first 200
+            create_car(2005, 50, 5, False),  # 0
+        ]
+
+    def test_find_best_vehicles_default_k(self, fleet):
+        assert find_best_vehicles(fleet) == [fleet[3]]
+
+    def test_find_best_vehicles_top_k(self, fleet):
+        result = find_best_vehicles(fleet, k=4)
+        assert [vehicle is expected for vehicle, expected in zip(result, [fleet[3], fleet[1], fleet[2], fleet[0]])] \
+            == [True] * 4
+
+    def test_find_best_vehicles_matches_folding(self, fleet):
+        assert find_best_vehicles(fleet)[0] is reduce(find_best_vehicle, fleet)
+
+    def test_find_best_vehicles_generator_and_large_k(self, fleet):
+        result = find_best_vehicles((vehicle for vehicle in fleet), k=10)
+        assert len(result) == len(fleet)
+        assert result[-1] is fleet[4]
+
+    def test_find_best_vehicles_computes_each_distance_once(self, fleet, monkeypatch):
+        calls = []
+        original = Car.compute_maximal_distance
+
+        def counting(self):
+            calls.append(self)
+            return original(self)
+
+        monkeypatch.setattr(Car, "compute_maximal_distance", counting)
+        find_best_vehicles(fleet, k=2)
+        assert len(calls) == 3
+
+    def test_find_best_vehicles_empty(self):
+        assert find_best_vehicles([]) == []
+
+    @pytest.mark.parametrize("k, expected_exception", [
+        (0, ValueError),
+        (-1, ValueError),
+        (1.5, TypeError),
+    ])
+    def test_find_best_vehicles_invalid_k(self, fleet, k, expected_exception):
+        with pytest.raises(expected_exception):
+            find_best_vehicles(fleet, k=k)
+
+
+class TestDistanceCache:
+    @pytest.fixture
+    def distance_cache(self):
+        reset_distance_cache_info()
+        enable_distance_cache()
+        yield
+        disable_distance_cache()
+        reset_distance_cache_info()
+
+    def test_distance_cache_disabled_by_default(self, create_car):
+        reset_distance_cache_info()
+        car = create_car(2005, 50, 5, True)
+        car.compute_maximal_distance()
+        car.compute_maximal_distance()
+        assert distance_cache_info() == (0, 0, False)
+
+    def test_disabled_cache_leaves_the_methods_unwrapped(self):
+        assert not hasattr(Car.compute_maximal_distance, '__wrapped__')
+        enable_distance_cache()
+        try:
+            assert Car.compute_maximal_distance.__wrapped__.rules is Car.DISTANCE_RULES
+            assert Bike.compute_maximal_distance.__wrapped__.rules is Bike.DISTANCE_RULES
+        finally:
+            disable_distance_cache()
+        assert Car.compute_maximal_distance.rules is Car.DISTANCE_RULES
+        assert not hasattr(Bike.compute_maximal_distance, '__wrapped__')
+
+    def test_vehicle_type_defined_while_enabled(self, distance_cache):
+        class Scooter(Vehicle):
+            __slots__ = ()
+            compute_maximal_distance = memoized_distance(lambda self: self.tank_size)
+
+        scooter = Scooter(2005, 50, 5)
+        assert [scooter.compute_maximal_distance() for _ in range(2)] == [50, 50]
+        assert distance_cache_info() == (1, 1, True)
+
+    def test_distance_cache_hits_and_misses(self, distance_cache, create_car, create_bike):
+        car = create_car(2005, 50, 5, True)
+        bike = create_bike(2005, 1, True)
+        assert [car.compute_maximal_distance() for _ in range(3)] == [10, 10, 10]
+        assert [bike.compute_maximal_distance() for _ in range(2)] == [200, 200]
+        assert distance_cache_info() == (3, 2, True)
+
+    def test_distance_cache_keeps_zero_distances(self, distance_cache, create_car):
+        car = create_car(2005, 50, 5, False)
+        car.compute_maximal_distance()
+        car.compute_maximal_distance()
+        assert distance_cache_info().hits == 1
+
+    @pytest.mark.parametrize("attribute, value, expected_distance", [
+        ('year', 2015, 11),
+        ('tank_size', 100, 20),
+        ('consumption', 10, 5),
+        ('technical_inspection', False, 0),
+    ])
+    def test_car_assignment_invalidates_cache(self, distance_cache, create_car, attribute, value,
+                                              expected_distance):
+        car = create_car(2005, 50, 5, True)
+        assert car.compute_maximal_distance() == 10
+        setattr(car, attribute, value)
+        assert car.compute_maximal_distance() == expected_distance
+        assert distance_cache_info().misses == 2
+
+    @pytest.mark.parametrize("attribute, value, expected_distance", [
+        ('consumption', 2, 100),
+        ('saddle_comfort', False, 100),
+    ])
+    def test_bike_assignment_invalidates_cache(self, distance_cache, create_bike, attribute, value,
+                                               expected_distance):
+        bike = create_bike(2005, 1, True)
+        assert bike.compute_maximal_distance() == 200
+        setattr(bike, attribute, value)
+        assert bike.compute_maximal_distance() == expected_distance
+
+    def test_cache_invalidated_while_disabled(self, distance_cache, create_car):
+        car = create_car(2005, 50, 5, True)
+        car.compute_maximal_distance()
+        disable_distance_cache()
+        car.technical_inspection = False
+        enable_distance_cache()
+        assert car.compute_maximal_distance() == 0
+
+    @pytest.mark.parametrize("attribute, value, expected_exception", [
+        ('year', -2000, ValueError),
+        ('year', '2000', TypeError),
+        ('tank_size', -1, ValueError),
+        ('consumption', 0, ValueError),
+        ('consumption', 1.5, TypeError),
+        ('technical_inspection', "Yes", ValueError),
+    ])
+    def test_car_assignment_is_validated(self, create_car, attribute, value, expected_exception):
+        car = create_car(2005, 50, 5, True)
+        with pytest.raises(expected_exception):
+            setattr(car, attribute, value)
+        assert str(car) == "Car(year=2005, tank_size=50, consumption=5, technical_inspection=True)"
+
+    def test_bike_assignment_is_validated(self, create_bike):
+        bike = create_bike(2005, 1, True)
+        with pytest.raises(TypeError):
+            bike.saddle_comfort = 1
+        assert bike.saddle_comfort is True
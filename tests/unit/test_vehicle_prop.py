@@ -2,7 +2,8 @@ import pytest
 from hypothesis import given, strategies as st
 from technical_test_fortis.car import Car
 from technical_test_fortis.bike import Bike
-from technical_test_fortis.vehicle import Vehicle, find_best_vehicle
+from functools import reduce
+from technical_test_fortis.vehicle import Vehicle, find_best_vehicle, find_best_vehicles
 
 # Define strategies for valid inputs
 valid_years = st.integers(min_value=1800, max_value=2100)
@@ -111,4 +112,21 @@ class TestFindBestVehicle:
         with pytest.raises(AttributeError):
             find_best_vehicle(invalid_input, valid_car)
         with pytest.raises(AttributeError):
-            find_best_vehicle(valid_car, invalid_input)
\ No newline at end of file
+            find_best_vehicle(valid_car, invalid_input)
+
+
+class TestFindBestVehicles:
+    @given(st.lists(valid_vehicles, min_size=1, max_size=30))
+    def test_find_best_vehicles_matches_folding(self, vehicles):
+        """Test that the best vehicle is the one obtained by folding with find_best_vehicle."""
+        assert find_best_vehicles(vehicles)[0] is reduce(find_best_vehicle, vehicles)
+
+    @given(st.lists(valid_vehicles, max_size=30), st.integers(min_value=1, max_value=40))
+    def test_find_best_vehicles_matches_sorting(self, vehicles, k):
+        """Test that the top-k is the prefix of a stable ranking where later vehicles win ties."""
+        ranked = sorted(enumerate(vehicles), key=lambda item: (item[1].compute_maximal_distance(), item[0]),
+                        reverse=True)
+        expected = [vehicle for _, vehicle in ranked[:k]]
+        result = find_best_vehicles(iter(vehicles), k=k)
+        assert len(result) == len(expected)
+        assert all(vehicle is other for vehicle, other in zip(result, expected))